@@ -68,6 +68,12 @@ class Archive(Mesh):
     name : str, optional
         Internally used parameter used to have a custom ``__repr__``.
 
+    max_workers : int, optional
+        Maximum number of threads used to parse the node and element
+        blocks.  When not one, the blocks are split into chunks of
+        lines that are parsed concurrently.  ``None`` uses the number
+        of processors.  Defaults to ``1``.
+
     Examples
     --------
     >>> import pyansys
@@ -107,13 +113,13 @@ class Archive(Mesh):
     def __init__(self, filename, read_parameters=False,
                  parse_vtk=True, force_linear=False,
                  allowable_types=None, null_unallowed=False,
-                 verbose=False, name=''):
+                 verbose=False, name='', max_workers=1):
         """Initializes an instance of the archive class."""
         self._read_parameters = read_parameters
         self._filename = filename
         self._name = name
         self._raw = _reader.read(filename, read_parameters=read_parameters,
-                                 debug=verbose)
+                                 debug=verbose, max_workers=max_workers)
         super().__init__(self._raw['nnum'],
                          self._raw['nodes'],
                          self._raw['elem'],
@@ -1,7 +1,9 @@
 """Methods common to binary files"""
 import struct
 import os
+import time
 from collections import Counter
+from functools import wraps
 
 import numpy as np
 import pyvista as pv
@@ -63,10 +65,214 @@ ANSYS_BINARY_FILE_TYPES = {2: 'Element Matrix File',
 # c     ASI  ->    ASIRSTNM     FUN66        9      asi results
 
 
+# placeholder for instance attributes that do not exist
+_MISSING = object()
+
+
+class ReaderStats():
+    """I/O and timing statistics of an ANSYS binary file.
+
+    Created with ``AnsysBinary.profile``.  Statistics are collected
+    between ``start`` and ``stop`` or within a ``with`` block.
+
+    I/O counters are shared by all binary files and threads of this
+    process, so reads of other files during profiling are included.
+
+    Attributes
+    ----------
+    records : int
+        Number of records read.
+
+    bytes_read : int
+        Number of bytes read from disk.
+
+    compressed_records : int
+        Number of compressed (sparse) records read.
+
+    raw_records : int
+        Number of uncompressed records read.
+
+    seeks : int
+        Number of seeks to a record.
+
+    wall_time : float
+        Seconds elapsed while profiling.
+
+    method_time : dict
+        Cumulative wall time in seconds of each public method called.
+        Time of nested calls to other public methods is included in
+        the time of the calling method.
+
+    method_calls : dict
+        Number of calls of each public method.
+
+    Examples
+    --------
+    >>> import pyansys
+    >>> rst = pyansys.read_binary('file.rst')
+    >>> with rst.profile() as stats:
+    ...     rst.element_stress(0)
+    >>> stats.records
+    1402
+    >>> stats.method_time
+    {'element_stress': 0.010526}
+    """
+
+    def __init__(self, binary_file):
+        self._binary_file = binary_file
+        self._io_start = None
+        self._tstart = None
+        self._wrapped = []
+        self.reset()
+
+    def reset(self):
+        """Reset all statistics"""
+        self.records = 0
+        self.bytes_read = 0
+        self.compressed_records = 0
+        self.raw_records = 0
+        self.seeks = 0
+        self.wall_time = 0.0
+        self.method_time = {}
+        self.method_calls = {}
+
+    @property
+    def active(self):
+        """True when collecting statistics"""
+        return self._tstart is not None
+
+    def start(self):
+        """Start collecting statistics"""
+        if self.active:
+            return
+        self._instrument()
+        _binary_reader.enable_io_stats(True)
+        self._io_start = _binary_reader.get_io_stats()
+        self._tstart = time.perf_counter()
+
+    def stop(self):
+        """Stop collecting statistics"""
+        if not self.active:
+            return
+        self.wall_time += time.perf_counter() - self._tstart
+        counters = _binary_reader.get_io_stats() - self._io_start
+        _binary_reader.enable_io_stats(False)
+        self._tstart = None
+
+        self.records += int(counters[0])
+        self.bytes_read += int(counters[1])
+        self.compressed_records += int(counters[2])
+        self.raw_records += int(counters[3])
+        self.seeks += int(counters[4])
+
+        # restore the instance attributes replaced by the wrappers
+        for name, previous in self._wrapped:
+            if previous is _MISSING:
+                delattr(self._binary_file, name)
+            else:
+                setattr(self._binary_file, name, previous)
+        self._wrapped = []
+
+    def _instrument(self):
+        """Time the public methods of the binary file"""
+        cls = type(self._binary_file)
+        for name in dir(cls):
+            if name.startswith('_') or name == 'profile':
+                continue
+            if not callable(getattr(cls, name)):  # skip properties
+                continue
+            previous = vars(self._binary_file).get(name, _MISSING)
+            method = getattr(self._binary_file, name)
+            setattr(self._binary_file, name, self._timed(name, method))
+            self._wrapped.append((name, previous))
+
+    def _timed(self, name, method):
+        """Wrap a method to record its wall time"""
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            tstart = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                telap = time.perf_counter() - tstart
+                self.method_time[name] = self.method_time.get(name, 0) + telap
+                self.method_calls[name] = self.method_calls.get(name, 0) + 1
+
+        return wrapper
+
+    def as_dict(self):
+        """Return the statistics as a dictionary"""
+        return {'records': self.records,
+                'bytes_read': self.bytes_read,
+                'compressed_records': self.compressed_records,
+                'raw_records': self.raw_records,
+                'seeks': self.seeks,
+                'wall_time': self.wall_time,
+                'method_time': dict(self.method_time),
+                'method_calls': dict(self.method_calls)}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def __repr__(self):
+        lines = ['ANSYS Binary Reader Statistics',
+                 '  Records read:         %d' % self.records,
+                 '    Compressed:         %d' % self.compressed_records,
+                 '    Raw:                %d' % self.raw_records,
+                 '  Bytes read:           %d' % self.bytes_read,
+                 '  Seeks:                %d' % self.seeks,
+                 '  Wall time:            %.6f s' % self.wall_time]
+        if self.method_time:
+            lines.append('  Method                 Calls   Time (s)')
+            for name, telap in sorted(self.method_time.items(),
+                                      key=lambda item: -item[1]):
+                lines.append('    %-20s %7d %10.6f' % (name,
+                                                       self.method_calls[name],
+                                                       telap))
+        return '\n'.join(lines)
+
+
 class AnsysBinary():
     """ANSYS binary file class"""
     filename = None
 
+    def profile(self):
+        """Collect I/O and timing statistics of this file.
+
+        Counts the records, bytes, compressed and raw records, and
+        seeks read by the binary readers along with the wall time of
+        each public method.  Instrumentation is disabled by default
+        and has no overhead unless profiling.
+
+        Returns
+        -------
+        stats : pyansys.common.ReaderStats
+            Statistics object.  Use as a context manager or call
+            ``stats.start()`` and ``stats.stop()``.
+
+        Examples
+        --------
+        >>> import pyansys
+        >>> rst = pyansys.read_binary('file.rst')
+        >>> with rst.profile() as stats:
+        ...     nnum, stress = rst.nodal_stress(0)
+        >>> print(stats)
+        ANSYS Binary Reader Statistics
+          Records read:         498
+            Compressed:         0
+            Raw:                498
+          Bytes read:           144320
+          Seeks:                434
+          Wall time:            0.000979 s
+          Method                 Calls   Time (s)
+            nodal_stress               1   0.000951
+        """
+        return ReaderStats(self)
+
     def read_record(self, pointer, return_bufsize=False):
         """Reads a record at a given position.
 
@@ -96,6 +302,52 @@ class AnsysBinary():
         """
         return c_read_record(self.filename, pointer, return_bufsize)
 
+    def _read_record_slice(self, pointer, start, stop):
+        """Reads the entries ``start:stop`` of a record.
+
+        Only the requested entries of an uncompressed record are read
+        from disk.  Compressed records are read entirely and sliced.
+
+        Parameters
+        ----------
+        pointer : int
+            ANSYS file position (n words from start of file).
+
+        start : int
+            First entry to read.
+
+        stop : int
+            Entry to stop reading at.
+
+        Returns
+        -------
+        record : np.ndarray
+            Entries ``start:stop`` of the record.
+        """
+        with open(self.filename, 'rb') as f:
+            f.seek(pointer*4)
+            raw = np.fromfile(f, np.uint8, 8)
+            flags = raw[7]
+
+            # bsparse, wsparse, or zlib compressed
+            if flags & 0b111000:
+                return self.read_record(pointer)[start:stop]
+
+            if flags >> 7 & 1:
+                dtype = np.int16 if flags >> 6 & 1 else np.int32
+            else:
+                dtype = np.float32 if flags >> 6 & 1 else np.float64
+            dtype = np.dtype(dtype)
+
+            size = raw[:4].view(np.int32)[0]*4 // dtype.itemsize
+            stop = min(stop, size)
+            start = min(start, stop)
+            f.seek(pointer*4 + 8 + start*dtype.itemsize)
+            record = np.fromfile(f, dtype, stop - start)
+
+        _binary_reader.add_io_stats(1, record.nbytes + 8, 0, 1, 2)
+        return record
+
 
 def read_binary(filename, **kwargs):
     """Reads ANSYS-written binary files:
@@ -227,6 +479,7 @@ def read_table(f, dtype='i', nread=None, skip=False, get_nread=True, cython=Fals
             tablesize //= 2
         table = np.fromfile(f, dtype, tablesize)
     f.seek(4, 1)  # skip padding
+    _binary_reader.add_io_stats(1, table.nbytes + 8, 0, 1, 0)
     return table
 
 
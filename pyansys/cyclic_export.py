@@ -0,0 +1,236 @@
+"""Stream full rotor cyclic results to a chunked on-disk store.
+
+Results are expanded and written one sector at a time, so the memory
+required is bounded by the size of a single sector result regardless
+of the number of sectors or results.  The full rotor mesh is written
+once alongside the results.
+
+Supported stores are selected by the extension of the filename:
+
+- ``.h5`` or ``.hdf5`` : HDF5 file.  Requires ``h5py``.
+- ``.zarr`` : Zarr directory store.  Requires ``zarr``.
+- Any other name : directory of memory mapped ``.npy`` files.
+
+Layout of the store::
+
+    mesh/points      (n_sector, npoints, 3)
+    mesh/cells       (n_sector, ncells_legacy)
+    mesh/celltypes   (n_sector, ncells)
+    nnum             (nnode,)
+    rnums            (nresults,)
+    time_values      (nresults,)
+    hindex           (nresults,)  modal analyses only
+    <method>         (nresults, n_sector, nnode, ncomp)
+
+"""
+import os
+
+import numpy as np
+import pyvista as pv
+
+from pyansys import _binary_reader
+from pyansys.misc import VTK9, tile_cells
+
+
+class _NpyStore():
+    """Directory of memory mapped ``.npy`` files"""
+
+    def __init__(self, filename, mode='r'):
+        self._filename = filename
+        self._arrays = []
+        if mode == 'w':
+            os.makedirs(os.path.join(filename, 'mesh'), exist_ok=True)
+        elif not os.path.isdir(filename):
+            raise FileNotFoundError('Full rotor store "%s" not found' %
+                                    filename)
+
+    def _path(self, name):
+        return os.path.join(self._filename, *name.split('/')) + '.npy'
+
+    def create(self, name, shape, dtype, chunks):
+        array = np.lib.format.open_memmap(self._path(name), 'w+', dtype,
+                                          shape)
+        self._arrays.append(array)
+        return array
+
+    def write(self, name, array):
+        np.save(self._path(name), array)
+
+    def read(self, name):
+        return np.load(self._path(name), mmap_mode='r')
+
+    def close(self):
+        for array in self._arrays:
+            array.flush()
+        self._arrays = []
+
+
+class _Hdf5Store():
+    """HDF5 file store"""
+
+    def __init__(self, filename, mode='r'):
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError('Writing full rotor results to HDF5 requires '
+                              'h5py.  Install with:\npip install h5py')
+        self._file = h5py.File(filename, mode)
+
+    def create(self, name, shape, dtype, chunks):
+        return self._file.create_dataset(name, shape, dtype, chunks=chunks)
+
+    def write(self, name, array):
+        self._file.create_dataset(name, data=array)
+
+    def read(self, name):
+        return self._file[name]
+
+    def close(self):
+        self._file.close()
+
+
+class _ZarrStore():
+    """Zarr directory store"""
+
+    def __init__(self, filename, mode='r'):
+        try:
+            import zarr
+        except ImportError:
+            raise ImportError('Writing full rotor results to Zarr requires '
+                              'zarr.  Install with:\npip install zarr')
+        self._group = zarr.open_group(filename, mode)
+
+    def create(self, name, shape, dtype, chunks):
+        return self._group.create_dataset(name, shape=shape, dtype=dtype,
+                                          chunks=chunks)
+
+    def write(self, name, array):
+        self._group.create_dataset(name, data=array)
+
+    def read(self, name):
+        return self._group[name]
+
+    def close(self):
+        pass
+
+
+def _open_store(filename, mode='r'):
+    """Open the store matching the extension of ``filename``"""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext in ['.h5', '.hdf5']:
+        return _Hdf5Store(filename, mode)
+    elif ext == '.zarr':
+        return _ZarrStore(filename, mode)
+    return _NpyStore(filename, mode)
+
+
+def _write_mesh(store, rst):
+    """Write the full rotor mesh of a cyclic result one sector at a time"""
+    grid = rst._mas_grid
+    npts = grid.n_points
+    n_sector = rst.n_sector
+    matrices = rst._sector_matrices()
+    cells = grid.cells
+
+    points = store.create('mesh/points', (n_sector, npts, 3), np.float64,
+                          (1, npts, 3))
+    full_cells = store.create('mesh/cells', (n_sector, cells.size),
+                              cells.dtype, (1, cells.size))
+    celltypes = store.create('mesh/celltypes', (n_sector, grid.n_cells),
+                             grid.celltypes.dtype, (1, grid.n_cells))
+
+    sector_points = np.empty((1, npts, 3))
+    for k in range(n_sector):
+        sector_points[0] = grid.points
+        _binary_reader.rotate_sectors(sector_points, matrices[k:k + 1], 0)
+        points[k] = sector_points[0]
+
+        full_cells[k] = tile_cells(grid, [k])[0][0]
+        celltypes[k] = grid.celltypes
+
+
+def export_full_rotor(rst, filename, rnums=None, methods=('nodal_solution',),
+                      phase=0, as_complex=False):
+    """Stream full rotor results of a cyclic result to disk.
+
+    See ``CyclicResult.export_full_rotor``.
+    """
+    if isinstance(methods, str):
+        methods = [methods]
+    methods = list(methods)
+    if not methods:
+        raise ValueError('No methods to export')
+    if rnums is None:
+        rnums = range(rst.nsets)
+    rnums = [rst.parse_step_substep(rnum) for rnum in rnums]
+    if not rnums:
+        raise ValueError('No results to export')
+
+    store = _open_store(filename, 'w')
+    try:
+        _write_mesh(store, rst)
+        store.write('rnums', np.array(rnums))
+        store.write('time_values', rst.time_values[rnums])
+        if rst._resultheader['kan'] == 2:
+            store.write('hindex', rst._resultheader['hindex'][rnums])
+
+        nnum = None
+        for method in methods:
+            dataset = None
+            for i, nnum, expanded in rst._iter_full_rotor_results(rnums, method,
+                                                                  phase,
+                                                                  as_complex):
+                if dataset is None:
+                    _, nnode, ncomp = expanded.shape
+                    shape = (len(rnums), rst.n_sector, nnode, ncomp)
+                    dataset = store.create(method, shape, expanded.dtype,
+                                           (1, 1, nnode, ncomp))
+
+                for k in range(rst.n_sector):
+                    dataset[i, k] = expanded.sector_result(k)
+
+        store.write('nnum', nnum)
+    finally:
+        store.close()
+
+
+def read_full_rotor_mesh(filename):
+    """Read the full rotor mesh written by ``export_full_rotor``.
+
+    Parameters
+    ----------
+    filename : str
+        Filename of the store.
+
+    Returns
+    -------
+    grid : pyvista.UnstructuredGrid
+        Full rotor grid.  Points are ordered by sector, matching the
+        flattened ``(n_sector*nnode, ncomp)`` results of the store.
+
+    Examples
+    --------
+    >>> from pyansys.cyclic_export import read_full_rotor_mesh
+    >>> grid = read_full_rotor_mesh('rotor_results')
+    """
+    store = _open_store(filename)
+    try:
+        points = np.asarray(store.read('mesh/points')).reshape(-1, 3)
+        cells = np.asarray(store.read('mesh/cells'))
+        celltypes = np.asarray(store.read('mesh/celltypes')).ravel()
+    finally:
+        store.close()
+
+    if VTK9:
+        return pv.UnstructuredGrid(cells.ravel(), celltypes, points)
+
+    # cell offsets of the legacy cell array of each sector
+    n_sector, sector_size = cells.shape
+    ncells = celltypes.size // n_sector
+    offset = np.empty(ncells, cells.dtype)
+    loc = 0
+    for i in range(ncells):
+        offset[i] = loc
+        loc += cells[0, loc] + 1
+    offset = offset + np.arange(n_sector).reshape(-1, 1)*sector_size
+    return pv.UnstructuredGrid(offset.ravel(), cells.ravel(), celltypes, points)
@@ -1,7 +1,9 @@
 """Supports reading cyclic structural result files from ANSYS"""
+from collections import OrderedDict
 from functools import wraps
+import os
 
-from vtk import vtkMatrix4x4, vtkTransform, vtkAppendFilter
+from vtk import vtkMatrix4x4, vtkTransform
 import numpy as np
 from pyvista.core.common import axis_rotation
 import pyvista as pv
@@ -10,11 +12,19 @@ from pyansys.common import (STRESS_TYPES, STRAIN_TYPES,
                             PRINCIPAL_STRESS_TYPES,
                             THERMAL_STRAIN_TYPES)
 from pyansys.rst import Result, check_comp
+from pyansys.cyclic_view import FullRotorResult, PhaseAnimation
+from pyansys.cyclic_export import export_full_rotor
+from pyansys.misc import VTK9, tile_cells
 from pyansys import _binary_reader
 
 np.seterr(divide='ignore', invalid='ignore')
 
 
+def _tile(array, reps):
+    """Repeat an array ``reps`` times along its first axis"""
+    return np.tile(array, (reps,) + (1,)*(array.ndim - 1))
+
+
 class CyclicResult(Result):
     """Adds cyclic functionality to the result class"""
 
@@ -102,8 +112,10 @@ class CyclicResult(Result):
         self._mas_ind = np.nonzero(node_mask)[0]
         self._dup_ind = np.nonzero(~node_mask)[0]
         self._has_duplicate_sector = np.any(self._dup_ind)
+        self._add_repeated_modes()
 
-        # determine repeated modes
+    def _add_repeated_modes(self):
+        """Identify the repeated modes from the time values"""
         mask_a = np.isclose(self.time_values, np.roll(self.time_values, 1))
         mask_b = np.isclose(self.time_values, np.roll(self.time_values, -1))
         self._is_repeated_mode = np.logical_or(mask_a, mask_b)
@@ -122,7 +134,24 @@ class CyclicResult(Result):
             self._repeated_index[mask_a] = np.nonzero(mask_b)[0]
             self._repeated_index[mask_b] = np.nonzero(mask_a)[0]
 
-    def nodal_solution(self, rnum, phase=0, full_rotor=False, as_complex=False):
+    def refresh(self):
+        """Read any result sets appended since the result was loaded.
+
+        The repeated modes are identified again across all result
+        sets.  See ``Result.refresh``.
+
+        Returns
+        -------
+        rnums : list
+            Cumulative indices of the new result sets.
+        """
+        rnums = super().refresh()
+        if rnums:
+            self._add_repeated_modes()
+        return rnums
+
+    def nodal_solution(self, rnum, phase=0, full_rotor=False, as_complex=False,
+                       sectors=None, nodes=None):
         """Returns the DOF solution for each node in the global
         cartesian coordinate system.
 
@@ -144,6 +173,15 @@ class CyclicResult(Result):
             Returns result as a complex number, otherwise as the real
             part rotated by phase.  Default False.
 
+        sectors : int or sequence, optional
+            Zero based indices of the sectors to expand when
+            ``full_rotor`` is True.  Only these sectors are computed
+            and the first axis of the result matches this sequence.
+
+        nodes : sequence, optional
+            Node numbers of the master sector to return.  When
+            ``full_rotor`` is True, only these nodes are expanded.
+
         Returns
         -------
         nnum : numpy.ndarray
@@ -167,6 +205,12 @@ class CyclicResult(Result):
 
         >>> result.nodal_solution(2)
 
+        Expand only the first and fifth sectors at two nodes
+
+        >>> nnum, disp = result.nodal_solution(2, full_rotor=True,
+        ...                                    sectors=[0, 4],
+        ...                                    nodes=[1, 2])
+
         Notes
         -----
         Somewhere between v15.0 and v18.2 ANSYS stopped writing the
@@ -177,7 +221,7 @@ class CyclicResult(Result):
 
         func = super().nodal_solution
         return self._get_full_result(rnum, func, phase, full_rotor, as_complex,
-                                     tensor=False)
+                                     tensor=False, sectors=sectors, nodes=nodes)
 
     @wraps(nodal_solution)
     def nodal_displacement(self, *args, **kwargs):
@@ -186,42 +230,15 @@ class CyclicResult(Result):
 
     def _expand_cyclic_static(self, result, tensor=False, stress=True):
         """Expand cyclic static result for a full rotor"""
-        cs_cord = self._resultheader['csCord']
-        if cs_cord > 1:
-            matrix = self.cs_4x4(cs_cord, as_vtk_matrix=True)
-            i_matrix = self.cs_4x4(cs_cord, as_vtk_matrix=True)
-            i_matrix.Invert()
-        else:
-            matrix = vtkMatrix4x4()
-            i_matrix = vtkMatrix4x4()
-
         shp = (self.n_sector, result.shape[0], result.shape[1])
         full_result = np.empty(shp)
         full_result[:] = result
 
-        rang = 360.0 / self.n_sector
-        for i in range(1, self.n_sector):
-            # transform to standard position, rotate about Z axis,
-            # transform back
-            transform = vtkTransform()
-            transform.RotateZ(rang*i)
-            transform.Update()
-            rot_matrix = transform.GetMatrix()
-
-            if cs_cord > 1:
-                temp_matrix = vtkMatrix4x4()
-                rot_matrix.Multiply4x4(i_matrix, rot_matrix, temp_matrix)
-                rot_matrix.Multiply4x4(temp_matrix, matrix, rot_matrix)
-
-            trans = pv.trans_from_matrix(rot_matrix)
-            if tensor:
-                if stress:
-                    _binary_reader.tensor_arbitrary(full_result[i], trans)
-                else:
-                    _binary_reader.tensor_strain_arbitrary(full_result[i], trans)
-            else:
-                _binary_reader.affline_transform(full_result[i], trans)
-
+        if tensor:
+            kind = 1 if stress else 2
+        else:
+            kind = 0
+        _binary_reader.rotate_sectors(full_result, self._sector_matrices(), kind)
         return full_result
 
     def _expand_cyclic_modal(self, result, result_r, hindex, phase, as_complex,
@@ -316,35 +333,8 @@ class CyclicResult(Result):
         full_result = np.empty(shp)
         full_result[:] = np.real(result_expanded*cjang.reshape(-1, 1, 1))
 
-        cs_cord = self._resultheader['csCord']
-        if cs_cord > 1:
-            matrix = self.cs_4x4(cs_cord, as_vtk_matrix=True)
-            i_matrix = self.cs_4x4(cs_cord, as_vtk_matrix=True)
-            i_matrix.Invert()
-        else:
-            matrix = vtkMatrix4x4()
-            i_matrix = vtkMatrix4x4()
-
-        rang = 360.0 / self.n_sector
-        for i in range(1, self.n_sector):
-            # transform to standard position, rotate about Z axis,
-            # transform back
-            transform = vtkTransform()
-            transform.RotateZ(rang*i)
-            transform.Update()
-            rot_matrix = transform.GetMatrix()
-
-            if cs_cord > 1:
-                temp_matrix = vtkMatrix4x4()
-                rot_matrix.Multiply4x4(i_matrix, rot_matrix, temp_matrix)
-                rot_matrix.Multiply4x4(temp_matrix, matrix, rot_matrix)
-
-            trans = pv.trans_from_matrix(rot_matrix)
-            if stress:
-                _binary_reader.tensor_arbitrary(full_result[i], trans)
-            else:
-                _binary_reader.tensor_strain_arbitrary(full_result[i], trans)
-
+        kind = 1 if stress else 2
+        _binary_reader.rotate_sectors(full_result, self._sector_matrices(), kind)
         return full_result
 
     def harmonic_index_to_cumulative(self, hindex, mode):
@@ -424,7 +414,8 @@ class CyclicResult(Result):
         """
         return self._resultheader['hindex']
 
-    def nodal_stress(self, rnum, phase=0, as_complex=False, full_rotor=False):
+    def nodal_stress(self, rnum, phase=0, as_complex=False, full_rotor=False,
+                     sectors=None, nodes=None):
         """Retrieves the component stresses for each node in the
         solution.
 
@@ -455,6 +446,15 @@ class CyclicResult(Result):
             Expands the results to the full rotor when True.  Default
             False.
 
+        sectors : int or sequence, optional
+            Zero based indices of the sectors to expand when
+            ``full_rotor`` is True.  Only these sectors are computed
+            and the first axis of the result matches this sequence.
+
+        nodes : sequence, optional
+            Node numbers of the master sector to return.  When
+            ``full_rotor`` is True, only these nodes are expanded.
+
         Returns
         -------
         nodenum : numpy.ndarray
@@ -478,10 +478,11 @@ class CyclicResult(Result):
         """
         func = super().nodal_stress
         return self._get_full_result(rnum, func, phase, full_rotor, as_complex,
-                                     tensor=True, stress=True)
+                                     tensor=True, stress=True,
+                                     sectors=sectors, nodes=nodes)
 
     def _get_full_result(self, rnum, func, phase, full_rotor, as_complex,
-                         tensor=True, stress=False):
+                         tensor=True, stress=False, sectors=None, nodes=None):
         """Return the full rotor result or the complex result for a cyclic model.
 
         rnum : int or list
@@ -499,18 +500,48 @@ class CyclicResult(Result):
             True when tensor is a stress.  False when tensor is a
             strain.  Ignored when not a tensor.
 
+        sectors : int or sequence, optional
+            Sectors to expand.  Requires ``full_rotor``.
+
+        nodes : sequence, optional
+            Node numbers of the master sector to return.
+
         """
         rnum = self.parse_step_substep(rnum)
-        nnum, full_result = func(rnum)
+        if sectors is not None and not full_rotor:
+            raise ValueError('``sectors`` requires ``full_rotor=True``')
 
-        # full result may or may not contain the duplicate sector
-        if self._has_duplicate_sector:
-            result = full_result[self._mas_ind]
-            nnum = nnum[self._mas_ind]
-        else:
-            result = full_result
+        if full_rotor and (sectors is not None or nodes is not None):
+            # expand only the requested sectors and nodes
+            if tensor:
+                if as_complex:
+                    raise ValueError('``as_complex`` is not supported for '
+                                     'tensor results when expanding a '
+                                     'subset of sectors or nodes')
+                kind = 'stress' if stress else 'strain'
+            else:
+                kind = 'vector'
+            nnum, expanded = self._full_rotor_result(func, kind, rnum, phase,
+                                                     as_complex)
+            node_ind = self._node_subset(nnum, nodes)
+            if sectors is None:
+                sectors = np.arange(self.n_sector)
+            sectors = np.atleast_1d(np.arange(self.n_sector)[sectors])
+            result = expanded.sector_result(sectors, node_ind)
+            if node_ind is not None:
+                nnum = nnum[node_ind]
+            return nnum, result
+
+        nnum, result = self._master_result(func, rnum)
+
+        # master sector only: combine just the requested nodes
+        node_ind = self._node_subset(nnum, nodes)
+        if node_ind is not None:
+            nnum = nnum[node_ind]
 
         if self._resultheader['kan'] == 0:  # static result
+            if node_ind is not None:
+                result = result[node_ind]
             if full_rotor:
                 expanded_result = self._expand_cyclic_static(result,
                                                              tensor=tensor,
@@ -522,6 +553,8 @@ class CyclicResult(Result):
             hindex_table = self._resultheader['hindex']
             hindex = hindex_table[rnum]  # move this to expand_modal_tensor
             result_r = self._get_complex_result(func, rnum, result)
+            if node_ind is not None:
+                result, result_r = result[node_ind], result_r[node_ind]
             if tensor:
                 expanded_result = self._expand_cyclic_modal_tensor(result,
                                                                    result_r,
@@ -543,6 +576,361 @@ class CyclicResult(Result):
 
         return nnum, expanded_result
 
+    def _node_subset(self, nnum, nodes):
+        """Indices of the node numbers ``nodes`` within ``nnum``"""
+        if nodes is None:
+            return None
+        nodes = np.asarray(nodes).ravel()
+        mask = np.in1d(nnum, nodes)
+        if mask.sum() != np.unique(nodes).size:
+            missing = np.setdiff1d(nodes, nnum)
+            raise ValueError('Nodes %s are not in the master sector' % missing)
+        return np.nonzero(mask)[0]
+
+    def _master_result(self, func, rnum):
+        """Return the node numbers and result of the master sector"""
+        nnum, full_result = func(rnum)
+
+        # full result may or may not contain the duplicate sector
+        if self._has_duplicate_sector:
+            return nnum[self._mas_ind], full_result[self._mas_ind]
+        return nnum, full_result
+
+    def _sector_matrices(self, offset=0, cyclic_cs=True):
+        """Stacked 4x4 matrices transforming the master sector to each sector.
+
+        Parameters
+        ----------
+        offset : float, optional
+            Angle in radians added to the rotation of every sector.
+
+        cyclic_cs : bool, optional
+            Rotate about the Z axis of the cyclic coordinate system.
+            Otherwise, rotate about the global Z axis.
+
+        Returns
+        -------
+        matrices : np.ndarray
+            ``(n_sector, 4, 4)`` array of transformation matrices.
+        """
+        angles = 2*np.pi*np.arange(self.n_sector)/self.n_sector + offset
+        matrices = np.zeros((self.n_sector, 4, 4))
+        matrices[:, 0, 0] = np.cos(angles)
+        matrices[:, 0, 1] = -np.sin(angles)
+        matrices[:, 1, 0] = np.sin(angles)
+        matrices[:, 1, 1] = np.cos(angles)
+        matrices[:, 2, 2] = 1
+        matrices[:, 3, 3] = 1
+
+        cs_cord = self._resultheader['csCord']
+        if cyclic_cs and cs_cord > 1:
+            # transform to standard position, rotate about Z axis,
+            # transform back
+            matrix = self.cs_4x4(cs_cord)
+            matrices = np.linalg.inv(matrix) @ matrices @ matrix
+
+        return matrices
+
+    def _phase_factors(self, hindex, phase=0):
+        """Complex factor scaling the combined modal result of each sector.
+
+        Includes the phase shift between sectors of the harmonic
+        index, the ANSYS expansion scaling, and the phase adjustment
+        of both the combined result and the expansion.
+        """
+        if hindex == 0 or hindex == self.n_sector/2:
+            scale = self.n_sector**-0.5
+        else:
+            scale = (self.n_sector/2)**-0.5
+
+        sector = np.arange(self.n_sector)
+        jang = np.exp(2j*np.pi*hindex*sector/self.n_sector)
+        return scale*jang*np.exp(-2j*phase)
+
+    def full_rotor_result(self, rnum, method='nodal_solution', phase=0,
+                          as_complex=False):
+        """Lazy full rotor result computed on demand from the master sector.
+
+        Stores only the master sector result along with the phase
+        factor and rotation of each sector.  Any sector, subset of
+        sectors, or subset of nodes is computed when indexed, and
+        reductions like the maximum over all sectors are evaluated
+        without storing the full rotor result.
+
+        Parameters
+        ----------
+        rnum : int or list
+            Cumulative result number with zero based indexing, or a
+            list containing (step, substep) of the requested result.
+
+        method : str, optional
+            Nodal result to expand.  One of ``'nodal_solution'``,
+            ``'nodal_stress'``, ``'principal_nodal_stress'``,
+            ``'nodal_elastic_strain'``, ``'nodal_plastic_strain'``, or
+            ``'nodal_thermal_strain'``.
+
+        phase : float, optional
+            Phase to rotate sector result in radians.
+
+        as_complex : bool, optional
+            Returns the nodal solution of a modal analysis as a
+            complex number, otherwise as the real part rotated by
+            phase.  Default False.
+
+        Returns
+        -------
+        nnum : numpy.ndarray
+            Node numbers of master sector.
+
+        result : pyansys.cyclic_view.FullRotorResult
+            Array-like ``(n_sector, nnod, ncomp)`` full rotor result.
+            Index it or use ``np.asarray`` to compute the result.
+
+        Examples
+        --------
+        >>> import pyansys
+        >>> rst = pyansys.read_binary('file.rst')
+        >>> nnum, stress = rst.full_rotor_result(0, 'nodal_stress')
+        >>> sector_stress = stress[5]
+        >>> max_stress = stress.nanmax(axis=0)
+
+        Equivalent to, but requires far less memory than
+
+        >>> nnum, stress = rst.nodal_stress(0, full_rotor=True)
+        """
+        func, kind = self._full_rotor_func(method, as_complex)
+        rnum = self.parse_step_substep(rnum)
+        return self._full_rotor_result(func, kind, rnum, phase, as_complex)
+
+    def _full_rotor_func(self, method, as_complex):
+        """Return the sector result function and kind of a nodal result"""
+        tensor_methods = {'nodal_stress': 'stress',
+                          'principal_nodal_stress': 'principal',
+                          'nodal_elastic_strain': 'strain',
+                          'nodal_plastic_strain': 'strain',
+                          'nodal_thermal_strain': 'strain'}
+        if method == 'nodal_solution':
+            kind = 'vector'
+        elif method in tensor_methods:
+            kind = tensor_methods[method]
+            if as_complex:
+                raise ValueError('Only the nodal solution may be complex')
+        else:
+            raise ValueError('Unsupported method "%s".  Select one of:\n%s' %
+                             (method, ['nodal_solution'] + list(tensor_methods)))
+
+        if kind == 'principal':
+            return super().nodal_stress, kind
+        return getattr(super(), method), kind
+
+    def _full_rotor_result(self, func, kind, rnum, phase, as_complex,
+                           matrices=None, factors=None):
+        """Return the lazy full rotor result of a single result number.
+
+        Precomputed sector ``matrices`` and a cache of the phase
+        ``factors`` of each harmonic index may be supplied when
+        expanding many results.
+        """
+        nnum, result = self._master_result(func, rnum)
+
+        if self._resultheader['kan'] == 0:  # static result
+            if matrices is None:
+                matrices = self._sector_matrices()
+            return nnum, FullRotorResult(result, matrices, kind=kind)
+        elif self._resultheader['kan'] != 2:
+            raise RuntimeError('Unsupported analysis type')
+
+        # modal analysis: store the combined complex result
+        result_r = self._get_complex_result(func, rnum, result)
+        master = result + result_r*1j
+
+        hindex = self._resultheader['hindex'][rnum]
+        if factors is None:
+            factors = {}
+        if hindex not in factors:
+            factors[hindex] = self._phase_factors(hindex, phase)
+
+        if matrices is None:
+            if kind == 'vector':
+                matrices = self._sector_matrices(phase, cyclic_cs=False)
+            else:
+                matrices = self._sector_matrices()
+
+        return nnum, FullRotorResult(master, matrices, factors[hindex],
+                                     kind=kind, as_complex=as_complex)
+
+    def expand_modes(self, rnums=None, method='nodal_solution', phase=0,
+                     as_complex=False, out=None, filename=None):
+        """Expand many results to the full rotor in a single pass.
+
+        Useful for harmonic index sweeps.  Repeated mode pairs are
+        read once, the sector rotation matrices are computed once, and
+        the phase factors are computed once for each harmonic index.
+        Results are written a few sectors at a time into a single
+        preallocated array, which may be memory mapped to a ``.npy``
+        file.
+
+        Parameters
+        ----------
+        rnums : sequence, optional
+            Cumulative result numbers with zero based indexing or
+            (step, substep) pairs.  Defaults to all results.
+
+        method : str, optional
+            Nodal result to expand.  See
+            ``CyclicResult.full_rotor_result``.
+
+        phase : float, optional
+            Phase to rotate sector results in radians.
+
+        as_complex : bool, optional
+            Returns the nodal solution of a modal analysis as a
+            complex number, otherwise as the real part rotated by
+            phase.  Default False.
+
+        out : np.ndarray, optional
+            Preallocated ``(nresults, n_sector, nnod, ncomp)`` output
+            array.
+
+        filename : str, optional
+            Write the results to a memory mapped ``.npy`` file rather
+            than to memory.  Ignored when ``out`` is given.
+
+        Returns
+        -------
+        nnum : numpy.ndarray
+            Node numbers of master sector.
+
+        result : numpy.ndarray
+            ``(nresults, n_sector, nnod, ncomp)`` full rotor results.
+
+        Examples
+        --------
+        Expand the nodal solution of every mode to a memory mapped
+        file
+
+        >>> import pyansys
+        >>> rst = pyansys.read_binary('rotor.rst')
+        >>> nnum, disp = rst.expand_modes(filename='disp.npy')
+
+        Expand the stress of the first mode of each harmonic index
+
+        >>> rnums = [rst.harmonic_index_to_cumulative(hindex, 0)
+        ...          for hindex in range(4)]
+        >>> nnum, stress = rst.expand_modes(rnums, 'nodal_stress')
+        """
+        if rnums is None:
+            rnums = range(self.nsets)
+        rnums = [self.parse_step_substep(rnum) for rnum in rnums]
+        if not rnums:
+            raise ValueError('No results to expand')
+
+        nnum = None
+        for i, nnum, expanded in self._iter_full_rotor_results(rnums, method,
+                                                               phase,
+                                                               as_complex):
+            if out is None:
+                shape = (len(rnums),) + expanded.shape
+                if filename is not None:
+                    out = np.lib.format.open_memmap(filename, 'w+',
+                                                    expanded.dtype, shape)
+                else:
+                    out = np.empty(shape, expanded.dtype)
+            elif out.shape[1:] != expanded.shape or out.shape[0] != len(rnums):
+                raise ValueError('``out`` must be shaped %s' %
+                                 str((len(rnums),) + expanded.shape))
+
+            expanded.fill(out[i])
+
+        if isinstance(out, np.memmap):
+            out.flush()
+        return nnum, out
+
+    def _iter_full_rotor_results(self, rnums, method, phase=0,
+                                 as_complex=False):
+        """Yield the index, node numbers, and lazy full rotor result of
+        each cumulative result number in ``rnums``.
+
+        Results are yielded in the order of the result file.  Repeated
+        mode pairs are read once, sector matrices are computed once, and
+        phase factors once for each harmonic index.
+        """
+        func, kind = self._full_rotor_func(method, as_complex)
+
+        # share reads of repeated mode pairs, which are adjacent
+        reads = OrderedDict()
+
+        def read_sector(rnum):
+            if rnum not in reads:
+                reads[rnum] = func(rnum)
+                if len(reads) > 2:
+                    reads.popitem(last=False)
+            return reads[rnum]
+
+        if self._resultheader['kan'] == 2 and kind == 'vector':
+            matrices = self._sector_matrices(phase, cyclic_cs=False)
+        else:
+            matrices = self._sector_matrices()
+        factors = {}
+
+        for i in np.argsort(rnums, kind='stable'):
+            nnum, expanded = self._full_rotor_result(read_sector, kind,
+                                                     rnums[i], phase,
+                                                     as_complex, matrices,
+                                                     factors)
+            yield i, nnum, expanded
+
+    def export_full_rotor(self, filename, rnums=None,
+                          methods=('nodal_solution',), phase=0,
+                          as_complex=False):
+        """Stream full rotor results and mesh to a chunked on-disk store.
+
+        Results are expanded and written one sector at a time, so
+        memory usage is bounded by a single sector result regardless
+        of the number of sectors.  The full rotor mesh is written once
+        with the results.  See ``pyansys.cyclic_export`` for the
+        layout of the store.
+
+        Parameters
+        ----------
+        filename : str
+            Filename of the store.  Files ending in ``.h5`` or
+            ``.hdf5`` are written with ``h5py`` and files ending in
+            ``.zarr`` with ``zarr``.  Otherwise, results are written
+            to a directory of memory mapped ``.npy`` files.
+
+        rnums : sequence, optional
+            Cumulative result numbers with zero based indexing or
+            (step, substep) pairs.  Defaults to all results.
+
+        methods : sequence, optional
+            Nodal results to expand.  See
+            ``CyclicResult.full_rotor_result``.
+
+        phase : float, optional
+            Phase to rotate sector results in radians.
+
+        as_complex : bool, optional
+            Writes the nodal solution of a modal analysis as a
+            complex number, otherwise as the real part rotated by
+            phase.  Default False.
+
+        Examples
+        --------
+        Export the nodal solution and stress of all results to HDF5
+
+        >>> import pyansys
+        >>> rst = pyansys.read_binary('rotor.rst')
+        >>> rst.export_full_rotor('rotor.h5',
+        ...                       methods=['nodal_solution', 'nodal_stress'])
+
+        Read back the mesh
+
+        >>> from pyansys.cyclic_export import read_full_rotor_mesh
+        >>> grid = read_full_rotor_mesh('rotor.h5')
+        """
+        export_full_rotor(self, filename, rnums, methods, phase, as_complex)
+
     def _get_complex_result(self, func, rnum, full_result):
         """Acquire the duplicate sector or repeated result.
 
@@ -1009,7 +1397,7 @@ class CyclicResult(Result):
         return self._plot_cyclic_point_scalars(scalars, rnum, **kwargs)
 
     def principal_nodal_stress(self, rnum, phase=0, as_complex=False,
-                               full_rotor=False):
+                               full_rotor=False, sectors=None, nodes=None):
         """Computes the principal component stresses for each node in
         the solution.
 
@@ -1029,6 +1417,15 @@ class CyclicResult(Result):
         full_rotor : bool, optional
             Expand sector solution to full rotor.
 
+        sectors : int or sequence, optional
+            Zero based indices of the sectors to expand when
+            ``full_rotor`` is True.  Only these sectors are computed
+            and the first axis of the result matches this sequence.
+
+        nodes : sequence, optional
+            Node numbers of the master sector to return.  When
+            ``full_rotor`` is True, only these nodes are expanded.
+
         Returns
         -------
         nodenum : numpy.ndarray
@@ -1051,7 +1448,8 @@ class CyclicResult(Result):
             raise ValueError('complex and full_rotor cannot both be True')
 
         # get component stress
-        nnum, stress = self.nodal_stress(rnum, phase, as_complex, full_rotor)
+        nnum, stress = self.nodal_stress(rnum, phase, as_complex, full_rotor,
+                                         sectors=sectors, nodes=nodes)
 
         # compute principle stress
         if as_complex:
@@ -1067,7 +1465,7 @@ class CyclicResult(Result):
 
         elif full_rotor:
             # compute principle stress for each sector
-            pstress = np.empty((self.n_sector, stress.shape[1], 5), np.float64)
+            pstress = np.empty((stress.shape[0], stress.shape[1], 5), np.float64)
             for i in range(stress.shape[0]):
                 pstress[i], isnan = _binary_reader.compute_principal_stress(stress[i])
                 pstress[i, isnan] = np.nan
@@ -1502,42 +1900,19 @@ class CyclicResult(Result):
             See help(pyvista.plot) for additional keyword arguments.
 
         """
-        rnum = self.parse_step_substep(rnum)  # need cumulative
         if 'full_rotor' in kwargs:
             raise NotImplementedError('``full_rotor`` keyword argument not supported')
 
-        # normalize nodal solution
-        _, complex_disp = self.nodal_solution(rnum, as_complex=True,
-                                              full_rotor=True)
-        complex_disp *= displacement_factor
-        complex_disp = complex_disp.reshape(-1, 3)
-
-        if comp == 'x':
-            axis = 0
-        elif comp == 'y':
-            axis = 1
-        elif comp == 'z':
-            axis = 2
-        else:
-            axis = None
+        rnum = self.parse_step_substep(rnum)  # need cumulative
+        plot_mesh, animation = self._phase_animation(rnum, comp,
+                                                     displacement_factor,
+                                                     nangles)
+        orig_pt = plot_mesh.points.copy()
 
         result_info = ''
         if add_text:
             result_info = self.text_result_table(rnum)
 
-        # need only the surface of the full rotor
-        plot_mesh = self.full_rotor.extract_surface()
-        orig_pt = plot_mesh.points.copy()
-
-        # reduce the complex displacement to just the surface points
-        ind = plot_mesh.point_arrays['vtkOriginalPointIds']
-        complex_disp = np.take(complex_disp, ind, axis=0)
-
-        if axis is not None:
-            scalars = complex_disp[:, axis]
-        else:
-            scalars = (complex_disp*complex_disp).sum(1)**0.5
-
         # intialize plotter
         text_color = kwargs.pop('text_color', None)
         cpos = kwargs.pop('cpos', None)
@@ -1547,7 +1922,7 @@ class CyclicResult(Result):
             plotter.add_axes()
 
         if 'rng' not in kwargs:
-            smax = np.abs(scalars).max()
+            smax = animation.max_scalar
             if comp == 'norm':
                 kwargs['rng'] = [0, smax]
             else:
@@ -1557,8 +1932,9 @@ class CyclicResult(Result):
         if background:
             plotter.set_background(background)
 
+        _, scalars = animation.frame(0)
         plotter.add_mesh(plot_mesh,
-                         scalars=np.real(scalars),
+                         scalars=scalars,
                          **kwargs)
 
         # setup text
@@ -1584,78 +1960,282 @@ class CyclicResult(Result):
         plotter.show(interactive=False, auto_close=False,
                      interactive_update=not off_screen)
 
-        first_loop = True
-        while self._animating:
-            for angle in np.linspace(0, np.pi*2, nangles):
-                padj = 1*np.cos(angle) - 1j*np.sin(angle)
-                complex_disp_adj = np.real(complex_disp*padj)
+        # frames are computed by a background thread while rendering
+        frame = 0
+        for angle, disp, scalars in animation.frames(loop=loop):
+            plotter.update_scalars(scalars, render=False)
+            plot_mesh.points[:] = orig_pt + disp
 
-                if axis is not None:
-                    scalars = complex_disp_adj[:, axis]
-                else:
-                    scalars = (complex_disp_adj*complex_disp_adj).sum(1)**0.5
+            if add_text:
+                plotter.textActor.SetInput('%s\nPhase %.1f Degrees' %
+                                           (result_info, (angle*180/np.pi)))
 
-                plotter.update_scalars(scalars, render=False)
-                plot_mesh.points[:] = orig_pt + complex_disp_adj
+            plotter.update(1, force_redraw=True)
+            if not self._animating:
+                break
 
-                if add_text:
-                    plotter.textActor.SetInput('%s\nPhase %.1f Degrees' %
-                                               (result_info, (angle*180/np.pi)))
+            if movie_filename and frame < animation.n_frames:
+                plotter.write_frame()
+            frame += 1
 
-                plotter.update(1, force_redraw=True)
-                if not self._animating:
-                    break
+        cpos = plotter.camera_position
+        plotter.close()
+        return cpos
+
+    def _phase_animation(self, rnum, comp, displacement_factor, nangles):
+        """Return the full rotor surface and the phase animation of a mode"""
+        # normalize nodal solution
+        _, complex_disp = self.nodal_solution(rnum, as_complex=True,
+                                              full_rotor=True)
+        complex_disp *= displacement_factor
+        complex_disp = complex_disp.reshape(-1, 3)
 
-                if movie_filename and first_loop:
-                    plotter.write_frame()
+        # need only the surface of the full rotor
+        plot_mesh = self.full_rotor.extract_surface()
 
-            first_loop = False
-            if not loop:
-                break
+        # reduce the complex displacement to just the surface points
+        ind = plot_mesh.point_arrays['vtkOriginalPointIds']
+        complex_disp = np.take(complex_disp, ind, axis=0)
+        return plot_mesh, PhaseAnimation(complex_disp, nangles, comp)
 
-        cpos = plotter.camera_position
+    def save_nodal_solution_animation(self, rnum, filename, comp='norm',
+                                      displacement_factor=0.1, nangles=180,
+                                      add_text=True, **kwargs):
+        """Write one cycle of a mode shape to a movie or image sequence.
+
+        The frames are computed from the complex full rotor solution
+        by a background thread while rendering off screen.
+
+        Parameters
+        ----------
+        rnum : int or list
+            Cumulative result number with zero based indexing, or a
+            list containing (step, substep) of the requested result.
+
+        filename : str
+            Movie filename ending in ``'.mp4'`` or ``'.gif'``, or an
+            image filename containing an integer format for the frame
+            number.  For example, ``'frame_%03d.png'``.
+
+        comp : str, optional
+            Component of displacement to display.  Options are 'x',
+            'y', 'z', or 'norm'.
+
+        displacement_factor : float, optional
+            Increases or decreases displacement by a factor.
+
+        nangles : int, optional
+            Number of frames within one cycle.
+
+        add_text : bool, optional
+            Includes result information at the bottom left-hand corner
+            of the plot.
+
+        kwargs : optional keyword arguments, optional
+            See help(pyvista.plot) for additional keyword arguments.
+
+        Returns
+        -------
+        filenames : list
+            Filenames written.
+
+        Notes
+        -----
+        Every frame must still be rasterized by VTK, so each frame is
+        rendered and written within a Python loop.  Only the frame
+        data is precomputed: the full rotor solution is expanded once
+        and the displacement and scalars of each frame are produced
+        ahead of the renderer by a background thread.
+
+        Examples
+        --------
+        >>> import pyansys
+        >>> rst = pyansys.read_binary('rotor.rst')
+        >>> rst.save_nodal_solution_animation(0, 'mode.mp4')
+
+        Write an image sequence
+
+        >>> rst.save_nodal_solution_animation(0, 'mode_%03d.png', nangles=36)
+        """
+        rnum = self.parse_step_substep(rnum)
+        image_sequence = '%' in filename
+        plot_mesh, animation = self._phase_animation(rnum, comp,
+                                                     displacement_factor,
+                                                     nangles)
+        orig_pt = plot_mesh.points.copy()
+
+        text_color = kwargs.pop('text_color', None)
+        cpos = kwargs.pop('cpos', None)
+        window_size = kwargs.pop('window_size', None)
+        plotter = pv.Plotter(off_screen=True, window_size=window_size)
+        if kwargs.pop('show_axes', True):
+            plotter.add_axes()
+        background = kwargs.pop('background', None)
+        if background:
+            plotter.set_background(background)
+
+        if 'rng' not in kwargs:
+            smax = animation.max_scalar
+            if comp == 'norm':
+                kwargs['rng'] = [0, smax]
+            else:
+                kwargs['rng'] = [-smax, smax]
+
+        _, scalars = animation.frame(0)
+        plotter.add_mesh(plot_mesh, scalars=scalars, **kwargs)
+
+        result_info = ''
+        if add_text:
+            result_info = self.text_result_table(rnum)
+        plotter.add_text(' ', font_size=20, position=[0, 0], color=text_color)
+
+        if cpos:
+            plotter.camera_position = cpos
+
+        if not image_sequence:
+            if filename.strip()[-3:] == 'gif':
+                plotter.open_gif(filename)
+            else:
+                plotter.open_movie(filename)
+
+        plotter.show(auto_close=False)
+
+        filenames = []
+        for i, (angle, disp, scalars) in enumerate(animation.frames()):
+            plotter.update_scalars(scalars, render=False)
+            plot_mesh.points[:] = orig_pt + disp
+            if add_text:
+                plotter.textActor.SetInput('%s\nPhase %.1f Degrees' %
+                                           (result_info, (angle*180/np.pi)))
+            plotter.render()
+
+            if image_sequence:
+                filenames.append(filename % i)
+                plotter.screenshot(filenames[-1])
+            else:
+                plotter.write_frame()
+
+        if not image_sequence:
+            filenames.append(filename)
         plotter.close()
-        return cpos
+        return filenames
 
     @wraps(animate_nodal_solution)
     def animate_nodal_displacement(self, *args, **kwargs):
         """wraps animate_nodal_solution"""
         return self.animate_nodal_solution(*args, **kwargs)
 
-    def _gen_full_rotor(self):
-        """ Create full rotor vtk unstructured grid """
-        grid = self._mas_grid.copy()
-        # transform to standard coordinate system
-        cs_cord = self._resultheader['csCord']
-        if cs_cord > 1:
-            matrix = self.cs_4x4(cs_cord, as_vtk_matrix=True)
-            grid.transform(matrix)
-
-        # consider forcing low and high to be exact
-        # self._mas_grid.point_arrays['CYCLIC_M01H'] --> rotate and match
-
-        vtkappend = vtkAppendFilter()
-        # vtkappend.MergePointsOn()
-        # vtkappend.SetTolerance(1E-3)  # not available until vtk 9+
-        rang = 360.0 / self.n_sector
-        for i in range(self.n_sector):
-            # Transform mesh
-            sector = grid.copy()
-            sector_id = np.empty(grid.n_points)
-            sector_id[:] = i
-            sector.point_arrays['sector_id'] = sector_id
-            sector.rotate_z(rang * i)
-            vtkappend.AddInputData(sector)
-
-        vtkappend.Update()
-        full_rotor = pv.wrap(vtkappend.GetOutput())
+    def _gen_full_rotor(self, merge=False, tolerance=None):
+        """Create full rotor vtk unstructured grid.
 
-        if cs_cord > 1:
-            matrix.Invert()
-            full_rotor.transform(matrix)
+        Sector connectivity is tiled with point offsets and the
+        points of every sector are transformed by a single call to
+        ``rotate_sectors``.  Optionally merges the coincident nodes at
+        the low and high cyclic edges of adjacent sectors.
+        """
+        grid = self._mas_grid
+        npts = grid.n_points
+        n_sector = self.n_sector
+        matrices = self._sector_matrices()
+
+        # tile the legacy cell array of the master sector
+        full_cells, offset, is_pt = tile_cells(grid, range(n_sector))
+        full_cells = full_cells.ravel()
+        is_pt = np.tile(is_pt, n_sector)
+
+        points = np.empty((n_sector, npts, 3))
+        points[:] = grid.points
+        _binary_reader.rotate_sectors(points, matrices, 0)
+        points = points.reshape(-1, 3).astype(grid.points.dtype, copy=False)
+
+        sector_id = np.empty((n_sector, npts))
+        sector_id[:] = np.arange(n_sector).reshape(-1, 1)
+        point_arrays = {key: _tile(grid.point_arrays[key], n_sector)
+                        for key in grid.point_arrays}
+        point_arrays['sector_id'] = sector_id.ravel()
+        point_arrays['sector_point_id'] = np.tile(np.arange(npts), n_sector)
+
+        if merge:
+            # map the low edge nodes to the high edge of the prior sector
+            low, high = self._cyclic_node_pairs(tolerance)
+            target = np.arange(n_sector*npts)
+            for k in range(n_sector):
+                target[k*npts + low] = ((k - 1) % n_sector)*npts + high
+
+            # resolve nodes that lie on both edges
+            for _ in range(n_sector):
+                chained = target[target]
+                if np.array_equal(chained, target):
+                    break
+                target = chained
+
+            keep = target == np.arange(target.size)
+            new_ind = np.cumsum(keep) - 1
+            full_cells[is_pt] = new_ind[target[full_cells[is_pt]]]
+            points = points[keep]
+            point_arrays = {key: value[keep]
+                            for key, value in point_arrays.items()}
+
+        celltypes = np.tile(grid.celltypes, n_sector)
+        if VTK9:
+            full_rotor = pv.UnstructuredGrid(full_cells, celltypes, points)
+        else:
+            full_rotor = pv.UnstructuredGrid(offset.ravel(), full_cells,
+                                             celltypes, points)
+
+        for key, value in point_arrays.items():
+            full_rotor.point_arrays[key] = value
+        for key in grid.cell_arrays:
+            full_rotor.cell_arrays[key] = _tile(grid.cell_arrays[key], n_sector)
 
         return full_rotor
 
+    def _cyclic_node_pairs(self, tolerance=None):
+        """Pair the low and high cyclic edge nodes of the master sector.
+
+        Returns the master grid point indices of the low edge nodes
+        and the matching high edge nodes, which coincide once the low
+        edge is rotated by one sector.
+        """
+        grid = self._mas_grid
+        if 'CYCLIC_M01L' not in grid.point_arrays:
+            raise ValueError('Result does not contain the cyclic edge '
+                             'components "CYCLIC_M01L" and "CYCLIC_M01H"')
+        if tolerance is None:
+            tolerance = grid.length*1E-6
+
+        low = np.nonzero(grid.point_arrays['CYCLIC_M01L'])[0]
+        high = np.nonzero(grid.point_arrays['CYCLIC_M01H'])[0]
+
+        # rotate the low edge by one sector
+        low_pts = np.empty((1, low.size, 3))
+        low_pts[0] = grid.points[low]
+        _binary_reader.rotate_sectors(low_pts, self._sector_matrices()[1:2], 0)
+        low_pts = low_pts[0]
+        high_pts = grid.points[high].astype(np.float64)
+
+        # match quantized coordinates
+        keys = np.round(np.vstack((low_pts, high_pts))/tolerance).astype(np.int64)
+        _, label = np.unique(keys, axis=0, return_inverse=True)
+        label = label.ravel()
+        low_label, high_label = label[:low.size], label[low.size:]
+        order = np.argsort(high_label)
+        ind = np.searchsorted(high_label[order], low_label)
+        ind[ind == high.size] = 0
+        pair = np.full(low.size, -1)
+        if high.size:
+            matched = high_label[order][ind] == low_label
+            pair[matched] = order[ind[matched]]
+
+        # coordinates straddling a rounding boundary
+        for i in np.nonzero(pair == -1)[0]:
+            dist = np.linalg.norm(high_pts - low_pts[i], axis=1)
+            if dist.size and dist.min() < tolerance:
+                pair[i] = np.argmin(dist)
+
+        mask = pair != -1
+        return low[mask], high[pair[mask]]
+
     @property
     def full_rotor(self):
         """UnstructuredGrid of the full replicated rotor"""
@@ -1663,6 +2243,62 @@ class CyclicResult(Result):
             self._rotor_cache = self._gen_full_rotor()
         return self._rotor_cache
 
+    def full_rotor_grid(self, merge=False, cache=False, tolerance=None):
+        """Full rotor grid, optionally cached to disk.
+
+        Parameters
+        ----------
+        merge : bool, optional
+            Merge the coincident nodes at the cyclic edges of adjacent
+            sectors.  The point array ``'sector_id'`` and
+            ``'sector_point_id'`` contain the sector and the master
+            sector point index of each point of the full rotor.
+
+        cache : bool, optional
+            Store the grid as a ``.vtu`` file alongside the result
+            file and load it when newer than the result file.  Merged
+            grids are cached separately for each ``tolerance``.
+
+        tolerance : float, optional
+            Distance within which cyclic edge nodes are merged.
+            Defaults to ``1E-6`` times the length of the diagonal of
+            the master sector.
+
+        Returns
+        -------
+        full_rotor : pyvista.UnstructuredGrid
+            Grid of the full rotor.
+
+        Examples
+        --------
+        >>> import pyansys
+        >>> rst = pyansys.read_binary('rotor.rst')
+        >>> rotor = rst.full_rotor_grid(merge=True, cache=True)
+        """
+        if not merge and not cache:
+            return self.full_rotor
+
+        root = os.path.splitext(self.filename)[0]
+        if merge and tolerance is not None:
+            cache_file = root + '.rotor_merged_%r.vtu' % float(tolerance)
+        elif merge:
+            cache_file = root + '.rotor_merged.vtu'
+        else:
+            cache_file = root + '.rotor.vtu'
+
+        if cache and os.path.isfile(cache_file):
+            if os.path.getmtime(cache_file) >= os.path.getmtime(self.filename):
+                return pv.read(cache_file)
+
+        full_rotor = self._gen_full_rotor(merge, tolerance)
+        if cache:
+            try:
+                full_rotor.save(cache_file)
+            except OSError:  # pragma: no cover
+                pass  # read only directory
+
+        return full_rotor
+
     def _plot_cyclic_point_scalars(self, scalars, rnum,
                                    show_displacement=False,
                                    displacement_factor=1,
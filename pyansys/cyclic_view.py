@@ -0,0 +1,579 @@
+"""Lazy full rotor results of cyclic models.
+
+A full rotor result of a cyclic model is the master sector result
+scaled by a phase factor and rotated for each sector.  Rather than
+storing the ``(n_sector, nnode, ncomp)`` array, ``FullRotorResult``
+stores the master sector result along with the phase factor and
+transformation matrix of each sector and computes only the sectors
+and nodes requested.
+"""
+from queue import Queue, Empty
+from threading import Thread, Event
+
+import numpy as np
+
+from pyansys import _binary_reader
+
+# maximum size in bytes of the sectors computed at once when reducing
+CHUNK_BYTES = 2**26
+
+
+def rotate_vectors(data, matrices):
+    """Transform vectors of several sectors in place.
+
+    Real arrays are transformed by a single call to the compiled
+    kernel, while complex arrays are transformed with NumPy.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        ``(n_sector, nnode, ncomp)`` array.  Only the first three
+        components are transformed.
+
+    matrices : np.ndarray
+        ``(n_sector, 4, 4)`` transformation matrices.
+    """
+    if data.dtype == np.float64 and data.flags.c_contiguous:
+        _binary_reader.rotate_sectors(data, matrices, 0)
+        return
+
+    ndim = min(data.shape[2], 3)
+    rot = matrices[:, :ndim, :ndim]
+    trans = matrices[:, :ndim, 3]
+    data[:, :, :ndim] = np.einsum('kij,knj->kni', rot, data[:, :, :ndim])
+    if np.any(trans):
+        data[:, :, :ndim] += trans[:, np.newaxis]
+
+
+def rotate_tensors(data, matrices, stress=True):
+    """Rotate symmetric tensors of several sectors in place.
+
+    Real arrays are rotated by a single call to the compiled kernel.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        ``(n_sector, nnode, ncomp)`` array with the tensor components
+        in the order XX, YY, ZZ, XY, YZ, XZ.  Additional components
+        such as EQV are invariant and are not modified.
+
+    matrices : np.ndarray
+        ``(n_sector, 4, 4)`` transformation matrices.
+
+    stress : bool, optional
+        ``True`` when the tensor is a stress.  ``False`` when the
+        tensor is an engineering strain, in which case shear
+        components are halved before and doubled after rotating.
+    """
+    if data.dtype == np.float64 and data.flags.c_contiguous:
+        _binary_reader.rotate_sectors(data, matrices, 1 if stress else 2)
+        return
+
+    shear = 0.5 if not stress else 1.0
+    rot = matrices[:, :3, :3]
+
+    tensor = np.empty(data.shape[:2] + (3, 3), data.dtype)
+    tensor[..., 0, 0] = data[..., 0]
+    tensor[..., 1, 1] = data[..., 1]
+    tensor[..., 2, 2] = data[..., 2]
+    tensor[..., 0, 1] = tensor[..., 1, 0] = data[..., 3]*shear
+    tensor[..., 1, 2] = tensor[..., 2, 1] = data[..., 4]*shear
+    tensor[..., 0, 2] = tensor[..., 2, 0] = data[..., 5]*shear
+
+    tensor = np.einsum('kij,knjl,kml->knim', rot, tensor, rot)
+    data[..., 0] = tensor[..., 0, 0]
+    data[..., 1] = tensor[..., 1, 1]
+    data[..., 2] = tensor[..., 2, 2]
+    data[..., 3] = tensor[..., 0, 1]/shear
+    data[..., 4] = tensor[..., 1, 2]/shear
+    data[..., 5] = tensor[..., 0, 2]/shear
+
+
+class FullRotorResult():
+    """Full rotor nodal result computed on demand from the master sector.
+
+    Behaves like a read-only ``(n_sector, nnode, ncomp)`` array.
+    Indexing computes only the requested sectors and nodes, and
+    reductions are evaluated a few sectors at a time.  Use
+    ``np.asarray`` to compute the entire full rotor result.
+
+    Created with ``CyclicResult.full_rotor_result``.
+
+    Parameters
+    ----------
+    master : np.ndarray
+        ``(nnode, ncomp)`` master sector result.  Complex for modal
+        results, where the imaginary part is the result of the
+        repeated mode or duplicate sector.
+
+    matrices : np.ndarray
+        ``(n_sector, 4, 4)`` transformation matrix of each sector.
+
+    factors : np.ndarray, optional
+        Complex scale factor of each sector.  Defaults to one for
+        every sector.
+
+    kind : str, optional
+        ``'vector'``, ``'stress'``, ``'strain'``, or ``'principal'``.
+        Principal stresses are computed from the rotated component
+        stresses of each sector.
+
+    as_complex : bool, optional
+        Return complex results rather than the real part.  Only
+        supported for vector results.
+
+    Examples
+    --------
+    >>> nnum, stress = rst.full_rotor_result(0, 'nodal_stress')
+    >>> stress.shape
+    (72, 2085621, 6)
+
+    Compute only the third sector, the first 100 nodes of every other
+    sector, or the maximum stress of each node across all sectors
+
+    >>> sector_stress = stress[2]
+    >>> sub_stress = stress[::2, :100]
+    >>> max_stress = stress.max(axis=0)
+    """
+
+    def __init__(self, master, matrices, factors=None, kind='vector',
+                 as_complex=False):
+        """Store the master sector result and the sector transforms"""
+        if kind not in ['vector', 'stress', 'strain', 'principal']:
+            raise ValueError('Invalid kind "%s"' % kind)
+        if as_complex and kind != 'vector':
+            raise ValueError('Only vector results may be complex')
+
+        self._master = master
+        self._matrices = np.asarray(matrices, np.float64)
+        self._factors = factors
+        self._kind = kind
+        self._as_complex = as_complex
+
+    @property
+    def master(self):
+        """Master sector result"""
+        return self._master
+
+    @property
+    def n_sector(self):
+        """Number of sectors"""
+        return self._matrices.shape[0]
+
+    @property
+    def shape(self):
+        """Shape of the full rotor result"""
+        ncomp = 5 if self._kind == 'principal' else self._master.shape[1]
+        return (self.n_sector, self._master.shape[0], ncomp)
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the full rotor result"""
+        return 3
+
+    @property
+    def size(self):
+        """Number of values of the full rotor result"""
+        return int(np.prod(self.shape))
+
+    @property
+    def dtype(self):
+        """Data type of the full rotor result"""
+        if self._as_complex:
+            return np.dtype(np.complex128)
+        return np.dtype(np.float64)
+
+    @property
+    def nbytes(self):
+        """Bytes required to store the full rotor result"""
+        return self.size*self.dtype.itemsize
+
+    def __len__(self):
+        return self.n_sector
+
+    def __repr__(self):
+        return '%s of shape %s' % (type(self).__name__, self.shape)
+
+    def __array__(self, dtype=None):
+        data = self.sector_result()
+        if dtype is not None:
+            return data.astype(dtype, copy=False)
+        return data
+
+    def __iter__(self):
+        for i in range(self.n_sector):
+            yield self.sector_result(i)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if any(item is Ellipsis for item in key):
+            ind = [i for i, item in enumerate(key) if item is Ellipsis][0]
+            fill = (slice(None),)*(3 - len(key) + 1)
+            key = key[:ind] + fill + key[ind + 1:]
+        if len(key) > 3:
+            raise IndexError('Too many indices for a full rotor result')
+        key = key + (slice(None),)*(3 - len(key))
+
+        sectors = np.arange(self.n_sector)[key[0]]
+        nodes = np.arange(self._master.shape[0])[key[1]]
+        data = self.sector_result(np.atleast_1d(sectors),
+                                  np.atleast_1d(nodes))
+
+        # drop axes indexed with an integer
+        if np.ndim(sectors) == 0:
+            data = data[0]
+            if np.ndim(nodes) == 0:
+                data = data[0]
+        elif np.ndim(nodes) == 0:
+            data = data[:, 0]
+        return data[..., key[2]]
+
+    def sector_result(self, sectors=None, nodes=None):
+        """Compute the result of one or more sectors.
+
+        Parameters
+        ----------
+        sectors : int or sequence, optional
+            Zero based sector index or indices.  Defaults to all
+            sectors.
+
+        nodes : sequence, optional
+            Indices of the nodes of the master sector result to
+            compute.  Defaults to all nodes.
+
+        Returns
+        -------
+        result : np.ndarray
+            ``(nnode, ncomp)`` array when ``sectors`` is an integer,
+            otherwise a ``(nsectors, nnode, ncomp)`` array.
+
+        Examples
+        --------
+        >>> sector_stress = stress.sector_result(3)
+        >>> stress.sector_result([0, 1], nodes=[0, 10, 20]).shape
+        (2, 3, 6)
+        """
+        if sectors is None:
+            sectors = np.arange(self.n_sector)
+        elif np.ndim(sectors) == 0:
+            return self.sector_result([sectors], nodes)[0]
+
+        sectors = np.asarray(sectors)
+        master = self._master
+        if nodes is not None:
+            master = master[nodes]
+
+        if self._factors is None:
+            data = np.empty((sectors.size,) + master.shape, master.dtype)
+            data[:] = master
+        else:
+            data = self._factors[sectors].reshape(-1, 1, 1)*master
+            if not self._as_complex:
+                data = np.ascontiguousarray(data.real)
+
+        matrices = self._matrices[sectors]
+        if self._kind == 'vector':
+            rotate_vectors(data, matrices)
+            return data
+
+        rotate_tensors(data, matrices, stress=self._kind != 'strain')
+        if self._kind == 'principal':
+            pstress = np.empty(data.shape[:2] + (5,))
+            for i in range(data.shape[0]):
+                stress = np.ascontiguousarray(data[i, :, :6])
+                pstress[i], isnan = _binary_reader.compute_principal_stress(stress)
+                pstress[i, isnan] = np.nan
+            return pstress
+        return data
+
+    def _sector_chunks(self, nodes=None):
+        """Yield the indices and results of a few sectors at a time"""
+        nnode = self._master.shape[0] if nodes is None else len(nodes)
+        sector_nbytes = max(nnode*self.shape[2]*self.dtype.itemsize, 1)
+        chunk = max(CHUNK_BYTES // sector_nbytes, 1)
+        for start in range(0, self.n_sector, chunk):
+            sectors = np.arange(start, min(start + chunk, self.n_sector))
+            yield sectors, self.sector_result(sectors, nodes)
+
+    def fill(self, out):
+        """Compute the full rotor result into an existing array.
+
+        Sectors are computed a few at a time, allowing ``out`` to be
+        a memory mapped array larger than the available memory.
+
+        Parameters
+        ----------
+        out : np.ndarray
+            Array shaped like the full rotor result.
+
+        Examples
+        --------
+        >>> out = np.lib.format.open_memmap('stress.npy', 'w+',
+        ...                                 stress.dtype, stress.shape)
+        >>> stress.fill(out)
+        """
+        if tuple(out.shape) != self.shape:
+            raise ValueError('``out`` must be shaped %s' % str(self.shape))
+        for sectors, data in self._sector_chunks():
+            out[sectors[0]:sectors[-1] + 1] = data
+
+    def reduce(self, ufunc, axis=None, nodes=None):
+        """Reduce the full rotor result without storing it.
+
+        Parameters
+        ----------
+        ufunc : numpy.ufunc
+            Binary ufunc used to reduce the result.  For example,
+            ``np.maximum``, ``np.fmax`` (ignores NaN), or ``np.add``.
+
+        axis : int, optional
+            Axis to reduce.  ``0`` reduces over sectors, ``1`` over
+            nodes, and ``2`` over components.  Defaults to all axes.
+
+        nodes : sequence, optional
+            Indices of the nodes to include.  Defaults to all nodes.
+
+        Returns
+        -------
+        reduced : np.ndarray or float
+            Reduced result.
+
+        Examples
+        --------
+        Maximum equivalent stress of each node over all sectors,
+        ignoring nodes without a result
+
+        >>> nnum, pstress = rst.full_rotor_result(0, 'principal_nodal_stress')
+        >>> max_seqv = pstress.reduce(np.fmax, axis=0)[:, 4]
+        """
+        if axis is not None and axis not in (0, 1, 2):
+            raise ValueError('``axis`` must be 0, 1, 2, or None')
+
+        reduced = None
+        parts = []
+        for _, data in self._sector_chunks(nodes):
+            if axis is None or axis == 0:
+                part = ufunc.reduce(data, axis=0)
+                reduced = part if reduced is None else ufunc(reduced, part)
+            else:
+                parts.append(ufunc.reduce(data, axis=axis))
+
+        if axis is None:
+            return ufunc.reduce(reduced, axis=None)
+        elif axis == 0:
+            return reduced
+        return np.concatenate(parts)
+
+    def max(self, axis=None):
+        """Maximum of the full rotor result along an axis.
+
+        NaN values propagate.  See ``FullRotorResult.nanmax``.
+        """
+        return self.reduce(np.maximum, axis)
+
+    def min(self, axis=None):
+        """Minimum of the full rotor result along an axis.
+
+        NaN values propagate.  See ``FullRotorResult.nanmin``.
+        """
+        return self.reduce(np.minimum, axis)
+
+    def nanmax(self, axis=None):
+        """Maximum of the full rotor result along an axis ignoring NaN"""
+        return self.reduce(np.fmax, axis)
+
+    def nanmin(self, axis=None):
+        """Minimum of the full rotor result along an axis ignoring NaN"""
+        return self.reduce(np.fmin, axis)
+
+    def sum(self, axis=None):
+        """Sum of the full rotor result along an axis"""
+        return self.reduce(np.add, axis)
+
+    def mean(self, axis=None):
+        """Mean of the full rotor result along an axis"""
+        if axis is None:
+            count = self.size
+        else:
+            count = self.shape[axis]
+        return self.sum(axis)/count
+
+
+class PhaseAnimation():
+    """Frames of a complex result rotated through one cycle of phase.
+
+    Each frame is ``real(field*exp(-1j*angle))``, which is computed
+    from the real and imaginary parts of the field without complex
+    temporaries.  Frames are produced by a background thread into a
+    small ring buffer of preallocated arrays while the consumer
+    renders or writes the prior frames.
+
+    Parameters
+    ----------
+    field : np.ndarray
+        ``(npoints, ncomp)`` complex field, for example the complex
+        full rotor displacement of a mode.
+
+    nangles : int, optional
+        Number of frames within one cycle.
+
+    comp : str, optional
+        Component used for the scalars of each frame.  Either
+        ``'x'``, ``'y'``, ``'z'``, or ``'norm'``.
+
+    buffer_size : int, optional
+        Number of frames held by the ring buffer.
+
+    Examples
+    --------
+    >>> from pyansys.cyclic_view import PhaseAnimation
+    >>> nnum, disp = rst.nodal_solution(0, as_complex=True,
+    ...                                 full_rotor=True)
+    >>> animation = PhaseAnimation(disp.reshape(-1, 3), nangles=36)
+    >>> for angle, frame_disp, scalars in animation.frames():
+    ...     pass
+    """
+
+    def __init__(self, field, nangles=180, comp='norm', buffer_size=4):
+        """Store the real and imaginary parts of the field"""
+        field = np.asarray(field)
+        if field.ndim != 2:
+            raise ValueError('``field`` must be a (npoints, ncomp) array')
+        if comp == 'x':
+            self._axis = 0
+        elif comp == 'y':
+            self._axis = 1
+        elif comp == 'z':
+            self._axis = 2
+        elif comp == 'norm':
+            self._axis = None
+        else:
+            raise ValueError('``comp`` must be "x", "y", "z", or "norm"')
+        if buffer_size < 1:
+            raise ValueError('``buffer_size`` must be at least 1')
+
+        self._real = np.ascontiguousarray(field.real, np.float64)
+        self._imag = np.ascontiguousarray(field.imag, np.float64)
+        self._tmp = np.empty_like(self._real)  # scratch of each frame
+        self._angles = np.linspace(0, np.pi*2, nangles)
+        self._buffer_size = buffer_size
+
+    @property
+    def angles(self):
+        """Phase angle of each frame in radians"""
+        return self._angles
+
+    @property
+    def n_frames(self):
+        """Number of frames within one cycle"""
+        return self._angles.size
+
+    @property
+    def max_scalar(self):
+        """Maximum magnitude of the complex scalars of the field"""
+        field = self._real + 1j*self._imag
+        if self._axis is None:
+            return np.abs((field*field).sum(1)**0.5).max()
+        return np.abs(field[:, self._axis]).max()
+
+    def frame(self, angle, out=None, scalars=None):
+        """Compute a single frame.
+
+        Parameters
+        ----------
+        angle : float
+            Phase angle in radians.
+
+        out : np.ndarray, optional
+            Array to store the real field.
+
+        scalars : np.ndarray, optional
+            Array to store the scalars.
+
+        Returns
+        -------
+        field : np.ndarray
+            Real field at this phase.
+
+        scalars : np.ndarray
+            Scalars of the field at this phase.
+
+        Notes
+        -----
+        Frames share a preallocated scratch array and must not be
+        computed concurrently.
+        """
+        if out is None:
+            out = np.empty_like(self._real)
+        if scalars is None:
+            scalars = np.empty(self._real.shape[0])
+
+        # real((a + ib)*(cos - i*sin)) == a*cos + b*sin
+        np.multiply(self._real, np.cos(angle), out=out)
+        np.multiply(self._imag, np.sin(angle), out=self._tmp)
+        out += self._tmp
+
+        if self._axis is None:
+            np.multiply(out, out, out=self._tmp)
+            self._tmp.sum(1, out=scalars)
+            np.sqrt(scalars, out=scalars)
+        else:
+            scalars[:] = out[:, self._axis]
+        return out, scalars
+
+    def frames(self, loop=False):
+        """Yield the phase angle, field, and scalars of each frame.
+
+        Frames are computed ahead by a background thread.  The arrays
+        of each frame are reused by the ring buffer and are only valid
+        until the next frame is requested.
+
+        Parameters
+        ----------
+        loop : bool, optional
+            Repeat the cycle until the generator is closed.
+        """
+        fields = [np.empty_like(self._real) for _ in range(self._buffer_size)]
+        scalars = [np.empty(self._real.shape[0])
+                   for _ in range(self._buffer_size)]
+        free = Queue()
+        for slot in range(self._buffer_size):
+            free.put(slot)
+        filled = Queue()
+        stop = Event()
+
+        def produce():
+            while not stop.is_set():
+                for angle in self._angles:
+                    slot = None
+                    while slot is None and not stop.is_set():
+                        try:
+                            slot = free.get(timeout=0.1)
+                        except Empty:
+                            pass
+                    if slot is None:
+                        return
+                    self.frame(angle, fields[slot], scalars[slot])
+                    filled.put((slot, angle))
+                if not loop:
+                    break
+            filled.put(None)
+
+        producer = Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                item = filled.get()
+                if item is None:
+                    break
+                slot, angle = item
+                yield angle, fields[slot], scalars[slot]
+                free.put(slot)
+        finally:
+            stop.set()
+            producer.join()
+
+    def __iter__(self):
+        return self.frames()
@@ -12,7 +12,7 @@ from libc.stdio cimport (fopen, FILE, fclose, fread, fseek, SEEK_CUR,
                          ftell, SEEK_SET)
 from libc.string cimport memcpy
 from libc.stdint cimport int64_t, int32_t
-from libc.stdlib cimport malloc, free
+from libc.stdlib cimport malloc, free, qsort
 
 # debug
 from libc.stdio cimport printf
@@ -27,6 +27,7 @@ cdef extern from "<iostream>" namespace "std" nogil:
           ostream& write(const char*, int) except +
      cdef cppclass istream:
           istream& read(const char*, int) except +
+          istream& seekg(int64_t) except +
      cdef cppclass ifstream(istream):
           ifstream(const char *, open_mode) except +
 
@@ -61,6 +62,9 @@ cdef extern from 'binary_reader.h' nogil:
     void read_nodes(const char*, int64_t, int, int*, double*)
     void* read_record(const char*, int64_t, int*, int*, int*, int*)
     void read_record_stream(ifstream*, int64_t, void*, int*, int*, int*)
+    void io_stats_enable(int)
+    void io_stats_add(int64_t, int64_t, int64_t, int64_t, int64_t)
+    void io_stats_get(int64_t*)
 
 
 # VTK numbering for vtk cells
@@ -190,7 +194,38 @@ def load_nodes(filename, int ptr_loc, int nnod, double [:, ::1] nloc,
     cdef bytes buf, flags_buf
     cdef bytes py_bytes = filename.encode()
     cdef char* c_filename = py_bytes
-    read_nodes(c_filename, ptr_loc, nnod, &nnum[0], &nloc[0, 0])
+    with nogil:
+        read_nodes(c_filename, ptr_loc, nnod, &nnum[0], &nloc[0, 0])
+
+
+def enable_io_stats(int enable):
+    """Enable or disable the I/O counters of the binary readers.
+
+    Calls are reference counted; the counters remain enabled until
+    each enabling call has been matched by a disabling call.
+    """
+    io_stats_enable(enable)
+
+
+def add_io_stats(int64_t records, int64_t nbytes, int64_t compressed,
+                 int64_t raw, int64_t seeks):
+    """Add reads performed outside of the binary readers to the I/O
+    counters when enabled"""
+    io_stats_add(records, nbytes, compressed, raw, seeks)
+
+
+def get_io_stats():
+    """Return the I/O counters of the binary readers.
+
+    Returns
+    -------
+    stats : np.ndarray
+        Records read, bytes read, compressed records, raw records,
+        and seeks.
+    """
+    cdef int64_t [::1] stats = np.zeros(5, np.int64)
+    io_stats_get(&stats[0])
+    return np.asarray(stats)
 
 
 def c_read_record(filename, int64_t ptr, int return_bufsize=0):
@@ -200,7 +235,9 @@ def c_read_record(filename, int64_t ptr, int return_bufsize=0):
 
     cdef int prec_flag, type_flag, size, my_dtype, bufsize
     cdef void* c_ptr
-    c_ptr = read_record(c_filename, ptr, &prec_flag, &type_flag, &size, &bufsize)
+    with nogil:
+        c_ptr = read_record(c_filename, ptr, &prec_flag, &type_flag, &size,
+                            &bufsize)
     cdef np.ndarray ndarray = wrap_array(c_ptr, size, type_flag, prec_flag)
 
     if return_bufsize:
@@ -283,24 +320,25 @@ def load_elements(filename, int64_t loc, int nelem, int64_t [::1] e_disp_table):
     cdef char [512] tmp_buf
 
     cdef int c = 0  # cell position counter
-    for i in range(nelem):
-        # load element
-        elem_loc = loc + e_disp_table[i]
-        read_record_stream(binfile, elem_loc, <void*>tmp_buf,
-                           &prec_flag, &type_flag, &size)
+    with nogil:
+        for i in range(nelem):
+            # load element
+            elem_loc = loc + e_disp_table[i]
+            read_record_stream(binfile, elem_loc, <void*>tmp_buf,
+                               &prec_flag, &type_flag, &size)
 
-        # start of the element
-        elem_off[i] = c
+            # start of the element
+            elem_off[i] = c
 
-        # always cast in the unlikely case where elements are stored
-        # as short
-        if prec_flag:
-            for j in range(size):
-                elem[c + j] = <int>(<short*>tmp_buf)[j]
-        else:
-            for j in range(size):
-                elem[c + j] = (<int*>tmp_buf)[j]
-        c += size
+            # always cast in the unlikely case where elements are stored
+            # as short
+            if prec_flag:
+                for j in range(size):
+                    elem[c + j] = <int>(<short*>tmp_buf)[j]
+            else:
+                for j in range(size):
+                    elem[c + j] = (<int*>tmp_buf)[j]
+            c += size
 
     # add final position here for parser to know the size of the last element
     elem_off[nelem] = c
@@ -333,16 +371,18 @@ def read_element_stress(filename, int64_t [::1] ele_ind_table,
     cdef char* c_filename = py_bytes
     cdef ifstream* binfile = new ifstream(c_filename, binary)
 
-    cdef int i
+    cdef int i, nnode_elem
     cdef int c = 0
-    for i in range(len(ele_ind_table)):
-        nnode_elem = nodstr[etype[i]]
+    cdef int nelem = ele_ind_table.shape[0]
+    with nogil:
+        for i in range(nelem):
+            nnode_elem = nodstr[etype[i]]
 
-        if ele_ind_table[i] != 0:
-            read_element_result(binfile, ele_ind_table[i] + ptr_off,
-                                PTR_ENS_IDX, nnode_elem, nitem,
-                                &ele_data_arr[c, 0], as_global)
-            c += nnode_elem
+            if ele_ind_table[i] != 0:
+                read_element_result(binfile, ele_ind_table[i] + ptr_off,
+                                    PTR_ENS_IDX, nnode_elem, nitem,
+                                    &ele_data_arr[c, 0], as_global)
+                c += nnode_elem
 
     # this isn't collected automatically, must close manually
     del binfile
@@ -488,7 +528,7 @@ def populate_surface_element_result(filename,
 cdef inline int read_element_result(ifstream *binfile, int64_t ele_table,
                                     int result_index,
                                     int nnode_elem, int nitem, double *arr,
-                                    int as_global=1):
+                                    int as_global=1) nogil:
     """Populate array with results from a single element"""
     cdef int i, j, k, c, nitems
     cdef int [4096] pointers  # tmp array of pointers
@@ -634,7 +674,7 @@ cdef inline void euler_rotate_shell(float_or_double *arr,
 
 cdef inline void euler_rotate(float_or_double *arr,
                               float_or_double [64] eulerangles, int nitem,
-                              int n_node):
+                              int n_node) nogil:
     """Performs a 3-1-2 euler rotation given thxy, thyz, thzx in
     ``eulerangles`` on the stress values in ``arr``
 
@@ -770,40 +810,41 @@ def read_nodal_values(filename, uint8 [::1] celltypes,
     cdef int ptr_result, skip
     cdef int c = 0
     cdef uint8 celltype
-    for i in range(ncells):
+    with nogil:
+        for i in range(ncells):
 
-        # read element data
-        nnode_elem = nodstr[etype[i]]
-        if ele_ind_table[i] == 0:  # element contains no data
-            continue
-        else:
-            skip = read_element_result(binfile, ele_ind_table[i] + ptr_off,
-                                       result_index, nnode_elem, nitems,
-                                       &bufferdata[0, 0])
-            if skip:
+            # read element data
+            nnode_elem = nodstr[etype[i]]
+            if ele_ind_table[i] == 0:  # element contains no data
                 continue
+            else:
+                skip = read_element_result(binfile, ele_ind_table[i] + ptr_off,
+                                           result_index, nnode_elem, nitems,
+                                           &bufferdata[0, 0])
+                if skip:
+                    continue
 
-        # Get the nodes in the element
-        celltype = celltypes[i]
-        offset = offsets[i] + 1
-
-        if celltype == VTK_LINE:
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 2)
-        elif celltype == VTK_TRIANGLE:  # untested
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 3)
-        elif celltype == VTK_QUAD or celltype == VTK_QUADRATIC_QUAD:
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 4)
-        elif celltype == VTK_HEXAHEDRON:
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 8)
-        elif celltype == VTK_PYRAMID:
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 5)
-        elif celltype == VTK_TETRA:  # dependent on element type
-            if nodstr[etype[i]] == 4:
+            # Get the nodes in the element
+            celltype = celltypes[i]
+            offset = offsets[i] + 1
+
+            if celltype == VTK_LINE:
+                read_element(cells, offset, ncount, data, bufferdata, nitems, 2)
+            elif celltype == VTK_TRIANGLE:  # untested
+                read_element(cells, offset, ncount, data, bufferdata, nitems, 3)
+            elif celltype == VTK_QUAD or celltype == VTK_QUADRATIC_QUAD:
                 read_element(cells, offset, ncount, data, bufferdata, nitems, 4)
-            else:
-                read_tetrahedral(cells, offset, ncount, data, bufferdata, nitems)
-        elif celltype == VTK_WEDGE:
-            read_wedge(cells, offset, ncount, data, bufferdata, nitems)
+            elif celltype == VTK_HEXAHEDRON:
+                read_element(cells, offset, ncount, data, bufferdata, nitems, 8)
+            elif celltype == VTK_PYRAMID:
+                read_element(cells, offset, ncount, data, bufferdata, nitems, 5)
+            elif celltype == VTK_TETRA:  # dependent on element type
+                if nodstr[etype[i]] == 4:
+                    read_element(cells, offset, ncount, data, bufferdata, nitems, 4)
+                else:
+                    read_tetrahedral(cells, offset, ncount, data, bufferdata, nitems)
+            elif celltype == VTK_WEDGE:
+                read_wedge(cells, offset, ncount, data, bufferdata, nitems)
     del binfile
 
     return np.asarray(data), np.asarray(ncount)
@@ -882,45 +923,46 @@ def read_nodal_values_dist(filename,
     cdef int64_t ele_table, nnode_elem
     cdef int ptr_result, skip
     cdef uint8 celltype
-    for i in range(ncells):
+    with nogil:
+        for i in range(ncells):
 
-        # read element data
-        nnode_elem = nodstr[etype[i]]  # global
-        if ele_ind_table[i] == 0:  # element contains no data
-            c += 1  # global solution cell index
-            continue
-        else:
-            skip = read_element_result(binfile, ele_ind_table[i] + ptr_off,
-                                       result_index, nnode_elem, nitems,
-                                       &bufferdata[0, 0])
-            if skip:
+            # read element data
+            nnode_elem = nodstr[etype[i]]  # global
+            if ele_ind_table[i] == 0:  # element contains no data
                 c += 1  # global solution cell index
                 continue
-
-        # Get number of nodes in the global element
-        celltype = celltypes[c]
-        offset = offsets[c] + 1
-        # NOTE: value at offsets[c] is the number of points in cell
-
-        if celltype == VTK_LINE:
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 2)
-        elif celltype == VTK_TRIANGLE:  # untested
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 3)
-        elif celltype == VTK_QUAD or celltype == VTK_QUADRATIC_QUAD:
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 4)
-        elif celltype == VTK_HEXAHEDRON:
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 8)
-        elif celltype == VTK_PYRAMID:
-            read_element(cells, offset, ncount, data, bufferdata, nitems, 5)
-        elif celltype == VTK_TETRA:  # dependent on element type
-            if nodstr[etype[i]] == 4:
-                read_element(cells, offset, ncount, data, bufferdata, nitems, 4)
             else:
-                read_tetrahedral(cells, offset, ncount, data, bufferdata, nitems)
-        elif celltype == VTK_WEDGE:
-            read_wedge(cells, offset, ncount, data, bufferdata, nitems)
+                skip = read_element_result(binfile, ele_ind_table[i] + ptr_off,
+                                           result_index, nnode_elem, nitems,
+                                           &bufferdata[0, 0])
+                if skip:
+                    c += 1  # global solution cell index
+                    continue
+
+            # Get number of nodes in the global element
+            celltype = celltypes[c]
+            offset = offsets[c] + 1
+            # NOTE: value at offsets[c] is the number of points in cell
+
+            if celltype == VTK_LINE:
+                read_element(cells, offset, ncount, data, bufferdata, nitems, 2)
+            elif celltype == VTK_TRIANGLE:  # untested
+                read_element(cells, offset, ncount, data, bufferdata, nitems, 3)
+            elif celltype == VTK_QUAD or celltype == VTK_QUADRATIC_QUAD:
+                read_element(cells, offset, ncount, data, bufferdata, nitems, 4)
+            elif celltype == VTK_HEXAHEDRON:
+                read_element(cells, offset, ncount, data, bufferdata, nitems, 8)
+            elif celltype == VTK_PYRAMID:
+                read_element(cells, offset, ncount, data, bufferdata, nitems, 5)
+            elif celltype == VTK_TETRA:  # dependent on element type
+                if nodstr[etype[i]] == 4:
+                    read_element(cells, offset, ncount, data, bufferdata, nitems, 4)
+                else:
+                    read_tetrahedral(cells, offset, ncount, data, bufferdata, nitems)
+            elif celltype == VTK_WEDGE:
+                read_wedge(cells, offset, ncount, data, bufferdata, nitems)
 
-        c += 1  # global solution cell index
+            c += 1  # global solution cell index
 
     # this isn't collected automatically, must close manually
     del binfile
@@ -1000,99 +1042,442 @@ cdef inline void read_element(int64_t [::1] cells, int64_t index, int [::1] ncou
             data[cell, j] += bufferdata[i, j]
 
 
-def read_array(filename, int ptr, int nterm, int neqn, int [::1] const):
-    """Reads stiffness or mass matrices from ANSYS fortran files
+def read_full_matrix(filename, int64_t ptr, int neqn, int nout,
+                     int [::1] index):
+    """Stream a stiffness or mass matrix from an ANSYS full file into
+    the compressed sparse column arrays of its upper triangle.
+
+    The matrix is stored as a pair of records for each equation
+    containing the (one based) row indices and values of the column.
+    The file is read twice, a column at a time.  The first pass counts
+    the entries of each output column and the second pass writes the
+    entries directly into their columns, so the memory required is
+    the size of the output arrays.
 
     Parameters
     ----------
-    filename : string
-        Full filename
-        
-    ptr: int
-        Pointer to start of block
-        
-    nterm : int
-        Number of terms to read.
-        
+    filename : str
+        Full filename.
+
+    ptr : int64_t
+        Pointer to start of the matrix.
+
     neqn : int
-        Number of equations
-        
-    const : numpy int array
-        If DOF is fixed
+        Number of equations.
+
+    nout : int
+        Number of rows and columns of the output matrix.
+
+    index : int [::1] np.ndarray
+        Output row and column of each equation.  Entries of equations
+        with a negative index, such as constrained DOF, are skipped.
 
     Returns
     -------
-    rows : numpy int32 array
-        Row indices
-    
-    cols : numpy int32 array
-        Column indices
-    
-    data : numpy double array
-        Data belonging to (row, col)
-    
-    diag : numpy int32 array
-        Indices along the diag (diag[i], diag[i])
-    
-    data_diag : numpy double array
-        Data belonging to the diag entries
+    indptr : np.ndarray
+        Column pointers.
+
+    indices : np.ndarray
+        Row indices of each entry.
+
+    data : np.ndarray
+        Value of each entry.
+
+    Notes
+    -----
+    Entries within each column are not sorted.
     """
+    cdef bytes c_filename = filename.encode()
+    cdef ifstream* binfile = new ifstream(<char*>c_filename, binary)
 
-    cdef int i, j, k, ind
-    cdef bytes buf
-    with open(filename, "rb") as f:
-        f.seek(ptr*4)
-        buf = f.read((neqn*6 + nterm*3)*4)
+    cdef int i, j, nitems, row, col, out_row, out_col
+    cdef int header[2]
+    cdef char[12] skip_buf
+    cdef int64_t loc, pos
 
-    cdef char * p = buf # python to c character array pointer
-    cdef int loc = 0 # location long buffer
+    # I/O counters, added once the matrix is read
+    cdef int64_t nrecords = 0, nbytes = 0
 
-    # Number of terms is the number of terms stored in the upper triangle
-    cdef int [::1] krow = np.empty(nterm, np.int32)
-    cdef int [::1] kcol = np.empty(nterm, np.int32)
-    cdef double [::1] kdata = np.empty(nterm)
+    # column buffers, grown as needed
+    cdef int capacity = 0
+    cdef int* rows = NULL
+    cdef double* values = NULL
 
-    cdef int [::1] kdiag = np.empty(neqn, np.int32)
-    cdef double [::1] kdata_diag = np.empty(neqn)
+    # count the entries of each column
+    cdef int64_t [::1] indptr = np.zeros(nout + 1, np.int64)
+    with nogil:
+        loc = ptr*4
+        for i in range(neqn):
+            binfile.seekg(loc)
+            binfile.read(<char*>header, 8)
+            nitems = header[0]
+            if nitems > capacity:
+                capacity = nitems
+                free(rows)
+                free(values)
+                rows = <int*>malloc(capacity*sizeof(int))
+                values = <double*>malloc(capacity*sizeof(double))
+            binfile.read(<char*>rows, 4*nitems)
+            nrecords += 1
+            nbytes += 8 + 4*<int64_t>nitems
+
+            # index record, data record header, data record
+            loc += 24 + 12*<int64_t>nitems
+
+            col = index[i]
+            if col < 0:
+                continue
+            for j in range(nitems):
+                row = index[rows[j] - 1]
+                if row < 0:
+                    continue
+                if row > col:
+                    indptr[row + 1] += 1
+                else:
+                    indptr[col + 1] += 1
+
+        for i in range(nout):
+            indptr[i + 1] += indptr[i]
+
+    cdef int64_t nnz = indptr[nout]
+    cdef int [::1] indices = np.empty(nnz, np.int32)
+    cdef double [::1] data = np.empty(nnz, np.float64)
+    cdef int64_t [::1] fill = np.array(indptr[:nout])
+
+    # write each entry into its column
+    with nogil:
+        binfile.seekg(ptr*4)
+        for i in range(neqn):
+            binfile.read(<char*>header, 8)
+            nitems = header[0]
+            binfile.read(<char*>rows, 4*nitems)
+            binfile.read(skip_buf, 12)
+            binfile.read(<char*>values, 8*nitems)
+            binfile.read(skip_buf, 4)
+            nrecords += 2
+            nbytes += 24 + 12*<int64_t>nitems
+
+            col = index[i]
+            if col < 0:
+                continue
+            for j in range(nitems):
+                row = index[rows[j] - 1]
+                if row < 0:
+                    continue
+                if row > col:
+                    out_row, out_col = col, row
+                else:
+                    out_row, out_col = row, col
+                pos = fill[out_col]
+                indices[pos] = out_row
+                data[pos] = values[j]
+                fill[out_col] += 1
+
+    free(rows)
+    free(values)
+    del binfile
 
-    cdef int c = 0 # index counter
-    cdef int d = 0 # data counter
-    cdef int c_diag = 0 # diag counter
-    cdef int row, col, nitems, intval
-    cdef double val
+    # one seek for each column of the first pass and one for the second
+    io_stats_add(nrecords, nbytes, 0, nrecords, neqn + 1)
 
-    for i in range(neqn):
-        col = i
+    return np.asarray(indptr), np.asarray(indices), np.asarray(data)
 
-        # number of items to read
-        nitems = get_int(&p[loc]); loc += 4
-        loc += 4
 
-        # Read indices
-        for j in range(nitems):
-            # get row number
-            row = get_int(&p[loc]) - 1; loc += 4 # convert to c indexing
+def read_element_matrices(filename, int64_t [::1] ptrs, int [::1] keys):
+    """Read the DOF index tables, matrices and load vectors of many
+    elements from an ANSYS element matrix file.
 
-            if row < col:
-                krow[c] = row
-                kcol[c] = col
-            else:
-                krow[c] = col
-                kcol[c] = row
-            c += 1
+    The file is read twice using a single handle.  The first pass
+    reads the record headers of each element to size the output
+    arrays and the second pass reads the records directly into them.
 
-        loc += 12
-            
-        # Read data
-        for j in range(nitems):
-            # Store data
-            kdata[d] = get_double(&p[loc]); loc += 8
-            d += 1
+    Parameters
+    ----------
+    filename : str
+        Element matrix filename.
+
+    ptrs : int64_t [::1] np.ndarray
+        Pointer to the start of each element.
+
+    keys : int [::1] np.ndarray
+        Read the stiffness, mass, damping and stress stiffening
+        matrices and the applied force, newton raphson and imaginary
+        load vectors when the corresponding entry is nonzero.
+
+    Returns
+    -------
+    dof_ptr : np.ndarray
+        Position of the DOF index table of each element within
+        ``dof_idx``.
+
+    dof_idx : np.ndarray
+        Zero based DOF index tables of each element.
+
+    data_ptr : np.ndarray
+        Position of the record of each element within each data
+        array.  Shape ``(7, nelem + 1)``.
+
+    data : list
+        Values of each of the seven record types.  ``None`` when not
+        read.
+    """
+    cdef bytes c_filename = filename.encode()
+    cdef ifstream* binfile = new ifstream(<char*>c_filename, binary)
+
+    cdef int nelem = ptrs.shape[0]
+    cdef int i, j, k, size
+    cdef int header[2]
+    cdef int elem_header[10]
+    cdef int64_t loc
+
+    # size each record of each element
+    cdef int64_t [::1] dof_ptr = np.zeros(nelem + 1, np.int64)
+    cdef int64_t [:, ::1] data_ptr = np.zeros((7, nelem + 1), np.int64)
+    with nogil:
+        for i in range(nelem):
+            loc = ptrs[i]*4
+            binfile.seekg(loc)
+            binfile.read(<char*>header, 8)
+            binfile.read(<char*>elem_header, 40)
+            loc += 12 + 4*<int64_t>header[0]
+
+            # DOF index table
+            binfile.seekg(loc)
+            binfile.read(<char*>header, 8)
+            dof_ptr[i + 1] = dof_ptr[i] + header[0]
+            loc += 12 + 4*<int64_t>header[0]
+
+            for k in range(7):
+                data_ptr[k, i + 1] = data_ptr[k, i]
+                if not elem_header[k]:
+                    continue
+                binfile.seekg(loc)
+                binfile.read(<char*>header, 8)
+                loc += 12 + 4*<int64_t>header[0]
+                if keys[k]:
+                    data_ptr[k, i + 1] += header[0]//2
+
+    cdef int [::1] dof_idx = np.empty(dof_ptr[nelem], np.int32)
+    cdef np.ndarray arr
+    cdef double* data_p[7]
+    data = []
+    for k in range(7):
+        data_p[k] = NULL
+        if keys[k]:
+            arr = np.empty(data_ptr[k, nelem], np.float64)
+            data_p[k] = <double*>arr.data
+            data.append(arr)
+        else:
+            data.append(None)
+
+    # read the records into the output arrays
+    with nogil:
+        for i in range(nelem):
+            loc = ptrs[i]*4
+            binfile.seekg(loc)
+            binfile.read(<char*>header, 8)
+            binfile.read(<char*>elem_header, 40)
+            loc += 12 + 4*<int64_t>header[0]
+
+            binfile.seekg(loc)
+            binfile.read(<char*>header, 8)
+            if header[0]:
+                binfile.read(<char*>&dof_idx[dof_ptr[i]], 4*header[0])
+            loc += 12 + 4*<int64_t>header[0]
+
+            for k in range(7):
+                if not elem_header[k]:
+                    continue
+                binfile.seekg(loc)
+                binfile.read(<char*>header, 8)
+                loc += 12 + 4*<int64_t>header[0]
+                if keys[k]:
+                    binfile.read(<char*>&data_p[k][data_ptr[k, i]],
+                                 4*header[0])
+
+        # adjust for one based indexing
+        for j in range(dof_idx.shape[0]):
+            dof_idx[j] -= 1
+
+    del binfile
 
-        # seek past end of data
-        loc += 4
+    return np.asarray(dof_ptr), np.asarray(dof_idx), np.asarray(data_ptr), data
 
-    return np.asarray(krow)[:c], np.asarray(kcol)[:c], np.asarray(kdata)[:c]
+
+cdef int compare_int(const void* a, const void* b) nogil:
+    return (<int*>a)[0] - (<int*>b)[0]
+
+
+def element_matrix_pattern(int64_t [::1] dof_ptr, int [::1] dof_idx, int n):
+    """Sparsity pattern of the upper triangle of a global matrix
+    assembled from element matrices.
+
+    Parameters
+    ----------
+    dof_ptr : int64_t [::1] np.ndarray
+        Position of the DOF of each element within ``dof_idx``.
+
+    dof_idx : int [::1] np.ndarray
+        Global row and column of each DOF of each element.  Negative
+        entries are skipped.
+
+    n : int
+        Number of rows and columns of the global matrix.
+
+    Returns
+    -------
+    indptr : np.ndarray
+        Column pointers.
+
+    indices : np.ndarray
+        Sorted row indices of each column.
+    """
+    cdef int nelem = dof_ptr.shape[0] - 1
+    cdef int i, c, r
+    cdef int64_t j, k, e, pos
+
+    # elements containing each DOF
+    cdef int64_t [::1] elem_ptr = np.zeros(n + 1, np.int64)
+    cdef int [::1] elem_list = np.empty(dof_idx.shape[0], np.int32)
+    cdef int64_t [::1] fill = np.empty(n, np.int64)
+    with nogil:
+        for j in range(dof_idx.shape[0]):
+            if dof_idx[j] >= 0:
+                elem_ptr[dof_idx[j] + 1] += 1
+        for c in range(n):
+            elem_ptr[c + 1] += elem_ptr[c]
+            fill[c] = elem_ptr[c]
+        for i in range(nelem):
+            for j in range(dof_ptr[i], dof_ptr[i + 1]):
+                c = dof_idx[j]
+                if c >= 0:
+                    elem_list[fill[c]] = i
+                    fill[c] += 1
+
+    # count the unique rows of each column
+    cdef int [::1] marker = np.full(n, -1, np.int32)
+    cdef int64_t [::1] indptr = np.zeros(n + 1, np.int64)
+    with nogil:
+        for c in range(n):
+            indptr[c + 1] = indptr[c]
+            for k in range(elem_ptr[c], elem_ptr[c + 1]):
+                e = elem_list[k]
+                for j in range(dof_ptr[e], dof_ptr[e + 1]):
+                    r = dof_idx[j]
+                    if r < 0 or r > c or marker[r] == c:
+                        continue
+                    marker[r] = c
+                    indptr[c + 1] += 1
+
+    # fill and sort the rows of each column
+    cdef int [::1] indices = np.empty(indptr[n], np.int32)
+    with nogil:
+        for c in range(n):
+            marker[c] = -1
+        for c in range(n):
+            pos = indptr[c]
+            for k in range(elem_ptr[c], elem_ptr[c + 1]):
+                e = elem_list[k]
+                for j in range(dof_ptr[e], dof_ptr[e + 1]):
+                    r = dof_idx[j]
+                    if r < 0 or r > c or marker[r] == c:
+                        continue
+                    marker[r] = c
+                    indices[pos] = r
+                    pos += 1
+            if pos > indptr[c]:
+                qsort(&indices[indptr[c]], pos - indptr[c], sizeof(int),
+                      compare_int)
+
+    return np.asarray(indptr), np.asarray(indices)
+
+
+def accumulate_element_matrices(int64_t [::1] dof_ptr, int [::1] dof_idx,
+                                int64_t [::1] ptr, double [::1] values,
+                                int64_t [::1] indptr, int [::1] indices,
+                                double [::1] data, int col_start,
+                                int col_stop):
+    """Add the upper triangle of symmetric element matrices to the
+    columns ``col_start`` to ``col_stop`` of a global matrix.
+
+    Element matrices are stored either as their lower triangular
+    terms by row or as their diagonal.  Columns outside the range are
+    skipped, allowing disjoint column ranges to be accumulated
+    concurrently.
+
+    Parameters
+    ----------
+    dof_ptr : int64_t [::1] np.ndarray
+        Position of the DOF of each element within ``dof_idx``.
+
+    dof_idx : int [::1] np.ndarray
+        Global row and column of each DOF of each element.  Negative
+        entries are skipped.
+
+    ptr : int64_t [::1] np.ndarray
+        Position of the matrix of each element within ``values``.
+
+    values : double [::1] np.ndarray
+        Packed element matrices.
+
+    indptr : int64_t [::1] np.ndarray
+        Column pointers of the global matrix.
+
+    indices : int [::1] np.ndarray
+        Sorted row indices of each column of the global matrix.
+
+    data : double [::1] np.ndarray
+        Values of the global matrix.  Modified in place.
+
+    col_start : int
+        First column to accumulate.
+
+    col_stop : int
+        Column after the last column to accumulate.
+    """
+    cdef int nelem = dof_ptr.shape[0] - 1
+    cdef int e, i, j, nrow, r, c
+    cdef int64_t off, voff, lo, hi, mid
+    cdef bint diagonal
+    cdef double val
+
+    with nogil:
+        for e in range(nelem):
+            nrow = dof_ptr[e + 1] - dof_ptr[e]
+            if ptr[e + 1] == ptr[e]:
+                continue
+            off = dof_ptr[e]
+            voff = ptr[e]
+            diagonal = ptr[e + 1] - ptr[e] != nrow*(nrow + 1)//2
+
+            for j in range(nrow):
+                c = dof_idx[off + j]
+                if c < col_start or c >= col_stop:
+                    continue
+
+                for i in range(nrow):
+                    r = dof_idx[off + i]
+                    if r < 0 or r > c:
+                        continue
+                    if diagonal:
+                        if i != j:
+                            continue
+                        val = values[voff + i]
+                    elif i >= j:
+                        val = values[voff + i*(i + 1)//2 + j]
+                    else:
+                        val = values[voff + j*(j + 1)//2 + i]
+
+                    # locate the row within the column
+                    lo = indptr[c]
+                    hi = indptr[c + 1] - 1
+                    while lo < hi:
+                        mid = (lo + hi)//2
+                        if indices[mid] < r:
+                            lo = mid + 1
+                        else:
+                            hi = mid
+                    data[lo] += val
 
 
 def sort_nodal_eqlv(int neqn, int [::1] neqv, int [::1] ndof):
@@ -1481,6 +1866,106 @@ def affline_transform(float_or_double [:, ::1] points, float_or_double [:, ::1]
         points[i, 2] = t20*x + t21*y + t22*z + t23
 
 
+cdef void rotate_sector(double [:, :, ::1] data, double [:, :, ::1] matrices,
+                        int k, int kind) nogil:
+    """Rotates the vectors or tensors of a single sector in place"""
+    cdef int nnode = data.shape[1]
+    cdef int ncomp = data.shape[2]
+    cdef int i, j, l, m
+    cdef double x, y, z
+    cdef double shear = 1
+    cdef double [3][3] rot
+    cdef double [3][3] tensor
+    cdef double [3][3] temp
+
+    for j in range(3):
+        for l in range(3):
+            rot[j][l] = matrices[k, j, l]
+
+    if kind == 0:  # vector with translation
+        for i in range(nnode):
+            x = data[k, i, 0]
+            y = data[k, i, 1] if ncomp > 1 else 0
+            z = data[k, i, 2] if ncomp > 2 else 0
+            for j in range(min(ncomp, 3)):
+                data[k, i, j] = rot[j][0]*x + rot[j][1]*y + rot[j][2]*z + matrices[k, j, 3]
+        return
+
+    # strain shear components are engineering strains
+    if kind == 2:
+        shear = 0.5
+
+    for i in range(nnode):
+        if npy_isnan(data[k, i, 0]):
+            continue
+
+        tensor[0][0] = data[k, i, 0]
+        tensor[1][1] = data[k, i, 1]
+        tensor[2][2] = data[k, i, 2]
+        tensor[0][1] = data[k, i, 3]*shear
+        tensor[1][0] = tensor[0][1]
+        tensor[1][2] = data[k, i, 4]*shear
+        tensor[2][1] = tensor[1][2]
+        tensor[0][2] = data[k, i, 5]*shear
+        tensor[2][0] = tensor[0][2]
+
+        # R*tensor
+        for j in range(3):
+            for l in range(3):
+                temp[j][l] = 0
+                for m in range(3):
+                    temp[j][l] += rot[j][m]*tensor[m][l]
+
+        # R*tensor*R.T
+        for j in range(3):
+            for l in range(j, 3):
+                tensor[j][l] = 0
+                for m in range(3):
+                    tensor[j][l] += temp[j][m]*rot[l][m]
+
+        data[k, i, 0] = tensor[0][0]
+        data[k, i, 1] = tensor[1][1]
+        data[k, i, 2] = tensor[2][2]
+        data[k, i, 3] = tensor[0][1]/shear
+        data[k, i, 4] = tensor[1][2]/shear
+        data[k, i, 5] = tensor[0][2]/shear
+
+
+def rotate_sectors(double [:, :, ::1] data, double [:, :, ::1] matrices,
+                   int kind):
+    """Rotates the results of many sectors in place.
+
+    Sectors are rotated in parallel when built with OpenMP and
+    serially otherwise.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        ``(n_sector, nnode, ncomp)`` array of sector results.
+
+    matrices : np.ndarray
+        ``(n_sector, 4, 4)`` transformation matrix of each sector.
+
+    kind : int
+        ``0`` to transform vectors stored in the first three
+        components, including the translation of the matrix.  ``1``
+        to rotate stress tensors and ``2`` to rotate strain tensors
+        stored in the order XX, YY, ZZ, XY, YZ, XZ.  Additional
+        components are not modified, and tensors of nodes with a NAN
+        XX component are skipped.
+    """
+    cdef int nsector = data.shape[0]
+    cdef int k
+
+    if matrices.shape[0] != nsector:
+        raise ValueError('Number of matrices must match the number of sectors')
+    if kind and data.shape[2] < 6:
+        raise ValueError('Tensors must contain at least 6 components')
+
+    for k in prange(nsector, nogil=True):
+        rotate_sector(data, matrices, k, kind)
+
+
 cdef inline int cell_lookup(uint8 celltype) nogil:
     if celltype == VTK_HEXAHEDRON or celltype == VTK_QUADRATIC_HEXAHEDRON:
         return 8
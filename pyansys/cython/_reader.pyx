@@ -11,29 +11,39 @@ from libc.string cimport strncpy, strcmp
 from libc.stdint cimport int64_t
 ctypedef unsigned char uint8_t
 
+from concurrent.futures import ThreadPoolExecutor
 import ctypes
+from itertools import repeat
+import os
 
 import numpy as np
 cimport numpy as np
 
 
-cdef extern from "reader.h":
+cdef extern from "reader.h" nogil:
     int read_nblock_from_nwrite(char*, int*, double*, int)
-    int read_nblock(char*, int*, double*, int, int*, int, int*)
-    int read_eblock(char*, int*, int*, int, int, int*)
+    int read_nblock(char*, int*, double*, int, int*, int, int64_t*)
+    int read_nblock_chunk(char*, int*, double*, int, int*, int)
+    int64_t index_nblock(const char*, int64_t, int64_t, int64_t, int64_t*,
+                         int64_t, int64_t*)
+    int read_eblock(char*, int*, int*, int, int, int64_t*)
+    int read_eblock_chunk(char*, int*, int*, int, int, int)
+    int index_eblock(char*, int64_t, int64_t, int, int, int, int64_t,
+                     int64_t*, int*, int64_t, int*, int64_t*)
     int write_array_ascii(const char*, const double*, int nvalues);
 
 cdef extern from 'vtk_support.h':
     int ans_to_vtk(const int, const int*, const int*, const int*, const int,
     const int*, int64_t*, int64_t*, uint8_t*, const int)
 
-cdef int myfgets(char *outstr, char *instr, int *n, int fsize):
+cdef int myfgets(char *outstr, char *instr, int64_t *n, int64_t fsize):
     """Copies a single line from instr to outstr starting from position n """
     
-    cdef int k = n[0]
+    cdef int64_t k = n[0]
     
     # Search line at a maximum of 10000 characters
-    cdef int i, c
+    cdef int i
+    cdef int64_t c
     c = n[0]
     for i in range(1000):
         # check if end of file
@@ -58,7 +68,7 @@ cdef int myfgets(char *outstr, char *instr, int *n, int fsize):
     return 1
 
 
-def py_read_eblock(char *raw, int n, char *line, int fsize):
+def py_read_eblock(char *raw, int64_t n, char *line, int64_t fsize):
     """Read the eblock
 
     The format of the element "block" is as follows for the SOLID format:
@@ -113,8 +123,173 @@ additional node numbers if there are more than eight.
     return elem_sz, elem, elem_off
 
 
-def read(filename, read_parameters=False, debug=False):
-    """Read blocked ansys archive file."""
+def _read_eblock_chunk(char [::1] raw, int64_t pos, int [::1] elem_off,
+                       int [::1] elem, int first, int nelem, int isz, int c):
+    """Read a chunk of the elements of an EBLOCK"""
+    with nogil:
+        read_eblock_chunk(&raw[pos], &elem_off[first], &elem[0], nelem, isz, c)
+
+
+def read_eblock_parallel(char [::1] raw, int64_t n, line, max_workers=None):
+    """Read the eblock using multiple threads.
+
+    The elements of the block are located without parsing them, and
+    the block is then split into chunks of elements that are parsed
+    concurrently.  See ``py_read_eblock`` for the format of the block.
+
+    Parameters
+    ----------
+    raw : char [::1]
+        Null terminated archive file.
+
+    n : int64_t
+        Position of the line following the EBLOCK command.
+
+    line : bytes
+        EBLOCK command.  For example: ``"EBLOCK,19,SOLID,,3588"``
+
+    max_workers : int, optional
+        Maximum number of threads.  Defaults to the number of
+        processors.
+
+    Returns
+    -------
+    elem_sz : int
+        Size of the element array.
+
+    elem : np.ndarray
+        Element array.
+
+    elem_off : np.ndarray
+        Indices of the start of each element in ``elem``.
+
+    n : int64_t
+        Position of the end of the elements.
+    """
+    cdef int64_t fsize = raw.shape[0] - 1
+    cdef int nelem = int(line[line.rfind(b',') + 1:])
+    if nelem == 0:
+        raise RuntimeError('Unable to read element block')
+
+    # Get interger block size and the number of fields per line
+    # (19i9)
+    cdef char fmt[1000]
+    myfgets(fmt, &raw[0], &n, fsize)
+    fmt_line = <bytes>fmt
+    cdef int isz = int(fmt_line[fmt_line.find(b'i') + 1:fmt_line.find(b')')])
+    cdef int nperline = int(fmt_line[fmt_line.find(b'(') + 1:fmt_line.find(b'i')])
+
+    # locate chunks of elements
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    cdef int64_t max_chunks = 4*max_workers
+    cdef int64_t chunk_size = max((nelem + max_chunks - 1) // max_chunks, 1024)
+    cdef int64_t [::1] chunk_pos = np.empty(max_chunks, np.int64)
+    cdef int [::1] chunk_c = np.empty(max_chunks, ctypes.c_int)
+    cdef int elem_sz, nread
+    cdef int64_t end
+    with nogil:
+        nread = index_eblock(&raw[0], n, fsize, nelem, isz, nperline,
+                             chunk_size, &chunk_pos[0], &chunk_c[0], max_chunks,
+                             &elem_sz, &end)
+
+    elem = np.empty(max(elem_sz, 1), dtype=ctypes.c_int)
+    elem_off = np.empty(nread + 1, dtype=ctypes.c_int)
+    elem_off[nread] = elem_sz
+
+    nchunk = min((nread + chunk_size - 1) // chunk_size, max_chunks)
+    bounds = [k*chunk_size for k in range(nchunk)] + [nread]
+    with ThreadPoolExecutor(max_workers) as executor:
+        list(executor.map(_read_eblock_chunk, repeat(raw),
+                          np.asarray(chunk_pos[:nchunk]), repeat(elem_off),
+                          repeat(elem), bounds[:nchunk], np.diff(bounds),
+                          repeat(isz), np.asarray(chunk_c[:nchunk])))
+
+    return elem_sz, elem, elem_off, end
+
+
+def _read_nblock_chunk(char [::1] raw, int64_t pos, int [::1] nnum,
+                       double [:, ::1] nodes, int [::1] d_size, int f_size):
+    """Read a chunk of the nodes of an NBLOCK"""
+    with nogil:
+        read_nblock_chunk(&raw[pos], &nnum[0], &nodes[0, 0], nnum.shape[0],
+                          &d_size[0], f_size)
+
+
+def read_nblock_parallel(char [::1] raw, int64_t n, int nnodes,
+                         int [::1] d_size, int f_size, max_workers=None):
+    """Read the nblock using multiple threads.
+
+    The end of the block is located by reading the first character
+    of each line, and the block is then split into chunks of lines
+    that are parsed concurrently.
+
+    Parameters
+    ----------
+    raw : char [::1]
+        Null terminated archive file.
+
+    n : int64_t
+        Position of the first node of the block.
+
+    nnodes : int
+        Number of nodes given by the NBLOCK command.  Used only to
+        size the chunks as this value may be wrong.
+
+    d_size : int [::1]
+        Size of each integer field.
+
+    f_size : int
+        Size of each float field.
+
+    max_workers : int, optional
+        Maximum number of threads.  Defaults to the number of
+        processors.
+
+    Returns
+    -------
+    nnum : np.ndarray
+        Node numbers.
+
+    nodes : np.ndarray
+        Node coordinates and rotations.
+
+    n : int64_t
+        Position of the line following the nodes.
+    """
+    cdef int64_t fsize = raw.shape[0] - 1
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    cdef int64_t max_chunks = 4*max_workers
+    cdef int64_t chunk_size = max((nnodes + max_chunks - 1) // max_chunks, 1024)
+    cdef int64_t [::1] chunk_pos = np.empty(max_chunks, np.int64)
+    cdef int64_t nread, end
+    with nogil:
+        nread = index_nblock(&raw[0], n, fsize, chunk_size, &chunk_pos[0],
+                             max_chunks, &end)
+
+    nnum = np.empty(nread, dtype=ctypes.c_int)
+    nodes = np.empty((nread, 6))
+
+    nchunk = min((nread + chunk_size - 1) // chunk_size, max_chunks)
+    bounds = [k*chunk_size for k in range(nchunk)] + [nread]
+    with ThreadPoolExecutor(max_workers) as executor:
+        list(executor.map(_read_nblock_chunk, repeat(raw),
+                          np.asarray(chunk_pos[:nchunk]),
+                          [nnum[bounds[k]:bounds[k + 1]] for k in range(nchunk)],
+                          [nodes[bounds[k]:bounds[k + 1]] for k in range(nchunk)],
+                          repeat(d_size), repeat(f_size)))
+
+    return nnum, nodes, end
+
+
+def read(filename, read_parameters=False, debug=False, max_workers=1):
+    """Read blocked ansys archive file.
+
+    The NBLOCK and EBLOCK are read using multiple threads when
+    ``max_workers`` is not one.  ``None`` uses the number of
+    processors.
+    """
     badstr = 'Badly formatted cdb file'
     filename_byte_string = filename.encode("UTF-8")
     cdef char* fname = filename_byte_string
@@ -128,15 +303,19 @@ def read(filename, read_parameters=False, debug=False):
 
     # Load entire file to memory
     fseek(cfile, 0, SEEK_END)
-    cdef int fsize = ftell(cfile)
+    cdef int64_t fsize = ftell(cfile)
     fseek(cfile, 0, SEEK_SET)
-    cdef char *raw = < char * >malloc(fsize*sizeof(char))
+    cdef char *raw = < char * >malloc((fsize + 1)*sizeof(char))
     fread(raw, 1, fsize, cfile)
     fclose(cfile)
+    raw[fsize] = 0
+    cdef char [::1] raw_view = <char[:fsize + 1]> raw
+    parallel = max_workers != 1
     
     # File counter
-    cdef int tmpval, start_pos
-    cdef int n = 0
+    cdef int tmpval
+    cdef int64_t start_pos
+    cdef int64_t n = 0
     
     # Define variables
     cdef size_t l = 0
@@ -207,7 +386,12 @@ def read(filename, read_parameters=False, debug=False):
 
                 # only read entries with SOLID
                 if b'SOLID' in line or b'solid' in line:
-                    elem_sz, elem, elem_off = py_read_eblock(raw, n, line, fsize)
+                    if parallel:
+                        elem_sz, elem, elem_off, n = read_eblock_parallel(raw_view, n,
+                                                                          line,
+                                                                          max_workers)
+                    else:
+                        elem_sz, elem, elem_off = py_read_eblock(raw, n, line, fsize)
                     eblock_read = True
 
         elif b'K' == line[0] or b'k' == line[0]:
@@ -313,6 +497,13 @@ def read(filename, read_parameters=False, debug=False):
                     raise RuntimeError('Unable to read nblock format line or '
                                        'at end of file.')
                 d_size, f_size, nfld, nexp = node_block_format(line)
+                if parallel:
+                    nnum, nodes, n = read_nblock_parallel(raw_view, n, nnodes,
+                                                          d_size, f_size,
+                                                          max_workers)
+                    nnodes = nnum.shape[0]
+                    continue
+
                 nnum = np.empty(nnodes, dtype=ctypes.c_int)
                 nodes = np.empty((nnodes, 6))
 
@@ -3,6 +3,7 @@
 #include <stdio.h>
 #include <fstream>
 #include <exception>
+#include <atomic>
 
 // necessary for ubuntu build on azure
 #ifdef __linux__
@@ -37,6 +38,52 @@ static int NbBitsOn( int iVal)
 }
 
 
+// Optional I/O counters.  Only updated while io_stats_enabled is
+// nonzero as the counters are shared by all threads.
+// 0 - records read
+// 1 - bytes read
+// 2 - compressed records
+// 3 - raw records
+// 4 - seeks
+static std::atomic<int> io_stats_enabled(0);
+static std::atomic<int64_t> io_stats[5];
+
+
+void io_stats_enable(int enable){
+  if (enable){
+    io_stats_enabled++;
+  } else if (io_stats_enabled > 0){
+    io_stats_enabled--;
+  }
+}
+
+
+void io_stats_add(int64_t records, int64_t nbytes, int64_t compressed,
+		  int64_t raw, int64_t seeks){
+  if (io_stats_enabled){
+    io_stats[0] += records;
+    io_stats[1] += nbytes;
+    io_stats[2] += compressed;
+    io_stats[3] += raw;
+    io_stats[4] += seeks;
+  }
+}
+
+
+void io_stats_get(int64_t *stats){
+  for (int i=0; i<5; i++){
+    stats[i] = io_stats[i];
+  }
+}
+
+
+static inline void count_seek(){
+  if (io_stats_enabled){
+    io_stats[4]++;
+  }
+}
+
+
 // Read in record and determine size
 // bsparse_flag true when record uses binary compression
 // type_flag true when using integers
@@ -57,6 +104,11 @@ int read_header(ifstream* binFile, int* bsparse_flag, int* wsparse_flag,
   *prec_flag = (raw[7] >> 6) & 1;
   *type_flag = (raw[7] >> 7) & 1;
 
+  if (io_stats_enabled){
+    int compressed = *bsparse_flag || *wsparse_flag || *zlib_flag;
+    io_stats_add(1, 8 + 4*(int64_t)bufsize, compressed, !compressed, 0);
+  }
+
   delete[] raw;
   return bufsize;
 }
@@ -383,6 +435,7 @@ void* read_record(const char* filename, int64_t ptr, int* prec_flag, int* type_f
 
   ifstream binFile (filename, ios::in | ios::binary);
   binFile.seekg(ptr*4);
+  count_seek();
   int bufsize = read_header(&binFile, &bsparse_flag, &wsparse_flag,
 			    &zlib_flag, prec_flag, type_flag);
 
@@ -436,6 +489,7 @@ void read_record_stream(ifstream* file, int64_t loc, void* arr, int* prec_flag,
   // seek to data location if supplied with a pointer
   if (loc >= 0){
     file->seekg(loc*4);
+    count_seek();
   }
 
   int bsparse_flag, wsparse_flag, zlib_flag;
@@ -500,6 +554,7 @@ void read_nodes(const char* filename, int64_t ptrLOC, int nrec, int *nnum,
   char *raw = new char[68*4];
   ifstream binFile (filename, ios::in | ios::binary);
   binFile.seekg(ptrLOC*4);
+  count_seek();
 
   // read remainder of buffer excluding initial bytes and last bytes
   int bufsize, n;
@@ -3,3 +3,6 @@
 void read_nodes(const char*, int64_t, int, int *, double *);
 void* read_record(const char*, int64_t, int*, int*, int*, int*);
 void read_record_stream(std::ifstream*, int64_t, void*, int*, int*, int*);
+void io_stats_enable(int);
+void io_stats_add(int64_t, int64_t, int64_t, int64_t, int64_t);
+void io_stats_get(int64_t *);
@@ -3,6 +3,7 @@
 #include <string.h>
 #include <errno.h>
 #include <math.h>
+#include <stdint.h>
 
 //=============================================================================
 // Fast string to interger convert to ANSYS formatted intergers 
@@ -206,20 +207,17 @@ static inline double ans_strtod2(char *raw, int fltsz){
 
 
 //=============================================================================
-// reads nblock from ANSYS.  Raw string is from Python reader and file is
-// positioned at the start of the data of NBLOCK
+// Parses up to nnodes lines of an NBLOCK starting at *raw and advances
+// *raw past the lines read.
 //
 // Returns
 // -------
 // nnodes_read : int
 //     Number of nodes read.
 //=============================================================================
-int read_nblock(char *raw, int *nnum, double *nodes, int nnodes, int* intsz,
-		int fltsz, int *n){
-
-  // set to start of the NBLOCK
-  raw += n[0];
-  int len_orig = strlen(raw);
+static int parse_nblock(char **raw_ptr, int *nnum, double *nodes, int nnodes,
+			int* intsz, int fltsz){
+  char *raw = *raw_ptr;
   int i, j, i_val, eol;
 
   for (i=0; i<nnodes; i++){
@@ -263,12 +261,88 @@ int read_nblock(char *raw, int *nnum, double *nodes, int nnodes, int* intsz,
     /* printf("\n"); */
   }
 
-  // return file position
-  /* int fpos = len_orig - strlen(raw) + n[0]; */
-  /* return fpos; */
-  n[0] += len_orig - strlen(raw);
+  *raw_ptr = raw;
   return i;
+}
+
 
+//=============================================================================
+// reads nblock from ANSYS.  Raw string is from Python reader and file is
+// positioned at the start of the data of NBLOCK
+//
+// Returns
+// -------
+// nnodes_read : int
+//     Number of nodes read.
+//=============================================================================
+int read_nblock(char *raw, int *nnum, double *nodes, int nnodes, int* intsz,
+		int fltsz, int64_t *n){
+
+  // set to start of the NBLOCK
+  raw += n[0];
+  char *start = raw;
+  int nnodes_read = parse_nblock(&raw, nnum, nodes, nnodes, intsz, fltsz);
+
+  // return file position
+  n[0] += raw - start;
+  return nnodes_read;
+
+}
+
+
+//=============================================================================
+// Reads a chunk of nnodes lines of an NBLOCK starting at raw.  Chunks
+// are located with index_nblock and may be read concurrently.
+//=============================================================================
+int read_nblock_chunk(char *raw, int *nnum, double *nodes, int nnodes,
+		      int* intsz, int fltsz){
+  return parse_nblock(&raw, nnum, nodes, nnodes, intsz, fltsz);
+}
+
+
+//=============================================================================
+// Locates the end of an NBLOCK starting at pos, storing the position
+// of the first line of every chunk of chunk_size nodes.  The block ends
+// at the first line not starting with a node number, such as
+// "N,R5.3,LOC,       -1," or "-1".
+//
+// Returns
+// -------
+// nnodes : int64_t
+//     Number of nodes in the block.
+//=============================================================================
+int64_t index_nblock(const char *raw, int64_t pos, int64_t fsize,
+		     int64_t chunk_size, int64_t *chunk_pos, int64_t max_chunks,
+		     int64_t *end){
+  const char *p, *eol;
+  int64_t nnodes = 0;
+
+  while (pos < fsize){
+    // first non-space character of the line
+    p = raw + pos;
+    while (p < raw + fsize && *p == ' '){
+      ++p;
+    }
+    if (p == raw + fsize || *p < '0' || *p > '9'){
+      break;
+    }
+
+    if (nnodes % chunk_size == 0 && nnodes/chunk_size < max_chunks){
+      chunk_pos[nnodes/chunk_size] = pos;
+    }
+    nnodes++;
+
+    // seek to the next line
+    eol = memchr(p, '\n', raw + fsize - p);
+    if (eol == NULL){
+      pos = fsize;
+      break;
+    }
+    pos = eol - raw + 1;
+  }
+
+  *end = pos;
+  return nnodes;
 }
 
 
@@ -327,41 +401,16 @@ int read_nblock_from_nwrite(const char* filename, int *nnum, double *nodes,
 
 
 
-/* ============================================================================
- * Function:  read_eblock
- *
- * Reads EBLOCK from ANSYS archive file.
- * raw : Raw string is from Python reader
- * 
- * elem_off : Indices of the start of each element in ``elem``
- *
- * elem: Array of elements
- *   Each element contains 10 items plus the nodes belonging to the
- *   element.  The first 10 items are:
- *     mat    - material reference number
- *     type   - element type number
- *     real   - real constant reference number
- *     secnum - section number
- *     esys   - element coordinate system
- *     death  - death flag (0 - alive, 1 - dead)
- *     solidm - solid model reference
- *     shape  - coded shape key
- *     elnum  - element number
- *     baseeid- base element number (applicable to reinforcing elements only
- *     nodes  - The nodes belonging to the element in ANSYS numbering.
- *
- * nelem : Number of elements.
- * 
- * pos : Position of the start of the EBLOCK.
- * ==========================================================================*/
-int read_eblock(char *raw, int *elem_off, int *elem, int nelem, int intsz,
-		int *pos){
+//=============================================================================
+// Parses up to nelem elements of an EBLOCK starting at *raw, writing
+// them to elem starting at *c_ptr, and advances *raw and *c_ptr past
+// the elements read.  See read_eblock for the layout of elem.
+//=============================================================================
+static int parse_eblock(char **raw_ptr, int *elem_off, int *elem, int nelem,
+			int intsz, int *c_ptr){
+  char *raw = *raw_ptr;
   int i, j, nnode;
-
-  // set to start of the EBLOCK
-  raw += pos[0];
-  int len_orig = strlen(raw);
-  int c = 0;  // position in elem array
+  int c = *c_ptr;  // position in elem array
 
   // Loop through elements
   for (i=0; i<nelem; ++i){
@@ -447,8 +496,50 @@ int read_eblock(char *raw, int *elem_off, int *elem, int nelem, int intsz,
 
   }
 
+  *raw_ptr = raw;
+  *c_ptr = c;
+  return i;
+}
+
+
+/* ============================================================================
+ * Function:  read_eblock
+ *
+ * Reads EBLOCK from ANSYS archive file.
+ * raw : Raw string is from Python reader
+ * 
+ * elem_off : Indices of the start of each element in ``elem``
+ *
+ * elem: Array of elements
+ *   Each element contains 10 items plus the nodes belonging to the
+ *   element.  The first 10 items are:
+ *     mat    - material reference number
+ *     type   - element type number
+ *     real   - real constant reference number
+ *     secnum - section number
+ *     esys   - element coordinate system
+ *     death  - death flag (0 - alive, 1 - dead)
+ *     solidm - solid model reference
+ *     shape  - coded shape key
+ *     elnum  - element number
+ *     baseeid- base element number (applicable to reinforcing elements only
+ *     nodes  - The nodes belonging to the element in ANSYS numbering.
+ *
+ * nelem : Number of elements.
+ * 
+ * pos : Position of the start of the EBLOCK.
+ * ==========================================================================*/
+int read_eblock(char *raw, int *elem_off, int *elem, int nelem, int intsz,
+		int64_t *pos){
+  // set to start of the EBLOCK
+  raw += pos[0];
+  char *start = raw;
+  int c = 0;  // position in elem array
+
+  parse_eblock(&raw, elem_off, elem, nelem, intsz, &c);
+
   // update file position
-  *(pos) = len_orig - strlen(raw) + pos[0];
+  *(pos) += raw - start;
 
   // Return total data read
   elem_off[nelem] = c;
@@ -456,6 +547,92 @@ int read_eblock(char *raw, int *elem_off, int *elem, int nelem, int intsz,
 }
 
 
+/* ============================================================================
+ * Function:  read_eblock_chunk
+ *
+ * Reads a chunk of nelem elements of an EBLOCK starting at raw.
+ * Chunks are located with index_eblock and may be read concurrently.
+ *
+ * elem_off : Indices of the start of each element of the chunk in ``elem``
+ *
+ * elem : Array of all elements
+ *
+ * c : Position of the first element of the chunk in ``elem``
+ * ==========================================================================*/
+int read_eblock_chunk(char *raw, int *elem_off, int *elem, int nelem,
+		      int intsz, int c){
+  return parse_eblock(&raw, elem_off, elem, nelem, intsz, &c);
+}
+
+
+/* ============================================================================
+ * Function:  index_eblock
+ *
+ * Locates the elements of an EBLOCK starting at pos without parsing
+ * them, storing the position of the first line and the position
+ * within ``elem`` of every chunk of chunk_size elements.
+ *
+ * nperline : Number of fields per line.  Elements with more nodes
+ * than fit on the first line continue on the following lines.
+ *
+ * elem_sz : Size of the elem array of all elements.
+ *
+ * end : Position of the end of the elements.
+ *
+ * Returns the number of elements in the block, up to nelem.
+ * ==========================================================================*/
+int index_eblock(char *raw, int64_t pos, int64_t fsize, int nelem, int intsz,
+		 int nperline, int64_t chunk_size, int64_t *chunk_pos,
+		 int *chunk_c, int64_t max_chunks, int *elem_sz, int64_t *end){
+  int i, k, nnode, nline;
+  int c = 0;
+  const char *eol;
+
+  for (i=0; i<nelem; ++i){
+    // Check if end of line
+    while (pos < fsize && (raw[pos] == '\r' || raw[pos] == '\n')){
+      ++pos;
+    }
+
+    // Check if at end of the block
+    if (pos + 11*intsz > fsize || checkneg(raw + pos, intsz)){
+      break;
+    }
+
+    if (i % chunk_size == 0 && i/chunk_size < max_chunks){
+      chunk_pos[i/chunk_size] = pos;
+      chunk_c[i/chunk_size] = c;
+    }
+
+    // Field 9: Number of nodes
+    nnode = fast_atoi(raw + pos + 8*intsz, intsz);
+    c += 10 + nnode;
+    if (nnode < 20 && nnode > 10){
+      c += 20 - nnode;
+    }
+
+    // nodes beyond the first line continue on the following lines
+    nline = 1;
+    if (nnode > nperline - 11){
+      nline += (nnode - (nperline - 11) + nperline - 1)/nperline;
+    }
+
+    for (k=0; k<nline; k++){
+      eol = memchr(raw + pos, '\n', fsize - pos);
+      if (eol == NULL){
+	pos = fsize;
+	break;
+      }
+      pos = eol - raw + 1;
+    }
+  }
+
+  *elem_sz = c;
+  *end = pos;
+  return i;
+}
+
+
 // Simply write an array to disk as ASCII
 int write_array_ascii(const char* filename, const double *arr,
 		      const int nvalues){
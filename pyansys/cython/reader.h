@@ -1,4 +1,12 @@
-int read_nblock(char*, int*, double*, int, int*, int, int*);
-int read_eblock(char*, int*, int*, int, int, int*);
+#include <stdint.h>
+
+int read_nblock(char*, int*, double*, int, int*, int, int64_t*);
+int read_nblock_chunk(char*, int*, double*, int, int*, int);
+int64_t index_nblock(const char*, int64_t, int64_t, int64_t, int64_t*, int64_t,
+		     int64_t*);
+int read_eblock(char*, int*, int*, int, int, int64_t*);
+int read_eblock_chunk(char*, int*, int*, int, int, int);
+int index_eblock(char*, int64_t, int64_t, int, int, int, int64_t, int64_t*, int*,
+		 int64_t, int*, int64_t*);
 int read_nblock_from_nwrite(char*, int*, double*, int);
 int write_array_ascii(const char*, const double*, int nvalues);
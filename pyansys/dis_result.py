@@ -1,4 +1,5 @@
 """Handle result files from a distributed MAPDL analysis"""
+from concurrent.futures import ThreadPoolExecutor
 from inspect import currentframe
 import glob
 import os
@@ -6,7 +7,6 @@ from functools import wraps
 
 import pyvista as pv
 import numpy as np
-from vtk import vtkAppendFilter
 
 from pyansys.misc import is_float, vtk_cell_info
 from pyansys.mesh import Mesh
@@ -44,6 +44,132 @@ def find_dis_files(main_file):
     return filenames
 
 
+def _check_coverage(gl_nnum, results):
+    """Verify the result files contain every node of the global index.
+
+    Uses sorted searches rather than testing membership of the global
+    index for each result file.
+    """
+    sorted_nnum = np.sort(gl_nnum)
+    for result in results[1:]:
+        nnum = result.mesh.nnum
+        idx = np.searchsorted(sorted_nnum, nnum).clip(max=sorted_nnum.size - 1)
+        if not np.any(sorted_nnum[idx] == nnum):  # pragma: no cover
+            raise RuntimeError('File %s not part of the distributed result'
+                               % result.filename)
+
+    # merge the sorted nodes of all the result files
+    loaded = np.unique(np.hstack([result.mesh.nnum for result in results]))
+    idx = np.searchsorted(loaded, sorted_nnum).clip(max=loaded.size - 1)
+    if not np.array_equal(loaded[idx], sorted_nnum):
+        filenames = '\n'.join([result.filename for result in results])
+        raise FileNotFoundError('Total nodes loaded from the individual result '
+                                'files does not match the number in the global '
+                                'index.  \n\nResult files found include:\n\n%s' %
+                                filenames)
+
+
+def _global_index(results):
+    """Map the nodes and elements of each result file to the global mesh.
+
+    Nodes are matched by their ANSYS node number rather than by
+    merging coincident points.
+
+    Returns
+    -------
+    index : dict
+        ``'nnum'`` : Sorted global node numbers.
+
+        ``'node_index'`` : Index of each global node within the stacked
+        nodes of all result files.
+
+        ``'node_map'`` : Global index of each of the stacked nodes of all
+        result files.
+
+        ``'rank_npoints'`` : Number of nodes of each result file.
+
+        ``'elem_rank_off'`` : Offset of the elements of each result file
+        within the global elements.
+    """
+    rank_nnum = [result.grid.point_arrays['ansys_node_num'] for result in results]
+    nnum, node_index, node_map = np.unique(np.hstack(rank_nnum),
+                                           return_index=True,
+                                           return_inverse=True)
+    rank_nelem = [result.mesh._elem_off.size - 1 for result in results]
+    return {'nnum': nnum,
+            'node_index': node_index,
+            'node_map': node_map,
+            'rank_npoints': np.array([item.size for item in rank_nnum]),
+            'elem_rank_off': np.cumsum([0] + rank_nelem)}
+
+
+def _grid_filename(filename):
+    """Filename of the cached global grid"""
+    return os.path.splitext(filename)[0] + '.vtu'
+
+
+def _read_global_index(filename, results):
+    """Read a cached global index and global grid.
+
+    Returns ``None`` when the cache is missing, older than any of the
+    result files, or does not match the result files.  Only the
+    headers of the result files are accessed.
+    """
+    grid_filename = _grid_filename(filename)
+    if not (os.path.isfile(filename) and os.path.isfile(grid_filename)):
+        return None
+    mtime = min(os.path.getmtime(filename), os.path.getmtime(grid_filename))
+    if any(os.path.getmtime(result.filename) > mtime for result in results):
+        return None
+
+    with np.load(filename) as data:
+        index = {key: data[key] for key in data.files}
+
+    rank_npoints = [result._geometry_header['nnod'] for result in results]
+    if not np.array_equal(index.get('rank_npoints'), rank_npoints):
+        return None
+
+    index['quadgrid'] = pv.read(grid_filename)
+    return index
+
+
+def _write_global_index(filename, index, quadgrid):
+    """Cache the global index and global grid alongside the result files"""
+    try:
+        np.savez(filename, **index)
+        quadgrid.save(_grid_filename(filename))
+    except OSError:  # pragma: no cover
+        pass  # read only directory
+
+
+class _RankResult(Result):
+    """Result file of a single rank whose mesh is read when first used"""
+
+    # attributes set when storing the mesh
+    _MESH_ATTRIBUTES = ['grid', 'quadgrid', '_insolution', '_c_systems']
+
+    def __init__(self, filename):
+        self._rank_mesh = None
+        super().__init__(filename, read_mesh=False)
+
+    @property
+    def _mesh(self):
+        if self._rank_mesh is None:
+            self._store_mesh()
+        return self._rank_mesh
+
+    @_mesh.setter
+    def _mesh(self, mesh):
+        self._rank_mesh = mesh
+
+    def __getattr__(self, name):
+        if name in self._MESH_ATTRIBUTES and self._rank_mesh is None:
+            self._store_mesh()
+            return getattr(self, name)
+        raise AttributeError("'%s' object has no attribute '%s'"
+                             % (type(self).__name__, name))
+
+
 class DistributedResult(Result):
     """Distributed result file
 
@@ -52,73 +178,74 @@ class DistributedResult(Result):
     main_file : str
         Path of main result file
 
+    max_workers : int, optional
+        Maximum number of threads used to open and read the
+        individual result files.  Defaults to the default of
+        ``concurrent.futures.ThreadPoolExecutor``.
+
+    cache : bool, optional
+        Store the map of the nodes and elements of the individual
+        result files to the global mesh and the global mesh itself
+        in ``.dist.npz`` and ``.dist.vtu`` files alongside the main
+        result file, and load them when newer than the result files.
+        When loaded, the mesh of each individual result file is only
+        read once a result requiring it is accessed.
+
     """
 
-    def __init__(self, main_file):
+    def __init__(self, main_file, max_workers=None, cache=False):
         """Initialize from a series of distributed files"""
+        self._max_workers = max_workers
+
         # find remainder of distributed results
         filenames = find_dis_files(main_file)
 
         # load initial result
         super().__init__(main_file, read_mesh=False)
-        self._results = [Result(main_file)]
 
         # Global number of nodes must not equal the number of nodes in this file
-        if not self._main_result._is_distributed:
+        if not self._is_distributed:
             raise RuntimeError('Result file is not part of a distributed result')
 
-        if not self._main_result._is_main:  # pragma: no cover
+        if not self._is_main:  # pragma: no cover
             raise RuntimeError('DistributedResult must be created from the main '
                                'result file')
 
-        # load and verify
-        ptr = self._main_result._resultheader['ptrGNOD']
-        gl_nnum = self._main_result.read_record(ptr)
-
-        mask = np.in1d(gl_nnum, self._main_result.mesh.nnum, assume_unique=True)
-        for index in range(1, len(filenames)):
-            result = Result(filenames[index])
-            new_mask = np.in1d(gl_nnum, result.mesh.nnum, assume_unique=True)
-            if not new_mask.any():  # pragma: no cover
-                raise RuntimeError('File %s not part of the distributed result'
-                                   % filenames[index])
-            mask += new_mask
-            self._results.append(result)
-
-        if not np.all(mask):
-            filenames = '\n'.join([result.filename for result in self._results])
-            raise FileNotFoundError('Total nodes loaded from the individual result '
-                                    'files does not match the number in the global '
-                                    'index.  \n\nResult files found include:\n\n%s' %
-                                    filenames)
-
-        # assemble the global mesh
-        vtkappend = vtkAppendFilter()
-        vtkappend.MergePointsOn()
-        st = 0
-        for i, result in enumerate(self._results):
-            # map the merged node numbering with the individual mappings
-            result.grid['_dist_idx'] = np.arange(st, st + result.grid.n_points)
-            _result_idx = np.empty(result.grid.n_cells, np.int32)
-            _result_idx[:] = i
-            result.grid.cell_arrays['_result_idx'] = _result_idx
-            st += result.grid.n_points
-            vtkappend.AddInputData(result.grid)
-
-        self._total_sol_nodes = st  # total nodes in all result files
-
-        vtkappend.Update()
-        grid = pv.wrap(vtkappend.GetOutput())
-        # nodes are not sorted here
-
-        # Map nodes from individual results to the global mesh
-        self._glb_idx = grid['_dist_idx']
-
-        # start of each section of the grid
-        # elem_split_ind = np.diff(self.grid['_result_idx']).nonzero()[0]
-        # self._elem_split = np.hstack(([0], elem_split_ind))
-
-        elem = np.hstack(result.mesh._elem for result in self._results)
+        with ThreadPoolExecutor(max_workers) as executor:
+            self._results = list(executor.map(_RankResult,
+                                              [filenames[index] for
+                                               index in sorted(filenames)]))
+
+            index = None
+            if cache:
+                index = _read_global_index(self._cache_filename, self._results)
+
+            if index is None:
+                # parse the meshes of each result file concurrently
+                list(executor.map(_RankResult._store_mesh, self._results))
+
+        if index is None:
+            # load and verify
+            ptr = self._main_result._resultheader['ptrGNOD']
+            gl_nnum = self._main_result.read_record(ptr)
+            _check_coverage(gl_nnum, self._results)
+
+            # map the nodes and elements of each result to the global mesh
+            index = _global_index(self._results)
+            index.update(self._assemble_mesh(index))
+            self._store_global_mesh(index)
+            if cache:
+                _write_global_index(self._cache_filename, index, self.quadgrid)
+        else:
+            self._store_global_mesh(index)
+
+        # self._neqv = self._resultheader['neqv']  # may not need this
+        self._eeqv = self.grid.cell_arrays['ansys_elem_num']
+
+    def _assemble_mesh(self, index):
+        """Assemble the nodes and elements of the global mesh"""
+        points = np.vstack([result.grid.points for result in self._results])
+        elem = np.hstack([result.mesh._elem for result in self._results])
         glb_elem_off = []
         for result in self._results:
             elem_off = result.mesh._elem_off
@@ -129,21 +256,38 @@ class DistributedResult(Result):
                 glb_elem_off.append(elem_off)
 
         # TODO: Add node and element components
-        # resort node numbers
-        self._dist_sort_idx = np.argsort(grid['ansys_node_num'])
-        self._sorted_nnum = grid['ansys_node_num'][self._dist_sort_idx]
-        nodes = grid.points[self._dist_sort_idx]
-
-        glb_elem_off = np.hstack(glb_elem_off)
-        self._mesh = Mesh(self._sorted_nnum, nodes, elem, glb_elem_off,
-                          self._main_result.mesh.ekey)
+        return {'nodes': points[index['node_index']],
+                'elem': elem,
+                'elem_off': np.hstack(glb_elem_off)}
+
+    def _store_global_mesh(self, index):
+        """Store the global mesh and node maps from the global index.
+
+        The global grid is parsed unless ``index`` contains a cached
+        ``'quadgrid'``.
+        """
+        self._sorted_nnum = index['nnum']
+        self._node_index = index['node_index']
+        rank_npoints = index['rank_npoints']
+        split = np.cumsum(rank_npoints)[:-1]
+        self._node_map = np.split(index['node_map'], split)
+        self._elem_rank_off = index['elem_rank_off']
+        self._total_sol_nodes = rank_npoints.sum()  # total nodes in all result files
+
+        self._mesh = Mesh(self._sorted_nnum, index['nodes'], index['elem'],
+                          index['elem_off'], self._element_table['ekey'])
                           # node_comps=ncomp, elem_comps=ecomp)
 
-        self.quadgrid = self._mesh._parse_vtk(fix_midside=False)
+        if 'quadgrid' in index:
+            self.quadgrid = index['quadgrid']
+        else:
+            self.quadgrid = self._mesh._parse_vtk(fix_midside=False)
         self.grid = self.quadgrid.linear_copy()
 
-        # self._neqv = self._resultheader['neqv']  # may not need this
-        self._eeqv = self.grid.cell_arrays['ansys_elem_num']
+    @property
+    def _cache_filename(self):
+        """Filename of the cached global index"""
+        return os.path.splitext(self.filename)[0] + '.dist.npz'
 
     @property
     def _main_result(self):
@@ -161,30 +305,34 @@ class DistributedResult(Result):
         return self._dis_solution(currentframe().f_code.co_name, *args, **kwargs)
 
     def _dis_solution(self, func_name, *args, **kwargs):
-        """Get the distributed solution for a given function"""
-        glb_nnum = []
-        glb_sol = []
-        for result in self._results:
-            func = getattr(result, func_name)
-            rst_nnum, rst_sol = func(*args, **kwargs)
-            glb_nnum.append(rst_nnum)
-            glb_sol.append(rst_sol)
-
-        # resort and organize stacked solutions
-        glb_sol = np.vstack(glb_sol)
-        if glb_sol.shape[0] == self._total_sol_nodes:
-            # not all values from the global solution are unique and
-            # we need to pare this down (due to merging to meshes)
-            glb_sol = glb_sol[self._glb_idx]
-            return self._sorted_nnum, glb_sol[self._dist_sort_idx]
-
-            # return self.mesh.nnum, glb_sol
-        else:  # limited subset of solution
-            # must remap due to how the subset of nodes relate to the
-            # global mesh solution
-            nnum = np.hstack(glb_nnum)
-            u_nnum, idx = np.unique(nnum, return_index=True)
-            return u_nnum, glb_sol[idx]
+        """Get the distributed solution for a given function.
+
+        The solution of each result file is read concurrently and
+        written directly to its nodes within the global solution.
+        """
+        def read(result):
+            return getattr(result, func_name)(*args, **kwargs)
+
+        n_nodes = self._sorted_nnum.size
+        glb_sol = None
+        with ThreadPoolExecutor(self._max_workers) as executor:
+            for i, (rst_nnum, rst_sol) in enumerate(executor.map(read,
+                                                                 self._results)):
+                if glb_sol is None:
+                    glb_sol = np.empty((n_nodes,) + rst_sol.shape[1:],
+                                       rst_sol.dtype)
+                    filled = np.zeros(n_nodes, np.bool_)
+
+                if rst_sol.shape[0] == self._node_map[i].size:
+                    glb_idx = self._node_map[i]
+                else:  # limited subset of solution
+                    glb_idx = np.searchsorted(self._sorted_nnum, rst_nnum)
+                glb_sol[glb_idx] = rst_sol
+                filled[glb_idx] = True
+
+        if filled.all():
+            return self._sorted_nnum, glb_sol
+        return self._sorted_nnum[filled], glb_sol[filled]
 
     def _nodal_result(self, rnum, result_type, **kwargs):
         """Load generic nodal result
@@ -247,11 +395,22 @@ class DistributedResult(Result):
         data = np.zeros((n_points, nitem), np.float64)
         ncount = np.zeros(n_points, np.int32)
 
-        c = 0  # global cell index counter
-        for result in self._results:
-            ele_ind_table, nodstr, etype, ptr_off = result._element_solution_header(rnum)
-            # we return c here since it is copied to C, not passed by reference
-            c = read_nodal_values_dist(result.filename,
+        # read groups of result files concurrently, each into its
+        # own arrays as result files share nodes
+        n_groups = min(len(self._results), self._max_workers or os.cpu_count() or 1)
+        groups = np.array_split(np.arange(len(self._results)), n_groups)
+
+        def read(group):
+            if group[0] == 0:
+                group_data, group_ncount = data, ncount
+            else:
+                group_data = np.zeros_like(data)
+                group_ncount = np.zeros_like(ncount)
+
+            for i in group:
+                result = self._results[i]
+                ele_ind_table, nodstr, etype, ptr_off = result._element_solution_header(rnum)
+                read_nodal_values_dist(result.filename,
                                        self.grid.celltypes,
                                        ele_ind_table,
                                        offset,
@@ -263,9 +422,17 @@ class DistributedResult(Result):
                                        self._mesh.etype,
                                        result_index,
                                        ptr_off,
-                                       ncount,
-                                       data,
-                                       c)
+                                       group_ncount,
+                                       group_data,
+                                       self._elem_rank_off[i])
+            return group_data, group_ncount
+
+        with ThreadPoolExecutor(n_groups) as executor:
+            outputs = executor.map(read, groups[1:])
+            read(groups[0])
+            for group_data, group_ncount in outputs:
+                data += group_data
+                ncount += group_ncount
 
         if result_type == 'ENS' and nitem != 6:
             data = data[:, :6]
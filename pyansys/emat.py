@@ -309,8 +309,13 @@ c   kygaf        global applied force matrix calculate key
 c   kygrf        global restoring force matrix calculate key
 
 """
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import os
+
 import numpy as np
 
+from pyansys import _binary_reader
 from pyansys.common import read_table, parse_header
 
 EMAT_HEADER_KEYS = ['fun02', 'nume', 'numdof', 'lenu', 'lenbac',
@@ -326,6 +331,29 @@ EMAT_HEADER_KEYS = ['fun02', 'nume', 'numdof', 'lenu', 'lenbac',
 ELEMENT_HEADER_KEYS = ['stkey', 'mkey', 'dkey', 'sskey', 'akey',
                        'nrkey', 'ikey', '_', '_', 'nmrow']
 
+# element records in the order they are written
+ELEMENT_DATA_KEYS = ['stress', 'mass', 'damping', 'stress_stiff',
+                     'applied_force', 'newton_raphson', 'imaginary_load']
+
+# element load vectors
+LOAD_VECTOR_KEYS = ELEMENT_DATA_KEYS[4:]
+
+# element records of each matrix that can be assembled
+ASSEMBLE_KEYS = {'stiffness': 'stress',
+                 'mass': 'mass',
+                 'damping': 'damping'}
+
+
+def _read_record(buf, loc, dtype):
+    """Read a record starting at byte ``loc`` of a buffer.
+
+    Returns the record and the byte position of the following record.
+    """
+    nitems = int(np.frombuffer(buf, np.int32, 1, loc)[0])
+    count = 4*nitems//np.dtype(dtype).itemsize
+    record = np.frombuffer(buf, dtype, count, loc + 8).copy()
+    return record, loc + 12 + 4*nitems
+
 
 class EmatFile(object):
     """Enables pythonic access for an ANSYS element matrix file.
@@ -335,14 +363,27 @@ class EmatFile(object):
     filename : str
         File to open.  Usually ends in .emat
 
+    cache_size : int, optional
+        Maximum size in bytes of the decoded elements kept in a least
+        recently used cache by ``read_element``.  Disabled by default.
+
     Examples
     --------
     >>> import pyansys
     >>> emat_file = pyansys.read_binary('file.emat')
+
+    Cache up to 100 MB of decoded elements
+
+    >>> emat_file = pyansys.read_binary('file.emat', cache_size=100*2**20)
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, cache_size=0):
         self._element_matrices_index_table = None
+        self._ptrs = None
+        self._file_map = None
+        self._cache = OrderedDict()
+        self._cache_nbytes = 0
+        self._cache_size = cache_size
         self._element_equivalence_table = None
         self._neqv = None
         self._nnum = None
@@ -400,9 +441,8 @@ class EmatFile(object):
             lower triangular form.
 
         """
-        with open(self.filename, 'rb') as f:
-            f.seek(4*f_index)
-            return parse_header(read_table(f), ELEMENT_HEADER_KEYS)
+        table, _ = _read_record(self._mmap, 4*f_index, np.int32)
+        return parse_header(table, ELEMENT_HEADER_KEYS)
 
     @property
     def element_matrices_index_table(self):
@@ -413,6 +453,82 @@ class EmatFile(object):
                 self._element_matrices_index_table = read_table(f)
         return self._element_matrices_index_table
 
+    @property
+    def _element_ptrs(self):
+        """64 bit pointer to each element from the low and high parts
+        of the element matrices index table"""
+        if self._ptrs is None:
+            table = self.element_matrices_index_table
+            nume = self.n_elements
+            low = table[:nume].astype(np.int64) & 0xFFFFFFFF
+            high = table[nume:2*nume].astype(np.int64)
+            self._ptrs = low + (high << 32)
+        return self._ptrs
+
+    @property
+    def _mmap(self):
+        """Persistent read only memory map of the file"""
+        if self._file_map is None:
+            self._file_map = np.memmap(self.filename, np.uint8, 'r')
+        return self._file_map
+
+    def close(self):
+        """Release the memory map of the file and clear the element
+        cache.  The file is mapped again when required."""
+        self._file_map = None
+        self._cache.clear()
+        self._cache_nbytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _decode_element(self, index):
+        """Decode the DOF index table and all records of an element"""
+        loc = int(self._element_ptrs[index])*4
+        table, loc = _read_record(self._mmap, loc, np.int32)
+        element_header = parse_header(table, ELEMENT_HEADER_KEYS)
+
+        dof_idx, loc = _read_record(self._mmap, loc, np.int32)
+        dof_idx -= 1  # adj one based indexing
+
+        element_data = {}
+        for key, header_key in zip(ELEMENT_DATA_KEYS, ELEMENT_HEADER_KEYS):
+            if element_header[header_key]:
+                element_data[key], loc = _read_record(self._mmap, loc,
+                                                      np.float64)
+        return dof_idx, element_data
+
+    def _element(self, index):
+        """Decoded element, from the cache when available"""
+        if not self._cache_size:
+            return self._decode_element(index)
+
+        if index < 0:
+            index += self.n_elements
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+
+        dof_idx, element_data = self._decode_element(index)
+        nbytes = dof_idx.nbytes + sum(arr.nbytes for arr in element_data.values())
+        if nbytes <= self._cache_size:
+            # cached arrays are shared between calls
+            dof_idx.flags.writeable = False
+            for arr in element_data.values():
+                arr.flags.writeable = False
+
+            self._cache[index] = (dof_idx, element_data)
+            self._cache_nbytes += nbytes
+            while self._cache_nbytes > self._cache_size:
+                _, (old_dof_idx, old_data) = self._cache.popitem(last=False)
+                self._cache_nbytes -= old_dof_idx.nbytes
+                self._cache_nbytes -= sum(arr.nbytes for arr in old_data.values())
+
+        return dof_idx, element_data
+
 
     # def element_matricies(self, index):
     #     """Element matrices
@@ -536,81 +652,326 @@ class EmatFile(object):
         calculated as (N-1)*NUMDOF+DOF, where N is the position number
         of the node in the nodal equivalence table and DOF is the DOF
         reference number given by ``dof_idx``.
+
+        When the element cache is enabled, the returned arrays are
+        shared with the cache and are read only.
+        """
+        dof_idx, all_data = self._element(index)
+        read = {'stress': stress,
+                'mass': mass,
+                'damping': damping,
+                'stress_stiff': stress_stiff,
+                'applied_force': applied_force,
+                'newton_raphson': newton_raphson,
+                'imaginary_load': imaginary_load}
+        element_data = {key: value for key, value in all_data.items()
+                        if read[key]}
+        return dof_idx, element_data
+
+    def read_elements(self, indices=None, stress=True, mass=True,
+                      damping=True, stress_stiff=True,
+                      applied_force=True, newton_raphson=True,
+                      imaginary_load=True):
+        """Read many elements in a single pass of the file.
+
+        Parameters
+        ----------
+        indices : sequence, optional
+            Element indices to read.  These are not the element
+            numbers.  Reference the element equivalency table for the
+            actual element numbers.  Defaults to all elements.
+
+        stress : bool, optional
+            Return the stress matrix entries if available.
+
+        mass : bool, optional
+            Return the mass matrix entries if available.
+
+        damping : bool, optional
+            Return the damping matrix entries if available.
+
+        stress_stiff : bool, optional
+            Return the stress stiffening entries if available.
+
+        applied_force : bool, optional
+            Return the applied load vector if available.
+
+        newton_raphson : bool, optional
+            Return the newton raphson load entries if available.
+
+        imaginary_load : bool, optional
+            Return the imaginary load vector if available.
+
+        Returns
+        -------
+        dof_ptr : np.ndarray
+            Position of the DOF index table of each element within
+            ``dof_idx``.  The table of the ``i``th element is
+            ``dof_idx[dof_ptr[i]:dof_ptr[i + 1]]``.
+
+        dof_idx : np.ndarray
+            DOF index tables of all elements.  See ``read_element``.
+
+        element_data : dict
+            Dictionary containing a ``(ptr, values)`` tuple for each
+            of the entries of ``read_element`` that are available for
+            any of the elements.  The entries of the ``i``th element
+            are ``values[ptr[i]:ptr[i + 1]]`` and are empty when not
+            available for that element.
+
+        Notes
+        -----
+        The storage of each matrix can be identified from its number
+        of entries.  Symmetric matrices are stored as the
+        ``(nmrow)*(nmrow+1)/2`` lower triangular terms by row,
+        unsymmetric matrices as ``nmrow*nmrow`` terms, and diagonal
+        matrices as ``nmrow`` terms.
+
+        Examples
+        --------
+        Read the stiffness matrices of the first 10 elements
+
+        >>> dof_ptr, dof_idx, element_data = emat.read_elements(range(10),
+        ...                                                     mass=False)
+        >>> ptr, values = element_data['stress']
         """
+        ptrs = self._element_ptrs
+        if indices is not None:
+            ptrs = ptrs[np.asarray(indices, np.int64).ravel()]
+
+        read = [stress, mass, damping, stress_stiff, applied_force,
+                newton_raphson, imaginary_load]
+        keys = np.array(read, np.int32)
+        dof_ptr, dof_idx, data_ptr, data = \
+            _binary_reader.read_element_matrices(self.filename, ptrs, keys)
+
         element_data = {}
-        with open(self.filename, 'rb') as fobj:
-            # seek to the position of the element table in the file
-            fobj.seek(self.element_matrices_index_table[index]*4)
-
-            # matrix header
-            element_header = parse_header(read_table(fobj), ELEMENT_HEADER_KEYS)
-            nmrow = abs(element_header['nmrow'])
-            lower_tri = element_header['nmrow'] < 0
-            if lower_tri:
-                nread = nmrow*(nmrow + 1)//2
-            else:
-                nread = nmrow*nmrow
-
-            # Read DOF index table. This record specifies the DOF locations
-            # of this element matrix in relation to the global
-            # matrix. The index is calculated as (N-1)*NUMDOF+DOF,
-            # where N is the position number of the node in the nodal
-            # equivalence table and DOF is the DOF reference number
-            # given above
-            dof_idx = read_table(fobj) - 1  # adj one based indexing
-
-            # read stress matrix
-            if element_header['stkey']:  # if entry even exists
-                if stress:
-                    stress_entries = read_table(fobj, 'd', nread)
-                    element_data['stress'] = stress_entries
-                else:  # skip
-                    fobj.seek(nread*8 + 12, 1)
-
-            # read mass matrix
-            if element_header['mkey']:  # if entry even exists
-                if mass:
-                    mass_entries = read_table(fobj, 'd', nread)
-                    element_data['mass'] = mass_entries
-                else:  # skip
-                    fobj.seek(nread*8 + 12, 1)
-
-            if element_header['dkey']:
-                if damping:
-                    damping_entries = read_table(fobj, 'd', nread)
-                    element_data['damping'] = damping_entries
-                else:  # skip
-                    fobj.seek(nread*8 + 12, 1)
-
-            if element_header['sskey']:
-                if stress_stiff:
-                    stress_stiff_entries = read_table(fobj, 'd', nread)
-                    element_data['stress_stiff'] = stress_stiff_entries
-                else:  # skip
-                    fobj.seek(nread*8 + 12, 1)
-
-            if element_header['akey']:
-                if applied_force:
-                    applied_force_vector = read_table(fobj, 'd', nmrow)
-                    element_data['applied_force'] = applied_force_vector
-                else:  # skip
-                    fobj.seek(nmrow*8 + 12, 1)
-
-            if element_header['nrkey']:
-                if newton_raphson:
-                    newton_raphson_vector = read_table(fobj, 'd', nmrow)
-                    element_data['newton_raphson'] = newton_raphson_vector
-                else:  # skip
-                    fobj.seek(nmrow*8 + 12, 1)
-
-            if element_header['ikey']:
-                if imaginary_load:
-                    imaginary_load_vector = read_table(fobj, 'd', nmrow)
-                    element_data['imaginary_load'] = imaginary_load_vector
-                else:  # skip
-                    fobj.seek(nmrow*8 + 12, 1)
+        for i, key in enumerate(ELEMENT_DATA_KEYS):
+            if data[i] is not None and data[i].size:
+                element_data[key] = (data_ptr[i], data[i])
 
-        return dof_idx, element_data
+        return dof_ptr, dof_idx, element_data
+
+    def iter_elements(self, indices=None, types=None, chunk_size=4096):
+        """Iterate over elements in the order they are stored in the
+        file.
+
+        Parameters
+        ----------
+        indices : sequence, optional
+            Element indices to read.  These are not the element
+            numbers.  Defaults to all elements.
+
+        types : sequence, optional
+            Entries of ``read_element`` to read.  Any of
+            ``'stress'``, ``'mass'``, ``'damping'``,
+            ``'stress_stiff'``, ``'applied_force'``,
+            ``'newton_raphson'``, and ``'imaginary_load'``.  Defaults
+            to all entries.
+
+        chunk_size : int, optional
+            Number of elements read at once.
+
+        Yields
+        ------
+        index : int
+            Element index.
+
+        dof_idx : np.ndarray
+            DOF index table of the element.  See ``read_element``.
+
+        element_data : dict
+            Dictionary of the available entries of the element
+            matching ``types``.  See ``read_element``.
+
+        Examples
+        --------
+        >>> for index, dof_idx, element_data in emat.iter_elements(types=['mass']):
+        ...     mass = element_data['mass']
+
+        Notes
+        -----
+        Elements are sorted by their position within the file and
+        read in chunks using the bulk reader, so the file is read
+        sequentially regardless of the order of ``indices``.
+
+        Cached elements are taken from the element cache, though
+        elements read by the iterator are not added to it so that a
+        pass over the file does not evict the elements in use.
+        """
+        if types is None:
+            types = ELEMENT_DATA_KEYS
+        elif isinstance(types, str):
+            types = [types]
+        for key in types:
+            if key not in ELEMENT_DATA_KEYS:
+                raise ValueError('Invalid element data type "%s".  Must be one '
+                                 'of:\n%s' % (key, str(ELEMENT_DATA_KEYS)))
+        read = {key: key in types for key in ELEMENT_DATA_KEYS}
+
+        ptrs = self._element_ptrs
+        if indices is None:
+            indices = np.arange(self.n_elements)
+        else:
+            indices = np.arange(self.n_elements)[np.asarray(indices, np.int64).ravel()]
+        indices = indices[np.argsort(ptrs[indices], kind='stable')]
+
+        for start in range(0, indices.size, chunk_size):
+            chunk = indices[start:start + chunk_size].tolist()
+            cached = {index: self._cache[index] for index in chunk
+                      if index in self._cache}
+            missing = [index for index in chunk if index not in cached]
+            dof_ptr, dof_idx, element_data = self.read_elements(missing, **read)
+
+            j = 0
+            for index in chunk:
+                if index in cached:
+                    elem_dof_idx, all_data = cached[index]
+                    yield index, elem_dof_idx, {key: value for key, value
+                                                in all_data.items()
+                                                if read[key]}
+                    continue
+
+                elem_data = {}
+                for key, (ptr, values) in element_data.items():
+                    if ptr[j + 1] > ptr[j]:
+                        elem_data[key] = values[ptr[j]:ptr[j + 1]]
+                yield index, dof_idx[dof_ptr[j]:dof_ptr[j + 1]], elem_data
+                j += 1
+
+    def _dof_index(self, sort=False):
+        """Global DOF reference and the output row and column of each
+        DOF index of the element DOF index tables"""
+        n_dof = self.n_dof
+        dof_ref = np.empty((self.n_nodes*n_dof, 2), np.int32)
+        dof_ref[:, 0] = np.repeat(self.neqv, n_dof)
+        dof_ref[:, 1] = np.tile(np.arange(n_dof), self.n_nodes)
+        if not sort:
+            return dof_ref, np.arange(dof_ref.shape[0], dtype=np.int32)
+
+        node_index = np.empty(self.n_nodes, np.int32)
+        node_index[np.argsort(self.neqv, kind='stable')] = np.arange(self.n_nodes)
+        index = node_index.reshape(-1, 1)*n_dof + np.arange(n_dof)
+        index = index.ravel().astype(np.int32)
+        sorted_dof_ref = np.empty_like(dof_ref)
+        sorted_dof_ref[index] = dof_ref
+        return sorted_dof_ref, index
+
+    def assemble(self, matrix='stiffness', sparse_format='csc', sort=False,
+                 max_workers=None):
+        """Assemble a global matrix from the element matrices.
+
+        Parameters
+        ----------
+        matrix : str, optional
+            Matrix to assemble.  One of ``'stiffness'``, ``'mass'``,
+            or ``'damping'``.
+
+        sparse_format : str, optional
+            Output sparse format.  Either ``'csc'`` or ``'csr'``.
+
+        sort : bool, optional
+            Sort the rows and columns by node number and DOF.  By
+            default, rows and columns are ordered by the nodal
+            equivalence table ``neqv``, which matches the unsorted
+            output of ``FullFile.load_km``.
+
+        max_workers : int, optional
+            Maximum number of threads used to accumulate the element
+            matrices.  Each thread accumulates a range of columns of
+            the global matrix.  Defaults to the number of processors.
+
+        Returns
+        -------
+        dof_ref : (n x 2) np.int32 array
+            Node number and DOF index of each row and column of the
+            matrix.  In a 3 DOF analysis the dof integers will
+            correspond to:
+            0 - x
+            1 - y
+            2 - z
+
+        matrix : scipy.sparse.csc_matrix or scipy.sparse.csr_matrix
+            Upper triangle of the global matrix.
+
+        Examples
+        --------
+        >>> import pyansys
+        >>> emat = pyansys.read_binary('file.emat')
+        >>> dof_ref, k = emat.assemble('stiffness', sort=True)
+
+        Solve with the full symmetric matrix
+
+        >>> from pyansys.full import SymmetricMatrix
+        >>> k = SymmetricMatrix(k)
+
+        Notes
+        -----
+        The global matrix contains ``numdof`` rows and columns for
+        each node, including DOF not used by any element.  Unlike
+        ``FullFile.load_km``, constrained DOF are not removed as
+        constraints are not stored within the element matrix file.
+
+        The sparsity pattern of the global matrix is computed before
+        accumulating the element matrices, so each entry is summed in
+        place without sorting or summing duplicates.
+        """
+        try:
+            from scipy.sparse import csc_matrix
+        except ImportError:
+            raise ImportError('Unable to load scipy.  Install with:\n'
+                              'pip install scipy')
+
+        if matrix not in ASSEMBLE_KEYS:
+            raise ValueError('``matrix`` must be one of %s' %
+                             str(list(ASSEMBLE_KEYS)))
+        if sparse_format not in ['csc', 'csr']:
+            raise ValueError("``sparse_format`` must be either 'csc' or 'csr'")
+
+        key = ASSEMBLE_KEYS[matrix]
+        read = {item: item == key for item in ELEMENT_DATA_KEYS}
+        dof_ptr, dof_idx, element_data = self.read_elements(**read)
+        if key in element_data:
+            ptr, values = element_data[key]
+        else:
+            ptr, values = np.zeros(dof_ptr.size, np.int64), np.empty(0)
+
+        nrow = np.diff(dof_ptr)
+        unsymmetric = (np.diff(ptr) == nrow*nrow) & (nrow > 1)
+        if unsymmetric.any():
+            raise ValueError('Unable to assemble unsymmetric element matrices')
+
+        dof_ref, index = self._dof_index(sort)
+        n = dof_ref.shape[0]
+        dof_idx = index[dof_idx]
+
+        indptr, indices = _binary_reader.element_matrix_pattern(dof_ptr,
+                                                                 dof_idx, n)
+        data = np.zeros(indices.size)
+
+        # partition columns between threads by their number of entries
+        n_parts = max_workers or os.cpu_count() or 1
+        bounds = np.searchsorted(indptr, np.linspace(0, indices.size,
+                                                     n_parts + 1))
+        bounds[0], bounds[-1] = 0, n
+
+        def accumulate(i):
+            _binary_reader.accumulate_element_matrices(dof_ptr, dof_idx,
+                                                       ptr, values, indptr,
+                                                       indices, data,
+                                                       bounds[i],
+                                                       bounds[i + 1])
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            list(executor.map(accumulate, range(n_parts)))
+
+        if indptr[-1] < 2**31:
+            indptr = indptr.astype(np.int32)
+        mat = csc_matrix((data, indices, indptr), shape=(n, n), copy=False)
+        if sparse_format == 'csr':
+            mat = mat.tocsr()
+
+        return dof_ref, mat
 
     @property
     def n_dof(self):
@@ -636,27 +997,57 @@ class EmatFile(object):
             Applied force with size (n_nodes, n_dof).  Result is
             sorted to correspond with the sorted global nodes array.
         """
-        applied_force = np.zeros(self.n_nodes*self.n_dof)
-        ncount = np.zeros(self.n_nodes*self.n_dof, np.int16)
-
-        for i in range(self.n_elements):
-            dof_idx, element_data = self.read_element(i, stress=False,
-                                                       mass=False, damping=False)
-            if 'applied_force' in element_data:
-                applied_force[dof_idx] += element_data['applied_force']
-                ncount[dof_idx] += 1
-
-        # take the mean of each hit
-        mask = ncount > 0
-        applied_force[mask] /= ncount[mask]
-
-        # resort applied force to correspond to sorted nodes
-        dof_eqv = np.empty((self.n_nodes, self.n_dof), np.int32)
-        dof_eqv[:] = self.neqv.reshape(-1, 1)*3
-        dof_eqv[:, 1] += 1
-        dof_eqv[:, 2] += 2
-
-        s_idx = np.argsort(dof_eqv.ravel())
-        applied_force = applied_force[s_idx].reshape((-1, 3))
-
-        return applied_force
+        return self.global_load_vector('applied_force')
+
+    def global_load_vector(self, load='applied_force', average=True):
+        """Returns a load vector of the elements for each node.
+
+        Parameters
+        ----------
+        load : str, optional
+            Load vector.  One of ``'applied_force'``,
+            ``'newton_raphson'``, or ``'imaginary_load'``.
+
+        average : bool, optional
+            Average the load of the elements containing each DOF.
+            When ``False``, the loads are summed, giving the assembled
+            global load vector.
+
+        Returns
+        -------
+        load_vector : np.ndarray
+            Load with size (n_nodes, n_dof).  Result is sorted to
+            correspond with the sorted global nodes array.
+
+        Examples
+        --------
+        >>> restoring_force = emat.global_load_vector('newton_raphson',
+        ...                                           average=False)
+        """
+        if load not in LOAD_VECTOR_KEYS:
+            raise ValueError('``load`` must be one of %s' % str(LOAD_VECTOR_KEYS))
+
+        n = self.n_nodes*self.n_dof
+        read = {key: key == load for key in ELEMENT_DATA_KEYS}
+        dof_ptr, dof_idx, element_data = self.read_elements(**read)
+        if load in element_data:
+            ptr, values = element_data[load]
+
+            # DOF of the elements containing the load vector
+            has_load = np.diff(ptr) > 0
+            dof_idx = dof_idx[np.repeat(has_load, np.diff(dof_ptr))]
+            load_vector = np.bincount(dof_idx, weights=values, minlength=n)
+
+            # take the mean of each hit
+            if average:
+                ncount = np.bincount(dof_idx, minlength=n)
+                mask = ncount > 0
+                load_vector[mask] /= ncount[mask]
+        else:
+            load_vector = np.zeros(n)
+
+        # resort to correspond to sorted nodes
+        _, index = self._dof_index(sort=True)
+        sorted_load_vector = np.empty(n)
+        sorted_load_vector[index] = load_vector
+        return sorted_load_vector.reshape(-1, self.n_dof)
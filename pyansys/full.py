@@ -42,6 +42,192 @@ SYMBOLIC_FULL_HEADER_KEYS = [
 ]
 
 
+def _solve_window(filename, nmodes, lam, tol, cache):
+    """Solve a single shift window of a full file within a process"""
+    return FullFile(filename)._solve_window(nmodes, lam, tol, cache)
+
+
+def _write_npy_cache(path, arrays):
+    """Write arrays as ``.npy`` files within a directory.
+
+    Each file is written to a temporary file and renamed, and the
+    ``complete`` marker file is written last so concurrent readers
+    never load a partial cache.
+    """
+    os.makedirs(path, exist_ok=True)
+    complete = os.path.join(path, 'complete')
+    if os.path.isfile(complete):
+        os.remove(complete)
+
+    for name, array in arrays.items():
+        filename = os.path.join(path, name + '.npy')
+        tmp_filename = '%s.%d.tmp' % (filename, os.getpid())
+        with open(tmp_filename, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp_filename, filename)
+
+    with open(complete, 'w'):
+        pass
+
+
+def _partition(upper, nb, as_symmetric=False):
+    """Split the upper triangle of a symmetric matrix ordered as
+    boundary then interior DOF into its ``'bb'``, ``'bi'``, and
+    ``'ii'`` blocks"""
+    if upper is None:
+        return None
+
+    blocks = {'bb': upper[:nb, :nb],
+              'bi': upper[:nb, nb:],
+              'ii': upper[nb:, nb:]}
+    if as_symmetric:
+        blocks['bb'] = SymmetricMatrix(blocks['bb'])
+        blocks['ii'] = SymmetricMatrix(blocks['ii'])
+    return blocks
+
+
+class SymmetricMatrix():
+    """Symmetric sparse matrix stored as its upper triangle.
+
+    Products are computed from the upper triangle alone, requiring
+    half of the memory and memory bandwidth of the full matrix.
+
+    Parameters
+    ----------
+    upper : scipy.sparse.csc_matrix
+        Upper triangle of the matrix including the diagonal.
+
+    Examples
+    --------
+    >>> import pyansys
+    >>> full = pyansys.read_binary('file.full')
+    >>> dof_ref, k, m = full.load_km(sort=True, as_symmetric=True)
+
+    Solve for a displacement of the free DOF.  The rows and columns
+    of constrained DOF are zero and are excluded when solving.
+
+    >>> import numpy as np
+    >>> free = k.diagonal() != 0
+    >>> x = np.zeros(k.shape[0])
+    >>> x[free] = np.random.random(free.sum())
+    >>> f = k @ x
+    >>> np.allclose(k.solve(f), x)
+    True
+    """
+
+    def __init__(self, upper):
+        """Wrap the upper triangle of a symmetric matrix"""
+        self._upper = upper
+        self._diag = upper.diagonal()
+        self._solve = None
+        self._free = None
+
+    @property
+    def upper(self):
+        """Upper triangle of the matrix including the diagonal"""
+        return self._upper
+
+    @property
+    def shape(self):
+        """Shape of the matrix"""
+        return self._upper.shape
+
+    @property
+    def dtype(self):
+        """Data type of the matrix"""
+        return self._upper.dtype
+
+    @property
+    def nnz(self):
+        """Number of entries stored in the upper triangle"""
+        return self._upper.nnz
+
+    def diagonal(self):
+        """Diagonal of the matrix"""
+        return self._diag
+
+    def dot(self, other):
+        """Product of this matrix with a vector or dense matrix.
+
+        Parameters
+        ----------
+        other : np.ndarray
+            ``(n, )`` vector or ``(n, m)`` array.
+
+        Returns
+        -------
+        product : np.ndarray
+            Product with the same shape as ``other``.
+        """
+        other = np.asarray(other)
+        # the transpose of a csc matrix is a csr matrix sharing its data
+        product = self._upper @ other + self._upper.T @ other
+        if other.ndim == 1:
+            product -= self._diag*other
+        else:
+            product -= self._diag.reshape(-1, 1)*other
+        return product
+
+    def __matmul__(self, other):
+        return self.dot(other)
+
+    def tocsc(self):
+        """Full matrix as a ``scipy.sparse.csc_matrix``"""
+        from scipy.sparse import triu
+        return (self._upper + triu(self._upper, 1).T).tocsc()
+
+    def toarray(self):
+        """Full matrix as a dense array"""
+        upper = self._upper.toarray()
+        return upper + np.triu(upper, 1).T
+
+    def aslinearoperator(self):
+        """Matrix as a ``scipy.sparse.linalg.LinearOperator``"""
+        from scipy.sparse.linalg import LinearOperator
+        return LinearOperator(self.shape, matvec=self.dot, matmat=self.dot,
+                              rmatvec=self.dot, dtype=self.dtype)
+
+    def solve(self, rhs):
+        """Solve ``A x = rhs``.
+
+        The matrix is factorized on the first call and the
+        factorization is reused by later calls.
+
+        DOF with a zero diagonal, such as the constrained DOF of a
+        matrix from ``FullFile.load_km``, are excluded from the
+        system.  Their right hand side is ignored and their solution
+        is zero.
+
+        Parameters
+        ----------
+        rhs : np.ndarray
+            ``(n, )`` vector or ``(n, m)`` array.
+
+        Returns
+        -------
+        x : np.ndarray
+            Solution with the same shape as ``rhs``.
+        """
+        if self._solve is None:
+            from scipy.sparse.linalg import factorized
+            self._free = np.nonzero(self._diag)[0]
+            upper = self._upper.tocsc()[self._free][:, self._free]
+            self._solve = factorized(SymmetricMatrix(upper).tocsc())
+
+        rhs = np.asarray(rhs)
+        x = np.zeros(rhs.shape, np.result_type(self.dtype, rhs.dtype))
+        if rhs.ndim == 1:
+            x[self._free] = self._solve(rhs[self._free])
+        else:
+            for i in range(rhs.shape[1]):
+                x[self._free, i] = self._solve(rhs[self._free, i])
+        return x
+
+    def __repr__(self):
+        return '<%dx%d symmetric matrix with %d stored upper triangle ' \
+               'elements>' % (self.shape + (self.nnz,))
+
+
 class FullFile(AnsysBinary):
     """Stores the results of an ANSYS full file.
 
@@ -75,12 +261,8 @@ class FullFile(AnsysBinary):
 
         """
         self._const = None
-        self._krow = None
-        self._kcol = None
-        self._kdata = None
-        self._mrow = None
-        self._mcol = None
-        self._mdata = None
+        self._free_km = None
+        self._factorizations = {}
         self._k = None
         self._m = None
         self._dof_ref = None
@@ -171,7 +353,8 @@ class FullFile(AnsysBinary):
             self._load_km()
         return self._const
 
-    def load_km(self, as_sparse=True, sort=False):
+    def load_km(self, as_sparse=True, sort=False, as_symmetric=False,
+                cache=False, dofs=None, nodes=None, partition=False):
         """Load and construct mass and stiffness matrices from an
         ANSYS full file.
 
@@ -186,6 +369,40 @@ class FullFile(AnsysBinary):
             correspond to to the sorted rows and columns in dor_ref.
             Also sorts dor_ref.
 
+        as_symmetric : bool, optional
+            Return the mass and stiffness matrices as
+            ``SymmetricMatrix`` objects, which store only the upper
+            triangle while computing products and solutions of the
+            full symmetric matrix.  Requires ``as_sparse=True``.
+
+        cache : bool, optional
+            Store the decoded matrices, ``dof_ref``, and ``const`` as
+            ``.npy`` files within a ``.km_cache`` directory alongside
+            the full file, and memory map them when the cache is newer
+            than the full file.  Other processes loading the same
+            matrices share their pages through the operating system.
+            Requires ``as_sparse=True``.
+
+        dofs : np.ndarray, optional
+            ``(n x 2)`` array of the node number and DOF index of
+            each selected degree of freedom, matching the rows of
+            ``dof_ref``.  Only the rows and columns of selected DOF
+            are decoded.  An empty array selects no DOF.
+
+        nodes : sequence, optional
+            Select all degrees of freedom of these node numbers.
+            Combined with ``dofs`` when both are given.
+
+        partition : bool, optional
+            Partition the matrices into the selected (boundary) DOF
+            ``b`` and the remaining (interior) DOF ``i``.  ``dof_ref``
+            is returned as a ``(dof_ref_b, dof_ref_i)`` tuple and each
+            matrix as a dictionary of the ``'bb'``, ``'bi'``, and
+            ``'ii'`` blocks.  ``'bb'`` and ``'ii'`` contain the upper
+            triangle of the symmetric diagonal blocks, and ``'bi'``
+            the complete off diagonal block.  Requires ``dofs`` or
+            ``nodes``.
+
         Returns
         -------
         dof_ref : (n x 2) np.int32 array
@@ -198,11 +415,11 @@ class FullFile(AnsysBinary):
             Sort these values by node number and DOF by enabling the
             sort parameter.
 
-        k : (n x n) np.float or scipy.csc array
-            Stiffness array
+        k : (n x n) np.float, scipy.csc array, or SymmetricMatrix
+            Upper triangle of the stiffness array.
 
-        m : (n x n) np.float or scipy.csc array
-            Mass array
+        m : (n x n) np.float, scipy.csc array, or SymmetricMatrix
+            Upper triangle of the mass array.
 
         Examples
         --------
@@ -218,6 +435,14 @@ class FullFile(AnsysBinary):
         (343, 344)    -6590544.8717950
         (344, 344)    20426014.9572689
 
+        Extract the boundary and interior blocks of the stiffness and
+        mass matrices for a Craig-Bampton reduction
+
+        >>> dof_ref, k, m = full.load_km(sort=True, nodes=interface_nodes,
+        ...                              partition=True)
+        >>> dof_ref_b, dof_ref_i = dof_ref
+        >>> k_bb, k_bi, k_ii = k['bb'], k['bi'], k['ii']
+
         Notes
         -----
         Constrained entries are removed from the mass and stiffness
@@ -229,24 +454,165 @@ class FullFile(AnsysBinary):
         if not os.path.isfile(self.filename):
             raise Exception('%s not found' % self.filename)
 
+        if as_symmetric and not as_sparse:
+            raise ValueError('``as_symmetric`` requires ``as_sparse=True``')
+
+        subset = dofs is not None or nodes is not None
+        if partition and not subset:
+            raise ValueError('``partition`` requires ``dofs`` or ``nodes``')
+
+        if cache:
+            if not as_sparse:
+                raise ValueError('``cache`` requires ``as_sparse=True``')
+            if subset:
+                raise ValueError('``cache`` does not support ``dofs`` or '
+                                 '``nodes``')
+            dof_ref, k, m = self._load_km_cache(sort)
+            if as_symmetric:
+                if k is not None:
+                    k = SymmetricMatrix(k)
+                if m is not None:
+                    m = SymmetricMatrix(m)
+            return dof_ref, k, m
+
         if as_sparse:
             try:
-                from scipy.sparse import csc_matrix, coo_matrix
+                from scipy.sparse import csc_matrix
             except ImportError:
                 raise ImportError('Unable to load scipy, use ``load_km`` with '
                                   '``as_sparse=False``')
 
-        # number of terms in stiffness matrix
-        ntermK = two_ints_to_long(self._header['ntermKl'], self._header['ntermKh'])
+        # DOF information
+        neqv, ndof, const = self._read_dof_tables()
+        self.ndof = ndof
 
-        ptrSTF = self._header['ptrSTF']  # Location of stiffness matrix
-        ptrMAS = self._header['ptrMAS']  # Location in file to mass matrix
+        # sort nodal equivalence
+        dof_ref, index, nref, dref = _binary_reader.sort_nodal_eqlv(self.neqn,
+                                                                    neqv, ndof)
 
-        # number of terms in mass matrix
-        ntermM = two_ints_to_long(self._header['ntermMl'], self._header['ntermMh'])
-        ptrDOF = self._header['ptrDOF']  # pointer to DOF info
+        # store constrained dof information
+        unsort_dof_ref = np.vstack((nref, dref)).T
+        self._const = unsort_dof_ref[const < 0]
 
-        # DOF information
+        # make sorting the same as ANSYS rdfull would output
+        if not sort:
+            dof_ref = unsort_dof_ref
+            index = np.arange(self.neqn, dtype=np.int32)
+
+        # output row and column of each equation
+        if subset:
+            # equations in output order
+            order = np.empty(self.neqn, np.int32)
+            order[index] = np.arange(self.neqn)
+            selected = self._select_dofs(unsort_dof_ref, dofs, nodes)[order]
+            eq_b = order[selected]
+            eq_i = order[~selected]
+
+            index = np.full(self.neqn, -1, np.int32)
+            index[eq_b] = np.arange(eq_b.size)
+            if partition:
+                index[eq_i] = np.arange(eq_b.size, self.neqn)
+                dof_ref = (unsort_dof_ref[eq_b], unsort_dof_ref[eq_i])
+                nout = self.neqn
+            else:
+                dof_ref = unsort_dof_ref[eq_b]
+                nout = eq_b.size
+        else:
+            nout = self.neqn
+
+        # remove constrained entries
+        index[const < 0] = -1
+
+        k = self._read_matrix('K', index, nout, as_sparse)
+        m = self._read_matrix('M', index, nout, as_sparse)
+        if partition:
+            nb = dof_ref[0].shape[0]
+            k = _partition(k, nb, as_symmetric)
+            m = _partition(m, nb, as_symmetric)
+        elif as_symmetric:
+            if k is not None:
+                k = SymmetricMatrix(k)
+            if m is not None:
+                m = SymmetricMatrix(m)
+        return dof_ref, k, m
+
+    @staticmethod
+    def _select_dofs(dof_ref, dofs=None, nodes=None):
+        """Mask of the rows of ``dof_ref`` matching ``dofs`` or ``nodes``.
+
+        An empty ``dofs``, such as the constrained DOF of a full file
+        without constraints, selects no rows.
+        """
+        selected = np.zeros(dof_ref.shape[0], np.bool_)
+        if nodes is not None:
+            nodes = np.asarray(nodes).ravel()
+            missing = ~np.isin(nodes, dof_ref[:, 0])
+            if missing.any():
+                raise ValueError('Nodes %s are not in the full file' %
+                                 str(nodes[missing]))
+            selected |= np.isin(dof_ref[:, 0], nodes)
+
+        if dofs is not None and np.size(dofs):
+            dofs = np.asarray(dofs).reshape(-1, 2)
+            ndof = max(dof_ref[:, 1].max(), dofs[:, 1].max()) + 1
+            keys = dof_ref[:, 0].astype(np.int64)*ndof + dof_ref[:, 1]
+            dof_keys = dofs[:, 0].astype(np.int64)*ndof + dofs[:, 1]
+            missing = ~np.isin(dof_keys, keys)
+            if missing.any():
+                raise ValueError('DOF %s are not in the full file' %
+                                 str(dofs[missing].tolist()))
+            selected |= np.isin(keys, dof_keys)
+
+        return selected
+
+    def _km_cache_path(self, sort):
+        """Directory of the cached matrices"""
+        root = os.path.splitext(self.filename)[0]
+        return os.path.join(root + '.km_cache', 'sorted' if sort else 'unsorted')
+
+    def _load_km_cache(self, sort):
+        """Load the memory mapped matrices, writing them when the cache
+        is missing or older than the full file"""
+        path = self._km_cache_path(sort)
+        complete = os.path.join(path, 'complete')
+        if not os.path.isfile(complete) or \
+           os.path.getmtime(complete) < os.path.getmtime(self.filename):
+            dof_ref, k, m = self.load_km(sort=sort)
+            arrays = {'dof_ref': dof_ref, 'const': self._const,
+                      'ndof': self.ndof}
+            for name, mat in [('k', k), ('m', m)]:
+                if mat is not None:
+                    arrays[name + '_data'] = mat.data
+                    arrays[name + '_indices'] = mat.indices
+                    arrays[name + '_indptr'] = mat.indptr
+            try:
+                _write_npy_cache(path, arrays)
+            except OSError:  # pragma: no cover
+                return dof_ref, k, m  # read only directory
+
+        from scipy.sparse import csc_matrix
+
+        def load(name):
+            return np.load(os.path.join(path, name + '.npy'), mmap_mode='r')
+
+        self._const = load('const')
+        self.ndof = load('ndof')
+        matrices = []
+        for name in ['k', 'm']:
+            if os.path.isfile(os.path.join(path, name + '_data.npy')):
+                mat = csc_matrix((load(name + '_data'),
+                                  load(name + '_indices'),
+                                  load(name + '_indptr')),
+                                 shape=(self.neqn, self.neqn), copy=False)
+                matrices.append(mat)
+            else:
+                matrices.append(None)
+
+        return (load('dof_ref'),) + tuple(matrices)
+
+    def _read_dof_tables(self):
+        """Read the nodal equivalence, number of DOF for each node, and
+        constrained DOF tables"""
         with open(self.filename, 'rb') as f:
             read_table(f, skip=True)  # standard header
             read_table(f, skip=True)  # full header
@@ -256,122 +622,71 @@ class FullFile(AnsysBinary):
             neqv = read_table(f, cython=True)
 
             # read number of degrees of freedom for each node and constant tables
-            f.seek(ptrDOF*4)
+            f.seek(self._header['ptrDOF']*4)
             ndof = read_table(f, cython=True)
             const = read_table(f, cython=True)
 
-        # degree of freedom reference and number of degress of freedom per node
-        dof_ref = [ndof, neqv]
-        self.ndof = ndof
-
-        # Read k and m blocks (see help(ReadArray) for block description)
-        if ntermK:
-            krow, kcol, kdata = _binary_reader.read_array(self.filename,
-                                                          ptrSTF,
-                                                          ntermK,
-                                                          self.neqn,
-                                                          const)
-        else:
-            warnings.warn('Missing stiffness matrix')
-            kdata = None
-
-        if ntermM:
-            mrow, mcol, mdata = _binary_reader.read_array(self.filename,
-                                                          ptrMAS,
-                                                          ntermM,
-                                                          self.neqn,
-                                                          const)
-        else:
-            warnings.warn('Missing mass matrix')
-            mdata = None
-
-        # remove constrained entries
-        if np.any(const < 0):
-            if kdata is not None:
-                remove = np.nonzero(const < 0)[0]
-                mask = ~np.logical_or(np.in1d(krow, remove), np.in1d(kcol, remove))
-                krow = krow[mask]
-                kcol = kcol[mask]
-                kdata = kdata[mask]
+        return neqv, ndof, const
 
-            if mdata is not None:
-                mask = ~np.logical_or(np.in1d(mrow, remove), np.in1d(mcol, remove))
-                mrow = mrow[mask]
-                mcol = mcol[mask]
-                mdata = mdata[mask]
+    def _read_matrix(self, matrix, index, nout, as_sparse=True):
+        """Stream the upper triangle of the stiffness or mass matrix.
 
+        Parameters
+        ----------
+        matrix : str
+            ``'K'`` for the stiffness matrix or ``'M'`` for the mass
+            matrix.
 
-        # sort nodal equivalence
-        dof_ref, index, nref, dref = _binary_reader.sort_nodal_eqlv(self.neqn,
-                                                                    neqv, ndof)
-
-        # store constrained dof information
-        unsort_dof_ref = np.vstack((nref, dref)).T
-        self._const = unsort_dof_ref[const < 0]
+        index : np.ndarray
+            Output row and column of each equation.  Equations with a
+            negative index are removed.
 
-        if sort:  # make sorting the same as ANSYS rdfull would output
-            # resort to make in upper triangle
-            krow = index[krow]
-            kcol = index[kcol]
-            krow, kcol = np.sort(np.vstack((krow, kcol)), 0)
+        nout : int
+            Number of rows and columns of the output matrix.
 
-            if mdata is not None:
-                mrow = index[mrow]
-                mcol = index[mcol]
-                mrow, mcol = np.sort(np.vstack((mrow, mcol)), 0)
+        as_sparse : bool, optional
+            Return a ``scipy.sparse.csc_matrix``.  Otherwise returns a
+            dense array.
 
+        Returns
+        -------
+        matrix : scipy.sparse.csc_matrix or np.ndarray
+            Upper triangle of the matrix, or ``None`` when the matrix
+            is missing from the full file.
+        """
+        if matrix == 'K':
+            nterm = two_ints_to_long(self._header['ntermKl'],
+                                     self._header['ntermKh'])
+            ptr = self._header['ptrSTF']
         else:
-            dof_ref = unsort_dof_ref
+            nterm = two_ints_to_long(self._header['ntermMl'],
+                                     self._header['ntermMh'])
+            ptr = self._header['ptrMAS']
+
+        if not nterm:
+            name = 'stiffness' if matrix == 'K' else 'mass'
+            warnings.warn('Missing %s matrix' % name)
+            return None
+
+        indptr, indices, data = _binary_reader.read_full_matrix(self.filename,
+                                                                ptr,
+                                                                self.neqn,
+                                                                nout,
+                                                                index)
+        if indptr[-1] < 2**31:
+            indptr = indptr.astype(np.int32)
 
-        # store data for later reference
-        if kdata is not None:
-            self._krow = krow
-            self._kcol = kcol
-            self._kdata = kdata
-        if mdata is not None:
-            self._mrow = mrow
-            self._mcol = mcol
-            self._mdata = mdata
-
-        # output as a sparse matrix
         if as_sparse:
+            from scipy.sparse import csc_matrix
+            mat = csc_matrix((data, indices, indptr), shape=(nout, nout),
+                             copy=False)
+            mat.sum_duplicates()
+            return mat
 
-            if kdata is not None:
-                k = coo_matrix((self.neqn,) * 2)
-                k.data = kdata  # data has to be set first
-                k.row = krow
-                k.col = kcol
-
-                # convert to csc matrix (generally faster for sparse solvers)
-                k = csc_matrix(k)
-            else:
-                k = None
-
-            if mdata is not None:
-                m = coo_matrix((self.neqn,) * 2)
-                m.data = mdata
-                m.row = mrow
-                m.col = mcol
-
-                # convert to csc matrix (generally faster for sparse solvers)
-                m = csc_matrix(m)
-            else:
-                m = None
-
-        else:
-            if kdata is not None:
-                k = np.zeros((self.neqn,) * 2)
-                k[krow, kcol] = kdata
-            else:
-                k = None
-
-            if mdata is not None:
-                m = np.zeros((self.neqn,) * 2)
-                m[mrow, mcol] = mdata
-            else:
-                m = None
-
-        return dof_ref, k, m
+        cols = np.repeat(np.arange(nout), np.diff(indptr))
+        mat = np.zeros((nout, nout))
+        mat[indices, cols] = data
+        return mat
 
     @property
     def neqn(self):
@@ -395,6 +710,152 @@ class FullFile(AnsysBinary):
         """
         return self.read_record(self._header['ptrRHS'])[:self.neqn]
 
+    def modal_solve(self, nmodes=10, sigma=0, tol=0, n_processes=None,
+                    cache=False, filename=None):
+        """Solve for the natural frequencies and mode shapes of the
+        mass and stiffness matrices.
+
+        Modes are found with shift-invert Lanczos iteration about
+        each shift frequency.  The sparse factorization of each shift
+        is cached and reused by later calls.  Constrained degrees of
+        freedom are removed before solving.
+
+        Parameters
+        ----------
+        nmodes : int, optional
+            Number of modes to solve for near each shift frequency.
+
+        sigma : float or sequence, optional
+            Shift frequency in Hz.  When a sequence of frequencies is
+            given, the spectrum is split into windows about each
+            frequency, and each window after the first is solved in a
+            separate process.  Each mode is reported by the window
+            with the closest shift frequency.
+
+        tol : float, optional
+            Relative accuracy of the eigenvalues.  Defaults to machine
+            precision.
+
+        n_processes : int, optional
+            Maximum number of processes used to solve multiple shift
+            windows.  Defaults to the number of processors.
+
+        cache : bool, optional
+            Memory map the matrices from the cache of ``load_km``
+            within each process.  See ``FullFile.load_km``.
+
+        filename : str, optional
+            Write the mode shapes to a memory mapped ``.npy`` file
+            rather than to memory.
+
+        Returns
+        -------
+        freq : np.ndarray
+            Sorted natural frequencies in Hz.
+
+        modes : np.ndarray
+            ``(nmodes, neqn)`` mass normalized mode shapes.  Columns
+            correspond to the rows of ``dof_ref`` and constrained DOF
+            are zero.
+
+        Examples
+        --------
+        Solve for the first 20 modes
+
+        >>> import pyansys
+        >>> full = pyansys.read_binary('file.full')
+        >>> freq, modes = full.modal_solve(20)
+
+        Solve for modes near 1000 and 5000 Hz in parallel
+
+        >>> freq, modes = full.modal_solve(10, sigma=[1000, 5000])
+
+        Plot the fourth mode shape
+
+        >>> disp = modes[3].reshape(-1, 3)
+        """
+        try:
+            from scipy.sparse import linalg
+        except ImportError:
+            raise ImportError('``modal_solve`` requires scipy')
+
+        sigmas = np.atleast_1d(np.asarray(sigma, np.float64))
+        lams = (2*np.pi*sigmas)**2
+
+        # solve the first window here, reusing cached factorizations
+        free = self._free_matrices(cache)[0]
+        windows = [None]*lams.size
+        if lams.size > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(n_processes) as executor:
+                futures = [executor.submit(_solve_window, self.filename, nmodes,
+                                           lam, tol, cache)
+                           for lam in lams[1:]]
+                windows[0] = self._solve_window(nmodes, lams[0], tol, cache)
+                for i, future in enumerate(futures):
+                    windows[i + 1] = future.result()
+        else:
+            windows[0] = self._solve_window(nmodes, lams[0], tol, cache)
+
+        # keep modes from the window with the closest shift
+        eigvals, vectors = [], []
+        for i, (w, v) in enumerate(windows):
+            freq = np.sqrt(np.abs(w))/(2*np.pi)
+            closest = np.abs(freq.reshape(-1, 1) - sigmas).argmin(1)
+            eigvals.append(w[closest == i])
+            vectors.append(v[:, closest == i])
+        eigvals = np.hstack(eigvals)
+        vectors = np.hstack(vectors)
+        order = np.argsort(eigvals)
+
+        shape = (order.size, self.neqn)
+        if filename is None:
+            modes = np.zeros(shape)
+        else:
+            modes = np.lib.format.open_memmap(filename, 'w+', np.float64,
+                                              shape)
+            modes[:] = 0
+        for i, j in enumerate(order):
+            modes[i, free] = vectors[:, j]
+
+        if isinstance(modes, np.memmap):
+            modes.flush()
+
+        freq = np.sqrt(np.abs(eigvals[order]))/(2*np.pi)
+        return freq, modes
+
+    def _free_matrices(self, cache=False):
+        """Sorted DOF index and full symmetric stiffness and mass
+        matrices of the unconstrained DOF"""
+        if self._free_km is None:
+            from scipy.sparse import triu
+            dof_ref, k, m = self.load_km(sort=True, cache=cache)
+            if k is None or m is None:
+                raise RuntimeError('Modal solution requires both the stiffness '
+                                   'and mass matrices')
+
+            constrained = self._select_dofs(dof_ref, dofs=self.const)
+            free = np.nonzero(~constrained)[0]
+            k = k[free][:, free]
+            m = m[free][:, free]
+            k = (k + triu(k, 1).T).tocsc()
+            m = (m + triu(m, 1).T).tocsc()
+            self._free_km = free, k, m
+        return self._free_km
+
+    def _solve_window(self, nmodes, lam, tol=0, cache=False):
+        """Solve for the eigenvalues and vectors nearest ``lam``"""
+        from scipy.sparse.linalg import eigsh, splu, LinearOperator
+        _, k, m = self._free_matrices(cache)
+
+        if lam not in self._factorizations:
+            self._factorizations[lam] = splu((k - lam*m).tocsc())
+        lu = self._factorizations[lam]
+        opinv = LinearOperator(k.shape, matvec=lu.solve, dtype=k.dtype)
+
+        nmodes = min(nmodes, k.shape[0] - 1)
+        return eigsh(k, k=nmodes, M=m, sigma=lam, OPinv=opinv, tol=tol)
+
     def _load_km(self):
         """Loads the matrices with sorted DOF"""
         self._dof_ref, self._k, self._m = self.load_km(sort=True)
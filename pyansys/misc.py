@@ -76,6 +76,52 @@ def vtk_cell_info(grid):
     return cells, offset
 
 
+def tile_cells(grid, copies):
+    """Legacy cell arrays of copies of a grid with stacked points.
+
+    The points of copy ``k`` are assumed to follow the points of the
+    prior copies, so the point ids of copy ``k`` are offset by
+    ``k*grid.n_points``.
+
+    Parameters
+    ----------
+    grid : pyvista.UnstructuredGrid
+        Grid to copy.
+
+    copies : sequence
+        Index of each copy.
+
+    Returns
+    -------
+    cells : np.ndarray
+        ``(len(copies), ncells_legacy)`` legacy cell array of each
+        copy containing the number of points of each cell followed by
+        its point ids.
+
+    offset : np.ndarray
+        ``(len(copies), ncells)`` legacy offset of each cell within
+        the flattened ``cells`` of all the copies.
+
+    is_pt : np.ndarray
+        Mask of the point ids within the legacy cell array of a
+        single copy.
+    """
+    cells = grid.cells
+    if VTK9:
+        count_ind = grid.offset[:-1] + np.arange(grid.n_cells)
+    else:
+        count_ind = grid.offset
+    is_pt = np.ones(cells.size, np.bool_)
+    is_pt[count_ind] = False
+
+    copies = np.asarray(copies).reshape(-1, 1)
+    full_cells = np.empty((copies.size, cells.size), cells.dtype)
+    full_cells[:] = cells
+    full_cells[:, is_pt] += copies*grid.n_points
+    offset = count_ind + np.arange(copies.size).reshape(-1, 1)*cells.size
+    return full_cells, offset, is_pt
+
+
 def kill_process(proc_pid):
     """Kill a process with extreme prejudice"""
     import psutil  # imported here to avoid import errors when unused
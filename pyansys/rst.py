@@ -29,6 +29,7 @@ from pyansys.common import (read_table, parse_header, AnsysBinary,
                             STRAIN_TYPES, THERMAL_STRAIN_TYPES)
 from pyansys.misc import vtk_cell_info, break_apart_surface
 from pyansys.rst_avail import AvailableResults
+from pyansys.rst_path import ResultPath, ResultSection
 
 VTK9 = vtk.vtkVersion().GetVTKMajorVersion() >= 9
 
@@ -174,52 +175,77 @@ class Result(AnsysBinary):
         resultheader['eeqv'] = self.read_record(resultheader['ptrELM'])
 
         # Read table of pointers to locations of results
-        nsets = resultheader['nsets']
+        resultheader['rpointers'] = np.empty(0, np.int64)
+        resultheader['time_values'] = np.empty(0)
+        resultheader['ls_table'] = np.empty((0, 3), np.int32)
+        if resultheader['ptrCYC']:
+            resultheader['hindex_raw'] = np.empty(0, np.int32)
+        self._read_set_tables(resultheader, resultheader['nsets'])
+
+        return resultheader
+
+    def _read_set_tables(self, resultheader, nsets):
+        """Append the result set tables of any new result sets.
+
+        Only the entries of the data set index, time, harmonic index,
+        and load step tables from the previously read result sets up
+        to ``nsets`` are read from the result file.
+
+        Parameters
+        ----------
+        resultheader : dict
+            Result header to update.
+
+        nsets : int
+            Number of result sets within the result file.
+        """
+        start = resultheader['rpointers'].size
+        if nsets <= start:
+            return
 
         # Data sets index table. This record contains the record pointers
         # for the beginning of each data set. The first resmax records are
         # the first 32 bits of the index, the second resmax records are
         # the second 32 bits f.seek((ptrDSIl + 0) * 4)
-        record = self.read_record(resultheader['ptrDSI'])
-        raw0 = record[:resultheader['resmax']].tobytes()
-        raw1 = record[resultheader['resmax']:].tobytes()
-
-        # this combines the two ints, not that efficient
-        subraw0 = [raw0[i*4:(i+1)*4] for i in range(nsets)]
-        subraw1 = [raw1[i*4:(i+1)*4] for i in range(nsets)]
-        longraw = [subraw0[i] + subraw1[i] for i in range(nsets)]
-        longraw = b''.join(longraw)
-        rpointers = np.frombuffer(longraw, 'i8')
+        resmax = resultheader['resmax']
+        ptr = resultheader['ptrDSI']
+        raw = np.empty((nsets - start, 2), np.int32)
+        raw[:, 0] = self._read_record_slice(ptr, start, nsets)
+        raw[:, 1] = self._read_record_slice(ptr, resmax + start, resmax + nsets)
+        rpointers = raw.view(np.int64).ravel()
 
         assert (rpointers >= 0).all(), 'Data set index table has negative pointers'
-        resultheader['rpointers'] = rpointers
+        resultheader['rpointers'] = np.hstack((resultheader['rpointers'],
+                                               rpointers))
 
         # read in time values
-        record = self.read_record(resultheader['ptrTIM'])
-        resultheader['time_values'] = record[:resultheader['nsets']]
+        record = self._read_record_slice(resultheader['ptrTIM'], start, nsets)
+        resultheader['time_values'] = np.hstack((resultheader['time_values'],
+                                                 record))
 
         # load harmonic index of each result
         if resultheader['ptrCYC']:
-            record = self.read_record(resultheader['ptrCYC'])
-            hindex = record[:resultheader['nsets']]
+            record = self._read_record_slice(resultheader['ptrCYC'], start, nsets)
+            resultheader['hindex_raw'] = np.hstack((resultheader['hindex_raw'],
+                                                    record))
+            hindex = resultheader['hindex_raw'].copy()
 
             # ansys 15 doesn't track negative harmonic indices
             if not np.any(hindex < -1):
                 # check if duplicate frequencies
                 tvalues = resultheader['time_values']
-                for i in range(tvalues.size - 1):
-                    # adjust tolarance(?)
-                    if np.isclose(tvalues[i], tvalues[i + 1]):  
-                        hindex[i + 1] *= -1
+                # adjust tolarance(?)
+                hindex[1:][np.isclose(tvalues[:-1], tvalues[1:])] *= -1
 
             resultheader['hindex'] = hindex
 
         # load step table with columns:
         # [loadstep, substep, and cumulative]
-        record = self.read_record(resultheader['ptrLSP'])
-        resultheader['ls_table'] = record[:resultheader['nsets']*3].reshape(-1, 3)
-
-        return resultheader
+        record = self._read_record_slice(resultheader['ptrLSP'],
+                                         start*3, nsets*3)
+        ls_table = record.reshape(-1, 3)
+        resultheader['ls_table'] = np.vstack((resultheader['ls_table'],
+                                              ls_table))
 
     def parse_coordinate_system(self):
         """Reads in coordinate system information from a binary result
@@ -736,6 +762,82 @@ class Result(AnsysBinary):
     def time_values(self):
         return self._resultheader['time_values']
 
+    def refresh(self):
+        """Read any result sets appended since the result was loaded.
+
+        Intended for monitoring a result file while it is being
+        written by a running solve.  Only the new entries of the
+        result set tables are parsed and the mesh is not reloaded.
+
+        Returns
+        -------
+        rnums : list
+            Cumulative indices of the new result sets.
+
+        Examples
+        --------
+        >>> import pyansys
+        >>> rst = pyansys.read_binary('file.rst')
+        >>> rst.nsets
+        4
+        >>> rst.refresh()  # two new sets written by the solver
+        [4, 5]
+        """
+        header = parse_header(self.read_record(103), result_header_keys)
+        nsets = header['nsets']
+        if nsets <= self.nsets:
+            return []
+
+        # the solver may relocate these tables when they are extended
+        for key in ['nsets', 'resmax', 'ptrDSI', 'ptrTIM', 'ptrLSP',
+                    'ptrCYC', 'AvailData']:
+            self._resultheader[key] = header[key]
+        self._available_results = AvailableResults(header['AvailData'],
+                                                   self._is_thermal)
+
+        self._read_set_tables(self._resultheader, nsets)
+        old_nsets = self.nsets
+        self.nsets = self._resultheader['rpointers'].size
+        return list(range(old_nsets, self.nsets))
+
+    def iter_new_sets(self, poll=1.0, timeout=None):
+        """Yield result sets as they are appended to the result file.
+
+        Parameters
+        ----------
+        poll : float, optional
+            Seconds between checks of the result file.
+
+        timeout : float, optional
+            Stop once no new result sets have been written for this
+            many seconds.  Defaults to waiting indefinitely.
+
+        Yields
+        ------
+        rnum : int
+            Cumulative index of each new result set.
+
+        Examples
+        --------
+        Print the maximum displacement of each set as it is solved
+
+        >>> for rnum in rst.iter_new_sets(poll=5, timeout=600):
+        ...     nnum, disp = rst.nodal_solution(rnum)
+        ...     print(rst.time_values[rnum], np.abs(disp).max())
+        """
+        tlast = time.time()
+        while True:
+            rnums = self.refresh()
+            for rnum in rnums:
+                yield rnum
+
+            if rnums:
+                tlast = time.time()
+            elif timeout is not None and time.time() - tlast > timeout:
+                return
+            else:
+                time.sleep(poll)
+
     def animate_nodal_solution(self, rnum, comp='norm',
                                node_components=None,
                                element_components=None,
@@ -1029,6 +1131,79 @@ class Result(AnsysBinary):
 
         return nnum, data
 
+    def path(self, points, n_samples=100, tolerance=None):
+        """Define a path for interpolating nodal results.
+
+        Offline equivalent of the MAPDL ``PATH``, ``PPATH``, and
+        ``PDEF`` commands.  The containing element and interpolation
+        weights of each sample are computed once, allowing any nodal
+        result of any result set to be interpolated along the path.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            ``(n, 3)`` array of the points defining the path.
+
+        n_samples : int, optional
+            Number of samples along the entire path.  Samples are
+            uniformly spaced and include the path end points.
+
+        tolerance : float, optional
+            Squared tolerance used when locating the cell containing
+            each sample.
+
+        Returns
+        -------
+        path : pyansys.rst_path.ResultPath
+            Path sampler.
+
+        Examples
+        --------
+        Interpolate the stress along a path for the first result and
+        the displacement along the same path for all result sets.
+
+        >>> import pyansys
+        >>> rst = pyansys.read_binary('file.rst')
+        >>> path = rst.path([[0.5, 0, 2.5], [0.5, 1, 2.5]], n_samples=101)
+        >>> stress = path.nodal_stress(0)
+        >>> disp_history = path.nodal_solution()
+        >>> disp_history.shape
+        (6, 101, 3)
+        """
+        return ResultPath(self, points, n_samples, tolerance)
+
+    def section_cut(self, normal='x', origin=None, tolerance=None):
+        """Define a planar section cut for interpolating nodal results.
+
+        Parameters
+        ----------
+        normal : str or sequence, optional
+            Normal of the plane.  Either ``'x'``, ``'y'``, ``'z'`` or a
+            length 3 sequence.
+
+        origin : sequence, optional
+            Point on the plane.  Defaults to the center of the mesh.
+
+        tolerance : float, optional
+            Squared tolerance used when locating the cell containing
+            each sample.
+
+        Returns
+        -------
+        section : pyansys.rst_path.ResultSection
+            Section cut sampler.  The geometry of the cut is stored as
+            ``section.surface``.
+
+        Examples
+        --------
+        >>> import pyansys
+        >>> rst = pyansys.read_binary('file.rst')
+        >>> section = rst.section_cut('z', origin=[0, 0, 2.5])
+        >>> stress = section.nodal_stress(0)
+        >>> section.surface.plot(scalars=stress[:, 0])
+        """
+        return ResultSection(self, normal, origin, tolerance)
+
     def nodal_solution(self, rnum, in_nodal_coord_sys=False):
         """Returns the DOF solution for each node in the global
         cartesian coordinate system or nodal coordinate system.
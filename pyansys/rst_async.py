@@ -0,0 +1,239 @@
+"""Asyncio interface to the result readers.
+
+Result methods are run within an executor so they do not block the
+event loop.  The element readers release the GIL, allowing results
+from many sets or files to be read concurrently within a thread pool.
+"""
+import asyncio
+from functools import partial
+
+import numpy as np
+
+from pyansys import _binary_reader
+from pyansys._rst_keys import element_index_table_info
+from pyansys.misc import vtk_cell_info
+from pyansys.rst import ELEMENT_INDEX_TABLE_KEYS
+
+
+class AsyncResult():
+    """Asyncio facade of a ``Result``.
+
+    Nodal results averaged from element results of non-cyclic and
+    non-distributed results are read in chunks of elements, and
+    cancelling the awaiting task stops reading after the current
+    chunk.
+
+    Parameters
+    ----------
+    result : pyansys.Result
+        Result to read from.
+
+    executor : concurrent.futures.Executor, optional
+        Executor used to run the readers.  Defaults to the default
+        executor of the event loop.  Process pools are not supported.
+
+    chunk_size : int, optional
+        Number of elements read between each opportunity to cancel.
+
+    Notes
+    -----
+    ``gather`` runs the methods of the wrapped ``Result`` for several
+    result sets concurrently within the executor.  Reading different
+    result sets concurrently is supported, but ``Result`` is otherwise
+    not thread-safe, so the wrapped result must not be used by other
+    threads while awaiting this class.
+
+    Examples
+    --------
+    Read the nodal stress of all result sets concurrently
+
+    >>> import asyncio
+    >>> import pyansys
+    >>> from pyansys.rst_async import AsyncResult
+    >>> rst = AsyncResult(pyansys.read_binary('file.rst'))
+    >>> async def main():
+    ...     return await rst.gather('nodal_stress', range(rst.nsets))
+    >>> stresses = asyncio.run(main())
+    """
+
+    def __init__(self, result, executor=None, chunk_size=50000):
+        """Wrap a result"""
+        self._result = result
+        self._executor = executor
+        self._chunk_size = chunk_size
+
+    @property
+    def result(self):
+        """The wrapped ``Result``"""
+        return self._result
+
+    @property
+    def nsets(self):
+        """Number of result sets"""
+        return self._result.nsets
+
+    @property
+    def time_values(self):
+        """Time or frequency values of each result set"""
+        return self._result.time_values
+
+    async def run(self, method, *args, **kwargs):
+        """Run any method of the result within the executor.
+
+        Parameters
+        ----------
+        method : str
+            Name of the ``Result`` method.
+
+        *args : arguments
+            Arguments passed to the method.
+
+        **kwargs : keyword arguments
+            Keyword arguments passed to the method.
+
+        Examples
+        --------
+        >>> enum, edata, enode = await rst.run('element_solution_data',
+        ...                                    0, 'ENG')
+        """
+        func = partial(getattr(self._result, method), *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func)
+
+    async def gather(self, method, rnums, *args, **kwargs):
+        """Concurrently evaluate a result method for many result sets.
+
+        Parameters
+        ----------
+        method : str
+            Name of the method of this class.  For example
+            ``'nodal_stress'``.
+
+        rnums : sequence
+            Result numbers to evaluate.
+
+        *args : arguments
+            Additional arguments passed to the method.
+
+        **kwargs : keyword arguments
+            Keyword arguments passed to the method.
+
+        Returns
+        -------
+        results : list
+            Output of the method for each result number.
+        """
+        func = getattr(self, method)
+        return await asyncio.gather(*[func(rnum, *args, **kwargs)
+                                      for rnum in rnums])
+
+    @property
+    def _chunked(self):
+        """Element results can be read in chunks"""
+        return not (self._result._is_distributed or self._result._is_cyclic)
+
+    async def _nodal_result(self, method, result_type, rnum, *args, **kwargs):
+        """Read a nodal result in chunks of elements when possible"""
+        if args or kwargs or not self._chunked:
+            return await self.run(method, rnum, *args, **kwargs)
+
+        rst = self._result
+        loop = asyncio.get_running_loop()
+        setup = await loop.run_in_executor(self._executor, self._setup_nodal_result,
+                                           rnum, result_type)
+        rnum, ele_ind_table, nodstr, etype, ptr_off, nitem, result_index = setup
+
+        cells, offset = vtk_cell_info(rst.grid)
+        npoints = rst.grid.n_points
+        data = np.zeros((npoints, nitem), np.float64)
+        ncount = np.zeros(npoints, np.int32)
+        for start in range(0, ele_ind_table.size, self._chunk_size):
+            stop = start + self._chunk_size
+            func = partial(_binary_reader.read_nodal_values_dist,
+                           rst.filename,
+                           rst.grid.celltypes,
+                           ele_ind_table[start:stop],
+                           offset,
+                           cells,
+                           nitem,
+                           npoints,
+                           nodstr,
+                           etype[start:stop],
+                           rst._mesh.etype,
+                           result_index,
+                           ptr_off,
+                           ncount,
+                           data,
+                           start)
+            await loop.run_in_executor(self._executor, func)
+
+        if result_type == 'ENS' and nitem != 6:
+            data = data[:, :6]
+
+        if not np.any(ncount):
+            raise ValueError('Result file contains no %s records for result %d' %
+                             (element_index_table_info[result_type], rnum))
+
+        nnum = rst.grid.point_arrays['ansys_node_num']
+        return nnum, data/ncount.reshape(-1, 1)
+
+    def _setup_nodal_result(self, rnum, result_type):
+        """Read the element solution header of a nodal result"""
+        rst = self._result
+        if not rst.available_results[result_type]:
+            raise ValueError('Result %s is not available in this result file'
+                             % result_type)
+
+        rnum = rst.parse_step_substep(rnum)
+        ele_ind_table, nodstr, etype, ptr_off = rst._element_solution_header(rnum)
+        nitem = rst._result_nitem(rnum, result_type)
+        result_index = ELEMENT_INDEX_TABLE_KEYS.index(result_type)
+        return rnum, ele_ind_table, nodstr, etype, ptr_off, nitem, result_index
+
+    async def nodal_solution(self, rnum, *args, **kwargs):
+        """See ``Result.nodal_solution``"""
+        return await self.run('nodal_solution', rnum, *args, **kwargs)
+
+    async def nodal_velocity(self, rnum, *args, **kwargs):
+        """See ``Result.nodal_velocity``"""
+        return await self.run('nodal_velocity', rnum, *args, **kwargs)
+
+    async def nodal_acceleration(self, rnum, *args, **kwargs):
+        """See ``Result.nodal_acceleration``"""
+        return await self.run('nodal_acceleration', rnum, *args, **kwargs)
+
+    async def nodal_stress(self, rnum, *args, **kwargs):
+        """See ``Result.nodal_stress``"""
+        return await self._nodal_result('nodal_stress', 'ENS', rnum,
+                                        *args, **kwargs)
+
+    async def principal_nodal_stress(self, rnum, *args, **kwargs):
+        """See ``Result.principal_nodal_stress``"""
+        if args or kwargs or not self._chunked:
+            return await self.run('principal_nodal_stress', rnum,
+                                  *args, **kwargs)
+
+        nnum, stress = await self.nodal_stress(rnum)
+        pstress, isnan = _binary_reader.compute_principal_stress(stress)
+        pstress[isnan] = np.nan
+        return nnum, pstress
+
+    async def nodal_elastic_strain(self, rnum, *args, **kwargs):
+        """See ``Result.nodal_elastic_strain``"""
+        return await self._nodal_result('nodal_elastic_strain', 'EEL', rnum,
+                                        *args, **kwargs)
+
+    async def nodal_plastic_strain(self, rnum, *args, **kwargs):
+        """See ``Result.nodal_plastic_strain``"""
+        return await self._nodal_result('nodal_plastic_strain', 'EPL', rnum,
+                                        *args, **kwargs)
+
+    async def nodal_thermal_strain(self, rnum, *args, **kwargs):
+        """See ``Result.nodal_thermal_strain``"""
+        return await self._nodal_result('nodal_thermal_strain', 'ETH', rnum,
+                                        *args, **kwargs)
+
+    async def element_stress(self, rnum, *args, **kwargs):
+        """See ``Result.element_stress``"""
+        return await self.run('element_stress', rnum, *args, **kwargs)
+
@@ -0,0 +1,369 @@
+"""Offline path and section cut interpolation of nodal results.
+
+Equivalent to the MAPDL ``PATH``, ``PPATH``, and ``PDEF`` commands,
+except that the containing element and the interpolation weights of
+each sample point are located once and reused for any nodal result
+of any result set.
+"""
+import numpy as np
+import pyvista as pv
+import vtk
+
+
+# number of points used to interpolate each linear VTK cell type
+LINEAR_NPTS = {vtk.VTK_VERTEX: 1,
+               vtk.VTK_LINE: 2,
+               vtk.VTK_TRIANGLE: 3,
+               vtk.VTK_QUAD: 4,
+               vtk.VTK_TETRA: 4,
+               vtk.VTK_PYRAMID: 5,
+               vtk.VTK_WEDGE: 6,
+               vtk.VTK_HEXAHEDRON: 8}
+
+
+class ResultSampler():
+    """Interpolates nodal results at fixed locations within a result mesh.
+
+    The containing cell and the interpolation weights of each sample
+    point are computed once on initialization.  Each evaluation is
+    then a single weighted sum over the nodes of the containing cells.
+
+    Parameters
+    ----------
+    result : pyansys.Result
+        Result containing the mesh to sample.
+
+    points : np.ndarray
+        ``(n, 3)`` array of sample locations.
+
+    tolerance : float, optional
+        Squared tolerance used when locating the cell containing each
+        point.  Defaults to ``1E-10`` times the squared length of the
+        diagonal of the mesh.
+
+    """
+
+    def __init__(self, result, points, tolerance=None):
+        """Locate the containing cell and compute weights of each point"""
+        self._result = result
+        points = np.asarray(points, np.float64)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError('``points`` must be a (n, 3) array')
+        self._points = points
+
+        grid = result.grid
+        if tolerance is None:
+            tolerance = grid.length**2*1E-10
+
+        locator = vtk.vtkStaticCellLocator()
+        locator.SetDataSet(grid)
+        locator.BuildLocator()
+
+        # linear cells of the result grid retain their midside nodes
+        max_npts = max(LINEAR_NPTS.values())
+        gencell = vtk.vtkGenericCell()
+        pcoords = [0.0, 0.0, 0.0]
+        weights = [0.0]*grid.GetMaxCellSize()
+
+        npoints = points.shape[0]
+        cell_pts = np.zeros((npoints, max_npts), np.int64)
+        cell_weights = np.zeros((npoints, max_npts))
+        cell_id = np.empty(npoints, np.int64)
+        for i in range(npoints):
+            cid = locator.FindCell(points[i], tolerance, gencell,
+                                   pcoords, weights)
+            cell_id[i] = cid
+            if cid < 0:
+                continue
+
+            npts = LINEAR_NPTS.get(gencell.GetCellType(), 0)
+            if not npts:  # unsupported cell type
+                cell_id[i] = -1
+                continue
+            for j in range(npts):
+                cell_pts[i, j] = gencell.GetPointId(j)
+                cell_weights[i, j] = weights[j]
+            cell_pts[i, npts:] = cell_pts[i, 0]
+
+        self._cell_id = cell_id
+        self._valid = cell_id >= 0
+
+        # store only the nodes referenced by the sample points
+        grid_nnum = grid.point_arrays['ansys_node_num']
+        pt_ind, inverse = np.unique(cell_pts[self._valid], return_inverse=True)
+        self._nodes = grid_nnum[pt_ind]
+        self._node_idx = np.zeros_like(cell_pts)
+        self._node_idx[self._valid] = inverse.reshape(-1, max_npts)
+        self._weights = cell_weights
+
+    @property
+    def points(self):
+        """Sample locations"""
+        return self._points
+
+    @property
+    def n_points(self):
+        """Number of sample points"""
+        return self._points.shape[0]
+
+    @property
+    def valid(self):
+        """Boolean mask of the sample points found within the mesh"""
+        return self._valid
+
+    @property
+    def nodes(self):
+        """Sorted ANSYS node numbers required to evaluate the samples"""
+        return self._nodes
+
+    def interpolate(self, nnum, data):
+        """Interpolate nodal data at each sample point.
+
+        Parameters
+        ----------
+        nnum : np.ndarray
+            Sorted node numbers of ``data``.
+
+        data : np.ndarray
+            Nodal data sized ``(nnod, )``, ``(nnod, ncomp)`` or
+            ``(nsets, nnod, ncomp)``.
+
+        Returns
+        -------
+        values : np.ndarray
+            Data interpolated at each sample point.  The node axis of
+            ``data`` is replaced with the sample axis.  Points outside
+            the mesh or bounded by nodes missing from ``nnum`` are
+            ``np.nan``.
+        """
+        data = np.asarray(data)
+        if data.ndim == 1:
+            return self.interpolate(nnum, data.reshape(-1, 1))[:, 0]
+        elif data.ndim == 2:
+            return self.interpolate(nnum, data[np.newaxis])[0]
+        elif data.ndim != 3:
+            raise ValueError('``data`` must be 1, 2, or 3 dimensional')
+
+        return self._interpolate_nodes(*self._take_nodes(nnum, data))
+
+    def _take_nodes(self, nnum, data):
+        """Extract the nodes required by the samples from ``data``.
+
+        Returns a ``(nsets, nnodes, ncomp)`` array ordered by
+        ``self._nodes`` and a mask of the nodes missing from ``nnum``.
+        """
+        ind = np.searchsorted(nnum, self._nodes)
+        ind[ind == len(nnum)] = 0
+        missing = nnum[ind] != self._nodes
+        return data[:, ind], missing
+
+    def _interpolate_nodes(self, node_data, missing):
+        """Weight the data of the nodes of each containing cell"""
+        nsets, _, ncomp = node_data.shape
+        if not self._nodes.size:  # no samples within the mesh
+            return np.full((nsets, self.n_points, ncomp), np.nan)
+
+        node_data = node_data.astype(np.float64)
+        node_data[:, missing] = np.nan
+        values = np.einsum('ij,kijl->kil', self._weights,
+                           node_data[:, self._node_idx])
+        values[:, ~self._valid] = np.nan
+        return values
+
+    def evaluate(self, method='nodal_solution', rnum=None, **kwargs):
+        """Evaluate a nodal result at each sample point.
+
+        Parameters
+        ----------
+        method : str or callable, optional
+            Name of the ``Result`` method or any function returning
+            ``(nnum, data)`` given a result number.  For example,
+            ``'nodal_solution'``, ``'nodal_stress'``, or
+            ``'principal_nodal_stress'``.
+
+        rnum : int, list, or None, optional
+            Cumulative result number with zero based indexing, or a
+            list containing (step, substep) of the requested result.
+            May also be a ``range`` or array of cumulative result
+            numbers.  Defaults to all result sets.
+
+        **kwargs : keyword arguments
+            Additional keyword arguments passed to ``method``.
+
+        Returns
+        -------
+        values : np.ndarray
+            ``(n_points, ncomp)`` array for a single result or
+            ``(nsets, n_points, ncomp)`` when evaluating several
+            result sets.
+
+        Examples
+        --------
+        Evaluate the nodal stress of the first result and the
+        displacement time history along a path
+
+        >>> path = rst.path([[0, 0, 0], [0, 0, 5]], n_samples=100)
+        >>> stress = path.evaluate('nodal_stress', 0)
+        >>> disp_history = path.evaluate('nodal_solution')
+        """
+        if isinstance(method, str):
+            method = getattr(self._result, method)
+
+        if rnum is None:
+            rnums = range(self._result.nsets)
+        elif isinstance(rnum, (range, np.ndarray)):
+            rnums = rnum
+        else:
+            rnums = None
+
+        if rnums is None:
+            nnum, data = method(rnum, **kwargs)
+            return self.interpolate(nnum, data)
+
+        # only retain the nodes required by the samples for each set
+        node_data = []
+        for i in rnums:
+            nnum, data = method(i, **kwargs)
+            if data.ndim == 1:
+                data = data.reshape(-1, 1)
+            sub_data, missing = self._take_nodes(nnum, data[np.newaxis])
+            sub_data = sub_data.astype(np.float64)
+            sub_data[:, missing] = np.nan
+            node_data.append(sub_data[0])
+
+        if not node_data:
+            raise ValueError('No result sets to evaluate')
+
+        return self._interpolate_nodes(np.stack(node_data),
+                                       np.zeros(self._nodes.size, bool))
+
+    def nodal_solution(self, rnum=None, **kwargs):
+        """Nodal DOF solution at each sample point.
+
+        See ``ResultSampler.evaluate`` and ``Result.nodal_solution``.
+        """
+        return self.evaluate('nodal_solution', rnum, **kwargs)
+
+    def nodal_stress(self, rnum=None):
+        """Nodal component stress at each sample point.
+
+        See ``ResultSampler.evaluate`` and ``Result.nodal_stress``.
+        """
+        return self.evaluate('nodal_stress', rnum)
+
+    def principal_nodal_stress(self, rnum=None):
+        """Principal nodal stress at each sample point.
+
+        Principal stresses are computed at the nodes and then
+        interpolated.  See ``ResultSampler.evaluate`` and
+        ``Result.principal_nodal_stress``.
+        """
+        return self.evaluate('principal_nodal_stress', rnum)
+
+
+class ResultPath(ResultSampler):
+    """Uniformly spaced samples along a polyline within a result mesh.
+
+    Parameters
+    ----------
+    result : pyansys.Result
+        Result containing the mesh to sample.
+
+    points : np.ndarray
+        ``(n, 3)`` array of the points defining the path.  Similar to
+        ``PPATH``.
+
+    n_samples : int, optional
+        Number of samples along the entire path, including the path
+        end points.
+
+    tolerance : float, optional
+        Squared tolerance used when locating the containing cells.
+
+    Examples
+    --------
+    >>> path = rst.path([[0.5, 0, 2.5], [0.5, 1, 2.5]], n_samples=101)
+    >>> stress = path.nodal_stress(0)
+    >>> path.distance
+    array([0.  , 0.01, 0.02, ..., 0.98, 0.99, 1.  ])
+    """
+
+    def __init__(self, result, points, n_samples=100, tolerance=None):
+        """Sample along the path and compute the interpolation weights"""
+        vertices = np.asarray(points, np.float64)
+        if vertices.ndim != 2 or vertices.shape[1] != 3 or vertices.shape[0] < 2:
+            raise ValueError('Path must be defined by at least two 3D points')
+        if n_samples < 2:
+            raise ValueError('``n_samples`` must be at least 2')
+
+        # cumulative length at each vertex
+        seg_length = np.linalg.norm(np.diff(vertices, axis=0), axis=1)
+        vert_dist = np.hstack((0, np.cumsum(seg_length)))
+        distance = np.linspace(0, vert_dist[-1], n_samples)
+        samples = np.empty((n_samples, 3))
+        for i in range(3):
+            samples[:, i] = np.interp(distance, vert_dist, vertices[:, i])
+
+        self._vertices = vertices
+        self._distance = distance
+        super().__init__(result, samples, tolerance)
+
+    @property
+    def distance(self):
+        """Distance of each sample along the path"""
+        return self._distance
+
+    @property
+    def vertices(self):
+        """Points defining the path"""
+        return self._vertices
+
+    @property
+    def line(self):
+        """Sample points as a ``pyvista.PolyData`` polyline"""
+        poly = pv.PolyData(self._points)
+        lines = np.hstack((self.n_points, np.arange(self.n_points)))
+        poly.lines = lines
+        return poly
+
+
+class ResultSection(ResultSampler):
+    """Planar section cut through a result mesh.
+
+    Sample points are the intersection of the plane with the edges
+    of the linear result grid.
+
+    Parameters
+    ----------
+    result : pyansys.Result
+        Result containing the mesh to cut.
+
+    normal : str or sequence, optional
+        Normal of the plane.  Either ``'x'``, ``'y'``, ``'z'`` or a
+        length 3 sequence.
+
+    origin : sequence, optional
+        Point on the plane.  Defaults to the center of the mesh.
+
+    tolerance : float, optional
+        Squared tolerance used when locating the containing cells.
+
+    Examples
+    --------
+    >>> section = rst.section_cut('z', origin=[0, 0, 2.5])
+    >>> stress = section.nodal_stress(0)
+    >>> section.surface.plot(scalars=stress[:, 0])
+    """
+
+    def __init__(self, result, normal='x', origin=None, tolerance=None):
+        """Cut the mesh and compute the interpolation weights"""
+        surface = result.grid.slice(normal=normal, origin=origin)
+        if not surface.n_points:
+            raise ValueError('Plane does not intersect the result mesh')
+        self._surface = pv.PolyData(surface.points, surface.faces)
+        super().__init__(result, surface.points, tolerance)
+
+    @property
+    def surface(self):
+        """Section cut as ``pyvista.PolyData``"""
+        return self._surface
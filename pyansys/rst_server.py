@@ -0,0 +1,496 @@
+"""Serve results from a single result file to many local clients.
+
+The server holds the mesh and a byte bounded cache of computed
+results.  Result arrays are written once into shared memory blocks,
+and clients on the same host map these blocks rather than reading
+and parsing the result file themselves.
+
+Requires Python 3.8 or newer for ``multiprocessing.shared_memory``.
+
+Examples
+--------
+Start a server in one process
+
+>>> import pyansys
+>>> from pyansys.rst_server import ResultServer
+>>> rst = pyansys.read_binary('file.rst')
+>>> server = ResultServer(rst, authkey=b'secret')
+>>> server.address
+'/tmp/pymp-ab12cd/listener-ef34gh'
+>>> server.serve_forever()
+
+And connect from any number of other processes
+
+>>> from pyansys.rst_server import ResultClient
+>>> client = ResultClient('/tmp/pymp-ab12cd/listener-ef34gh',
+...                       authkey=b'secret')
+>>> nnum, stress = client.nodal_stress(0)
+"""
+from collections import OrderedDict
+from concurrent.futures import Future
+from multiprocessing.connection import Listener, Client
+from threading import Thread, Lock
+import os
+import weakref
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:  # pragma: no cover
+    shared_memory = None
+
+# methods of Result that may be called by a client
+SERVED_METHODS = ['nodal_solution',
+                  'nodal_velocity',
+                  'nodal_acceleration',
+                  'nodal_stress',
+                  'principal_nodal_stress',
+                  'nodal_elastic_strain',
+                  'nodal_plastic_strain',
+                  'nodal_thermal_strain',
+                  'nodal_temperature',
+                  'element_stress',
+                  'nodal_time_history']
+
+# attributes of Result that may be requested by a client
+SERVED_ATTRIBUTES = ['nsets', 'n_results', 'time_values', 'filename',
+                     'n_sector']
+
+# shared memory blocks created by servers within this process
+_SERVER_BLOCKS = set()
+
+
+def _check_shared_memory():
+    if shared_memory is None:  # pragma: no cover
+        raise ImportError('The result server requires Python 3.8 or newer '
+                          'for ``multiprocessing.shared_memory``')
+
+
+def _release_blocks(blocks):
+    """Close and unlink shared memory blocks created by a server"""
+    for block in blocks:
+        _SERVER_BLOCKS.discard(block.name)
+        block.close()
+        block.unlink()
+
+
+class _SharedArray():
+    """Reference to an array stored in a shared memory block"""
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+class _SharedList():
+    """Reference to a list of arrays stored as one flat shared array"""
+
+    def __init__(self, flat, shapes):
+        self.flat = flat
+        self.shapes = shapes
+
+
+class ResultServer():
+    """Local server sharing the results of a single ``Result``.
+
+    Parameters
+    ----------
+    result : pyansys.Result
+        Result to serve.
+
+    address : str or tuple, optional
+        Address of the server.  Defaults to a unique unix socket on
+        POSIX systems and a ``('localhost', port)`` tuple otherwise.
+
+    authkey : bytes, optional
+        Authentication key clients must provide.  Defaults to a
+        random key, which is available as ``server.authkey``.
+
+    cache_size : int, optional
+        Maximum size in bytes of the result cache.  Least recently
+        used results are removed from shared memory once exceeded.
+        Results sent to a client are kept until the client has
+        mapped them.  Defaults to 1 GB.
+
+    Examples
+    --------
+    Serve results from a background thread
+
+    >>> from pyansys.rst_server import ResultServer
+    >>> server = ResultServer(rst)
+    >>> server.start()
+    >>> server.shutdown()
+    """
+
+    def __init__(self, result, address=None, authkey=None, cache_size=2**30):
+        """Start listening for clients"""
+        _check_shared_memory()
+        self._result = result
+        if authkey is None:
+            authkey = os.urandom(32)
+        self._authkey = authkey
+
+        if address is None and os.name != 'nt':
+            self._listener = Listener(family='AF_UNIX', authkey=authkey)
+        else:
+            if address is None:
+                address = ('localhost', 0)
+            self._listener = Listener(address, authkey=authkey)
+
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_nbytes = 0
+        self._pins = {}
+        self._pending = {}
+        self._lock = Lock()
+        self._running = False
+        self._thread = None
+
+    @property
+    def address(self):
+        """Address clients must connect to"""
+        return self._listener.address
+
+    @property
+    def authkey(self):
+        """Authentication key clients must provide"""
+        return self._authkey
+
+    @property
+    def cache_nbytes(self):
+        """Bytes of shared memory used by cached results"""
+        return self._cache_nbytes
+
+    def serve_forever(self):
+        """Accept and serve clients until ``shutdown`` is called"""
+        self._running = True
+        while self._running:
+            try:
+                conn = self._listener.accept()
+            except OSError:
+                break  # listener closed
+            except Exception:  # failed authentication
+                continue
+            if not self._running:
+                conn.close()
+                break
+            Thread(target=self._serve_client, args=(conn,), daemon=True).start()
+
+    def start(self):
+        """Serve clients from a background thread"""
+        self._thread = Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        """Stop serving clients and release all shared memory"""
+        self._running = False
+
+        # unblock accept
+        try:
+            Client(self.address, authkey=self._authkey).close()
+        except Exception:  # pragma: no cover
+            pass
+        self._listener.close()
+        if self._thread is not None:
+            self._thread.join()
+
+        with self._lock:
+            while self._cache:
+                self._evict(next(iter(self._cache)))
+            self._pins.clear()
+
+    def _serve_client(self, conn):
+        """Reply to the requests of a single client"""
+        # results sent to this client and not yet released
+        pinned = []
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    break
+
+                kind, name, args, kwargs = request
+                if kind == 'release':  # client has mapped the result
+                    if name in pinned:
+                        pinned.remove(name)
+                        self._unpin(name)
+                    continue
+
+                try:
+                    if kind == 'getattr':
+                        if name not in SERVED_ATTRIBUTES:
+                            raise AttributeError('Result attribute "%s" is not '
+                                                 'served' % name)
+                        reply = getattr(self._result, name)
+                    else:
+                        reply = self._call(name, args, kwargs)
+                        pinned.append(reply[0])
+                except Exception as exception:
+                    conn.send(('error', exception))
+                else:
+                    conn.send(('ok', reply))
+
+        # client disconnected without releasing these results
+        for key in pinned:
+            self._unpin(key)
+
+    def _call(self, name, args, kwargs):
+        """Return the cache key and shared references to the output of
+        a result method.
+
+        The result is pinned in the cache until released with
+        ``_unpin``.  Results are computed outside of the lock, and
+        concurrent requests of a result being computed wait for that
+        computation rather than repeating it.
+        """
+        if name not in SERVED_METHODS:
+            raise AttributeError('Result method "%s" is not served' % name)
+
+        key = (name, repr(args), repr(sorted(kwargs.items())))
+        while True:
+            with self._lock:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    self._pins[key] = self._pins.get(key, 0) + 1
+                    return key, self._cache[key][0]
+
+                future = self._pending.get(key)
+                if future is None:  # compute the result in this thread
+                    future = Future()
+                    self._pending[key] = future
+                    break
+
+            # wait for the computation, then pin it if still cached
+            future.result()
+
+        blocks = []
+        try:
+            output = getattr(self._result, name)(*args, **kwargs)
+            packed = self._pack(output, blocks)
+        except BaseException as exception:
+            _release_blocks(blocks)
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exception)
+            raise
+
+        nbytes = sum(block.size for block in blocks)
+        with self._lock:
+            del self._pending[key]
+            self._cache[key] = (packed, blocks, nbytes)
+            self._cache_nbytes += nbytes
+            self._pins[key] = self._pins.get(key, 0) + 1
+            self._trim()
+        future.set_result(None)
+
+        return key, packed
+
+    def _unpin(self, key):
+        """Release a result sent to a client"""
+        with self._lock:
+            if key not in self._pins:  # server shut down
+                return
+            self._pins[key] -= 1
+            if not self._pins[key]:
+                del self._pins[key]
+            self._trim()
+
+    def _trim(self):
+        """Evict least recently used results until within the cache size.
+
+        Results not yet mapped by a client and the most recent result
+        are never evicted.
+        """
+        for key in list(self._cache)[:-1]:
+            if self._cache_nbytes <= self._cache_size:
+                break
+            if key not in self._pins:
+                self._evict(key)
+
+    def _evict(self, key):
+        """Remove a result from shared memory"""
+        _, blocks, nbytes = self._cache.pop(key)
+        _release_blocks(blocks)
+        self._cache_nbytes -= nbytes
+
+    def _pack(self, obj, blocks):
+        """Replace arrays within ``obj`` with shared memory references"""
+        if isinstance(obj, np.ndarray):
+            array = np.ascontiguousarray(obj)
+            block = shared_memory.SharedMemory(create=True,
+                                               size=max(array.nbytes, 1))
+            shared = np.ndarray(array.shape, array.dtype, buffer=block.buf)
+            shared[:] = array
+            del shared
+            blocks.append(block)
+            _SERVER_BLOCKS.add(block.name)
+            return _SharedArray(block.name, array.shape, array.dtype.str)
+        elif isinstance(obj, list) and obj and \
+             all(isinstance(item, np.ndarray) for item in obj):
+            # ragged arrays like element results are stored as one block
+            shapes = [item.shape for item in obj]
+            flat = np.hstack([item.ravel() for item in obj])
+            return _SharedList(self._pack(flat, blocks), shapes)
+        elif isinstance(obj, (list, tuple)):
+            return type(obj)(self._pack(item, blocks) for item in obj)
+        return obj
+
+
+class ResultClient():
+    """Client of a ``ResultServer`` mirroring the ``Result`` API.
+
+    Arrays returned by the client are read-only views of shared
+    memory blocks written by the server.  Each block is unmapped
+    once the arrays viewing it are garbage collected.
+
+    Parameters
+    ----------
+    address : str or tuple
+        Address of the server.
+
+    authkey : bytes
+        Authentication key of the server.
+
+    Examples
+    --------
+    >>> from pyansys.rst_server import ResultClient
+    >>> client = ResultClient(server.address, authkey=server.authkey)
+    >>> nnum, disp = client.nodal_solution(0)
+    >>> enum, estress, enode = client.element_stress(0)
+    """
+
+    def __init__(self, address, authkey):
+        """Connect to the server"""
+        _check_shared_memory()
+        self._conn = Client(address, authkey=authkey)
+        self._lock = Lock()
+
+    def _request(self, kind, name, args=(), kwargs={}):
+        """Send a request and return the reply of the server"""
+        with self._lock:
+            self._conn.send((kind, name, args, kwargs))
+            status, reply = self._conn.recv()
+        if status == 'error':
+            raise reply
+        return reply
+
+    def _unpack(self, obj):
+        """Map shared memory references within ``obj`` to arrays"""
+        if isinstance(obj, _SharedArray):
+            block = shared_memory.SharedMemory(name=obj.name)
+            # the server owns the block, do not unlink it at exit
+            if obj.name not in _SERVER_BLOCKS:
+                resource_tracker.unregister(block._name, 'shared_memory')
+            array = np.ndarray(obj.shape, obj.dtype, buffer=block.buf)
+            array.flags.writeable = False
+
+            # views of the array reference it as their base
+            weakref.finalize(array, block.close)
+            return array
+        elif isinstance(obj, _SharedList):
+            flat = self._unpack(obj.flat)
+            sizes = [int(np.prod(shape)) for shape in obj.shapes]
+            offsets = np.cumsum(sizes)[:-1]
+            return [item.reshape(shape) for item, shape in
+                    zip(np.split(flat, offsets), obj.shapes)]
+        elif isinstance(obj, (list, tuple)):
+            return type(obj)(self._unpack(item) for item in obj)
+        return obj
+
+    def _call(self, name, *args, **kwargs):
+        key, packed = self._request('call', name, args, kwargs)
+        try:
+            return self._unpack(packed)
+        finally:
+            # allow the server to evict the result
+            with self._lock:
+                self._conn.send(('release', key, (), {}))
+
+    def close(self):
+        """Close the connection to the server.
+
+        Arrays previously returned by this client remain valid until
+        they are garbage collected.
+        """
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def nsets(self):
+        """Number of result sets"""
+        return self._request('getattr', 'nsets')
+
+    @property
+    def n_results(self):
+        """Number of results"""
+        return self._request('getattr', 'n_results')
+
+    @property
+    def time_values(self):
+        """Time or frequency values of each result set"""
+        return self._request('getattr', 'time_values')
+
+    @property
+    def filename(self):
+        """Filename of the result served"""
+        return self._request('getattr', 'filename')
+
+    @property
+    def n_sector(self):
+        """Number of sectors of a cyclic result"""
+        return self._request('getattr', 'n_sector')
+
+    def nodal_solution(self, rnum, in_nodal_coord_sys=False):
+        """See ``Result.nodal_solution``"""
+        return self._call('nodal_solution', rnum, in_nodal_coord_sys)
+
+    def nodal_velocity(self, rnum, in_nodal_coord_sys=False):
+        """See ``Result.nodal_velocity``"""
+        return self._call('nodal_velocity', rnum, in_nodal_coord_sys)
+
+    def nodal_acceleration(self, rnum, in_nodal_coord_sys=False):
+        """See ``Result.nodal_acceleration``"""
+        return self._call('nodal_acceleration', rnum, in_nodal_coord_sys)
+
+    def nodal_time_history(self, solution_type='NSL', in_nodal_coord_sys=False):
+        """See ``Result.nodal_time_history``"""
+        return self._call('nodal_time_history', solution_type,
+                          in_nodal_coord_sys)
+
+    def nodal_stress(self, rnum):
+        """See ``Result.nodal_stress``"""
+        return self._call('nodal_stress', rnum)
+
+    def principal_nodal_stress(self, rnum):
+        """See ``Result.principal_nodal_stress``"""
+        return self._call('principal_nodal_stress', rnum)
+
+    def nodal_elastic_strain(self, rnum):
+        """See ``Result.nodal_elastic_strain``"""
+        return self._call('nodal_elastic_strain', rnum)
+
+    def nodal_plastic_strain(self, rnum):
+        """See ``Result.nodal_plastic_strain``"""
+        return self._call('nodal_plastic_strain', rnum)
+
+    def nodal_thermal_strain(self, rnum):
+        """See ``Result.nodal_thermal_strain``"""
+        return self._call('nodal_thermal_strain', rnum)
+
+    def nodal_temperature(self, rnum):
+        """See ``Result.nodal_temperature``"""
+        return self._call('nodal_temperature', rnum)
+
+    def element_stress(self, rnum, principal=False, in_element_coord_sys=False,
+                       **kwargs):
+        """See ``Result.element_stress``"""
+        return self._call('element_stress', rnum, principal,
+                          in_element_coord_sys, **kwargs)
@@ -1,6 +1,8 @@
 """Installation file for pyansys"""
 import os
+import shutil
 import sys
+import tempfile
 from io import open as io_open
 
 from setuptools import setup, Extension
@@ -77,6 +79,40 @@ else:
     cmp_arg = ['/Ox', '-w']
 
 
+def openmp_args():
+    """Compile and link arguments enabling OpenMP.
+
+    Returns empty arguments when the compiler does not support OpenMP,
+    in which case ``prange`` loops run serially.
+    """
+    if compiler != 'unix':
+        return ['/openmp'], []
+
+    import distutils.ccompiler
+    import distutils.sysconfig
+    ccompiler = distutils.ccompiler.new_compiler(compiler=compiler)
+    distutils.sysconfig.customize_compiler(ccompiler)
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(tmpdir, 'check_openmp.c')
+        with open(source, 'w') as f:
+            f.write('#include <omp.h>\n'
+                    'int main(void){return omp_get_max_threads() < 1;}\n')
+        objects = ccompiler.compile([source], output_dir=tmpdir,
+                                    extra_postargs=['-fopenmp'])
+        ccompiler.link_executable(objects, os.path.join(tmpdir, 'check_openmp'),
+                                  extra_postargs=['-fopenmp'])
+    except Exception:
+        return [], []
+    finally:
+        shutil.rmtree(tmpdir)
+    return ['-fopenmp'], ['-fopenmp']
+
+
+omp_compile_arg, omp_link_arg = openmp_args()
+
+
 # Get version from version info
 __version__ = None
 version_file = os.path.join(
@@ -155,7 +191,8 @@ setup(
                  Extension("pyansys._binary_reader",
                            ["pyansys/cython/_binary_reader.pyx",
                             "pyansys/cython/binary_reader.cpp"],
-                           extra_compile_args=cmp_arg,
+                           extra_compile_args=cmp_arg + omp_compile_arg,
+                           extra_link_args=omp_link_arg,
                            language='c++'),
                  ],
 
@@ -158,6 +158,42 @@ def test_write_non_ansys_grid(tmpdir):
     pyansys.save_as_archive(archive_file, grid)
 
 
+@pytest.mark.parametrize('filename', [examples.hexarchivefile,
+                                      examples.sector_archive_file,
+                                      DAT_FILE,
+                                      os.path.join(testfiles_path, 'hypermesh.cdb'),
+                                      os.path.join(testfiles_path,
+                                                   'mixed_missing_midside.cdb')])
+def test_read_parallel(filename):
+    archive = pyansys.Archive(filename, parse_vtk=False)
+    archive_parallel = pyansys.Archive(filename, parse_vtk=False, max_workers=2)
+    assert np.array_equal(archive.nnum, archive_parallel.nnum)
+    assert np.array_equal(archive.nodes, archive_parallel.nodes)
+    assert np.array_equal(archive._elem, archive_parallel._elem)
+    assert np.array_equal(archive._elem_off, archive_parallel._elem_off)
+
+
+def test_read_parallel_chunks(tmpdir, all_solid_cells_archive):
+    # enough elements to split the blocks into several chunks
+    grid = all_solid_cells_archive.grid
+    copies = []
+    for i in range(300):
+        copy = grid.copy()
+        copy.points[:, 0] += 10*i
+        copies.append(copy)
+    archive_file = str(tmpdir.join('tmp.cdb'))
+    pyansys.save_as_archive(archive_file, copies[0].merge(copies[1:],
+                                                          merge_points=False))
+
+    archive = pyansys.Archive(archive_file, parse_vtk=False)
+    archive_parallel = pyansys.Archive(archive_file, parse_vtk=False,
+                                       max_workers=3)
+    assert np.array_equal(archive.nnum, archive_parallel.nnum)
+    assert np.array_equal(archive.nodes, archive_parallel.nodes)
+    assert np.array_equal(archive._elem, archive_parallel._elem)
+    assert np.array_equal(archive._elem_off, archive_parallel._elem_off)
+
+
 def test_read_complex_archive(all_solid_cells_archive):
     nblock_expected = np.array([
         [3.7826539829200E+00, 1.2788958692644E+00, -1.0220880953640E+00],
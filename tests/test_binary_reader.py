@@ -9,6 +9,7 @@ import pyvista as pv
 
 import pyansys
 from pyansys import examples
+from pyansys.rst_path import ResultSampler
 from pyansys._rst_keys import element_index_table_info
 from pyansys.misc import get_ansys_bin
 
@@ -476,3 +477,106 @@ def test_nodal_time_history(mapdl, transient_thermal):
     for i in range(mapdl.post_processing.nsets):
         mapdl.set(1, i + 1)
         assert np.allclose(data[i].ravel(), mapdl.post_processing.nodal_temperature)
+
+
+def test_path(result):
+    path = result.path([[0.5, 0, 2.5], [0.5, 1, 2.5]], n_samples=11)
+    assert path.valid.all()
+    assert np.allclose(path.distance, np.linspace(0, 1, 11))
+
+    disp = path.nodal_solution(0)
+    assert disp.shape == (11, 3)
+
+    # all result sets at once
+    disp_history = path.nodal_solution()
+    assert disp_history.shape == (result.nsets, 11, 3)
+    assert np.allclose(disp_history[0], disp)
+
+    # points outside of the mesh
+    path = result.path([[0, 0, 10], [1, 1, 10]], n_samples=3)
+    assert not path.valid.any()
+    assert np.isnan(path.nodal_solution(0)).all()
+
+
+def test_path_at_nodes(result):
+    nnum, stress = result.nodal_stress(0)
+    _, disp = result.nodal_solution(0)
+
+    # midside nodes do not contain stress
+    mask = ~np.isnan(stress[:, 0])
+    sampler = ResultSampler(result, result.grid.points[mask])
+    assert np.allclose(sampler.nodal_stress(0), stress[mask])
+    assert np.allclose(sampler.nodal_solution(0), disp[mask])
+    assert np.allclose(sampler.interpolate(nnum, disp), disp[mask])
+
+
+def test_section_cut(result):
+    section = result.section_cut('z', origin=[0, 0, 2.5])
+    assert section.valid.all()
+    assert np.allclose(section.points[:, 2], 2.5)
+
+    stress = section.nodal_stress(range(2))
+    assert stress.shape == (2, section.n_points, 6)
+    assert section.surface.n_points == section.n_points
+
+
+def test_refresh():
+    rst = pyansys.read_binary(examples.rstfile)
+    rpointers = rst._resultheader['rpointers'].copy()
+    ls_table = rst._resultheader['ls_table'].copy()
+    time_values = rst.time_values.copy()
+
+    # emulate a result file with only the first two result sets written
+    rst._resultheader['rpointers'] = rpointers[:2]
+    rst._resultheader['ls_table'] = ls_table[:2]
+    rst._resultheader['time_values'] = time_values[:2]
+    rst.nsets = 2
+
+    assert rst.refresh() == list(range(2, rpointers.size))
+    assert rst.refresh() == []
+    assert rst.nsets == rpointers.size
+    assert np.array_equal(rst._resultheader['rpointers'], rpointers)
+    assert np.array_equal(rst._resultheader['ls_table'], ls_table)
+    assert np.allclose(rst.time_values, time_values)
+    assert list(rst.iter_new_sets(poll=0.01, timeout=0.05)) == []
+
+
+def test_profile():
+    rst = pyansys.read_binary(examples.rstfile)
+    with rst.profile() as stats:
+        nnum, stress = rst.nodal_stress(0)
+        rst.nodal_stress(1)
+
+    assert stats.records > 0
+    assert stats.bytes_read > 0
+    assert stats.records == stats.compressed_records + stats.raw_records
+    assert stats.method_calls['nodal_stress'] == 2
+    assert stats.method_time['nodal_stress'] <= stats.wall_time
+    assert 'nodal_stress' in str(stats)
+
+    # instrumentation is removed after profiling
+    assert 'nodal_stress' not in vars(rst)
+    records = stats.records
+    rst.nodal_stress(0)
+    assert stats.records == records
+
+    # existing instance attributes are restored
+    def nodal_solution(*args, **kwargs):
+        return 'patched'
+    rst.nodal_solution = nodal_solution
+    with rst.profile() as stats:
+        assert rst.nodal_solution(0) == 'patched'
+    assert stats.method_calls['nodal_solution'] == 1
+    assert rst.nodal_solution is nodal_solution
+
+
+def test_profile_full():
+    full = pyansys.read_binary(examples.fullfile)
+    with full.profile() as stats:
+        full.load_km()
+
+    # the index record of each equation is read by the first pass of
+    # each matrix and the index and value records by the second pass
+    assert stats.records >= 6*full.neqn
+    assert stats.records == stats.raw_records
+    assert stats.method_calls['load_km'] == 1
@@ -1,4 +1,5 @@
 import os
+import shutil
 
 import numpy as np
 import pytest
@@ -304,6 +305,29 @@ def test_mode_table(cyclic_v182_z, result_x):
     assert isinstance(result_x.mode_table, np.ndarray)
 
 
+def test_refresh_cyclic():
+    rst = pyansys.read_binary(os.path.join(testfiles_path, 'cyc12.rst'))
+    header = rst._resultheader
+    full = {key: header[key].copy() for key in
+            ['rpointers', 'ls_table', 'time_values', 'hindex_raw', 'hindex']}
+    is_repeated_mode = rst._is_repeated_mode.copy()
+    repeated_index = rst._repeated_index.copy()
+
+    # emulate a result file with only the first result set written
+    for key, value in full.items():
+        header[key] = value[:1]
+    rst.nsets = 1
+    rst._add_repeated_modes()
+
+    assert rst.refresh() == list(range(1, full['rpointers'].size))
+    assert rst.refresh() == []
+    for key, value in full.items():
+        assert np.array_equal(header[key], value)
+    assert np.array_equal(rst.harmonic_indices, full['hindex'])
+    assert np.array_equal(rst._is_repeated_mode, is_repeated_mode)
+    assert np.array_equal(rst._repeated_index, repeated_index)
+
+
 @pytest.mark.skipif(result_z is None, reason="Requires result file")
 def test_mode_table_result_z():
     assert isinstance(result_z.mode_table, np.ndarray)
@@ -442,3 +466,266 @@ def test_nodal_thermal_strain_cyclic(result_x):
 @skip_with_no_xserver
 def test_plot_nodal_thermal_strain(result_x):
     result_x.plot_nodal_thermal_strain(0, 'X')
+
+
+@pytest.mark.parametrize('method', ['nodal_solution', 'nodal_stress',
+                                    'principal_nodal_stress',
+                                    'nodal_elastic_strain'])
+def test_full_rotor_result(result_x, method):
+    nnum, expected = getattr(result_x, method)(0, full_rotor=True)
+    nnum_lazy, lazy = result_x.full_rotor_result(0, method)
+
+    assert np.allclose(nnum_lazy, nnum)
+    assert lazy.shape == expected.shape
+    assert np.allclose(np.asarray(lazy), expected, equal_nan=True)
+    assert np.allclose(lazy[3], expected[3], equal_nan=True)
+    assert np.allclose(lazy[::2, 10:20], expected[::2, 10:20], equal_nan=True)
+    assert np.allclose(lazy[-1, 5, 1], expected[-1, 5, 1])
+    assert np.allclose(lazy[..., 0], expected[..., 0], equal_nan=True)
+    assert np.allclose(lazy.nanmax(axis=0), np.nanmax(expected, axis=0),
+                       equal_nan=True)
+    assert np.allclose(lazy.sum(axis=2), expected.sum(axis=2), equal_nan=True)
+    assert np.isclose(lazy.nanmin(), np.nanmin(expected))
+
+
+def test_full_rotor_result_modal():
+    # emulate a modal result with harmonic index 2 and a repeated mode
+    rst = pyansys.read_binary(os.path.join(testfiles_path, 'cyc12.rst'))
+    rst._resultheader['kan'] = 2
+    rst._resultheader['hindex'] = np.array([2, 2, 2])
+    result_r = {}
+
+    def get_complex_result(func, rnum, result):
+        if result.shape not in result_r:
+            result_r[result.shape] = np.random.random(result.shape)
+        return result_r[result.shape]
+
+    rst._get_complex_result = get_complex_result
+
+    phase = 0.4
+    _, disp = rst.nodal_solution(0, phase, full_rotor=True, as_complex=True)
+    _, lazy = rst.full_rotor_result(0, phase=phase, as_complex=True)
+    assert lazy.dtype == np.complex128
+    assert np.allclose(np.asarray(lazy), disp)
+
+    _, stress = rst.nodal_stress(0, phase, full_rotor=True)
+    _, lazy = rst.full_rotor_result(0, 'nodal_stress', phase=phase)
+    assert np.allclose(lazy[:, :50], stress[:, :50], equal_nan=True)
+
+    with pytest.raises(ValueError):
+        rst.full_rotor_result(0, 'nodal_stress', as_complex=True)
+
+
+def test_expand_modes(result_x, tmpdir):
+    rnums = [2, 0, 1]
+    nnum, stress = result_x.expand_modes(rnums, 'nodal_stress')
+    assert stress.shape[0] == len(rnums)
+    for i, rnum in enumerate(rnums):
+        nnum_ref, expected = result_x.nodal_stress(rnum, full_rotor=True)
+        assert np.allclose(nnum, nnum_ref)
+        assert np.allclose(stress[i], expected, equal_nan=True)
+
+    filename = str(tmpdir.join('disp.npy'))
+    nnum, disp = result_x.expand_modes(filename=filename)
+    assert isinstance(disp, np.memmap)
+    for rnum in range(result_x.nsets):
+        _, expected = result_x.nodal_solution(rnum, full_rotor=True)
+        assert np.allclose(disp[rnum], expected)
+    assert np.allclose(np.load(filename), disp)
+
+    out = np.empty((1, 1, 1, 1))
+    with pytest.raises(ValueError):
+        result_x.expand_modes([0], out=out)
+
+
+def test_expand_modes_repeated():
+    # emulate a modal result with a single repeated mode pair
+    rst = pyansys.read_binary(os.path.join(testfiles_path, 'cyc12.rst'))
+    rst._resultheader['kan'] = 2
+    rst._resultheader['hindex'] = np.array([1, 1, 3])
+    rst._is_repeated_mode = np.array([True, True, False])
+    rst._repeated_index = np.array([1, 0, -1])
+
+    phase = 0.2
+    nnum, disp = rst.expand_modes(phase=phase, as_complex=True)
+    for rnum in range(rst.nsets):
+        _, expected = rst.nodal_solution(rnum, phase, full_rotor=True,
+                                         as_complex=True)
+        assert np.allclose(disp[rnum], expected)
+
+    nnum, stress = rst.expand_modes([1, 2], 'nodal_stress', phase=phase)
+    for i, rnum in enumerate([1, 2]):
+        _, expected = rst.nodal_stress(rnum, phase, full_rotor=True)
+        assert np.allclose(stress[i], expected, equal_nan=True)
+
+
+def test_export_full_rotor(result_x, tmpdir):
+    from pyansys.cyclic_export import read_full_rotor_mesh
+    filename = str(tmpdir.join('rotor'))
+    result_x.export_full_rotor(filename, [0, 2],
+                               ['nodal_solution', 'nodal_stress'])
+
+    nnum = np.load(os.path.join(filename, 'nnum.npy'))
+    stress = np.load(os.path.join(filename, 'nodal_stress.npy'))
+    disp = np.load(os.path.join(filename, 'nodal_solution.npy'))
+    for i, rnum in enumerate([0, 2]):
+        nnum_ref, expected = result_x.nodal_stress(rnum, full_rotor=True)
+        assert np.allclose(nnum, nnum_ref)
+        assert np.allclose(stress[i], expected, equal_nan=True)
+        _, expected = result_x.nodal_solution(rnum, full_rotor=True)
+        assert np.allclose(disp[i], expected)
+
+    grid = read_full_rotor_mesh(filename)
+    assert np.allclose(grid.points, result_x.full_rotor.points)
+    assert np.array_equal(grid.cells, result_x.full_rotor.cells)
+    assert np.array_equal(grid.celltypes, result_x.full_rotor.celltypes)
+
+    with pytest.raises(ValueError):
+        result_x.export_full_rotor(str(tmpdir.join('empty')), [0], [])
+
+
+@pytest.mark.parametrize('ext, module', [('.h5', 'h5py'), ('.zarr', 'zarr')])
+def test_export_full_rotor_store(result_x, tmpdir, ext, module):
+    pytest.importorskip(module)
+    from pyansys.cyclic_export import read_full_rotor_mesh, _open_store
+    filename = str(tmpdir.join('rotor' + ext))
+    result_x.export_full_rotor(filename, [0, 2], 'nodal_solution')
+
+    store = _open_store(filename)
+    try:
+        nnum = np.asarray(store.read('nnum'))
+        disp = np.asarray(store.read('nodal_solution'))
+        rnums = np.asarray(store.read('rnums'))
+    finally:
+        store.close()
+
+    assert np.array_equal(rnums, [0, 2])
+    for i, rnum in enumerate(rnums):
+        nnum_ref, expected = result_x.nodal_solution(rnum, full_rotor=True)
+        assert np.allclose(nnum, nnum_ref)
+        assert np.allclose(disp[i], expected)
+
+    grid = read_full_rotor_mesh(filename)
+    assert np.allclose(grid.points, result_x.full_rotor.points)
+    assert np.array_equal(grid.cells, result_x.full_rotor.cells)
+
+
+@pytest.mark.parametrize('kind', [0, 1, 2])
+def test_rotate_sectors(result_x, kind):
+    from pyansys import _binary_reader
+    matrices = result_x._sector_matrices()
+    data = np.random.random((result_x.n_sector, 100, 7))
+    data[:, 0] = np.nan
+
+    expected = data.copy()
+    for i, matrix in enumerate(matrices):
+        if kind == 0:
+            sector = np.ascontiguousarray(expected[i, :, :3])
+            _binary_reader.affline_transform(sector, matrix)
+            expected[i, :, :3] = sector
+        elif kind == 1:
+            _binary_reader.tensor_arbitrary(expected[i], matrix)
+        else:
+            _binary_reader.tensor_strain_arbitrary(expected[i], matrix)
+
+    _binary_reader.rotate_sectors(data, matrices, kind)
+    assert np.allclose(data, expected, equal_nan=True)
+
+
+def test_full_rotor_grid(result_x, tmpdir):
+    rotor = result_x.full_rotor
+    master = result_x._mas_grid
+    assert rotor.n_points == master.n_points*result_x.n_sector
+    assert rotor.n_cells == master.n_cells*result_x.n_sector
+    assert np.allclose(rotor.points[:master.n_points], master.points)
+    assert np.allclose(rotor.point_arrays['sector_id'][-1], result_x.n_sector - 1)
+
+    merged = result_x.full_rotor_grid(merge=True)
+    assert merged.n_cells == rotor.n_cells
+    assert merged.n_points < rotor.n_points
+
+    # geometry of each cell is unchanged
+    npts = rotor.cells[0]
+    cells = rotor.cells.reshape(-1, npts + 1)[:, 1:]
+    merged_cells = merged.cells.reshape(-1, npts + 1)[:, 1:]
+    assert np.allclose(rotor.points[cells], merged.points[merged_cells])
+
+    # merged points map back to the master sector
+    sector = merged.point_arrays['sector_id'].astype(int)
+    ind = merged.point_arrays['sector_point_id']
+    full_ind = sector*master.n_points + ind
+    assert np.allclose(rotor.points[full_ind], merged.points)
+
+    # cache alongside the result
+    filename = str(tmpdir.join('cyc12.rst'))
+    shutil.copy(os.path.join(testfiles_path, 'cyc12.rst'), filename)
+    rst = pyansys.read_binary(filename)
+    rotor = rst.full_rotor_grid(merge=True, cache=True)
+    assert os.path.isfile(str(tmpdir.join('cyc12.rotor_merged.vtu')))
+    cached = rst.full_rotor_grid(merge=True, cache=True)
+    assert np.allclose(cached.points, rotor.points)
+    assert cached.n_cells == rotor.n_cells
+
+    # a tolerance is cached separately
+    rst.full_rotor_grid(merge=True, cache=True, tolerance=1E-3)
+    assert os.path.isfile(str(tmpdir.join('cyc12.rotor_merged_0.001.vtu')))
+
+
+def test_phase_animation():
+    from pyansys.cyclic_view import PhaseAnimation
+    field = np.random.random((100, 3)) + 1j*np.random.random((100, 3))
+    animation = PhaseAnimation(field, nangles=10, buffer_size=3)
+
+    frames = [(angle, disp.copy(), scalars.copy())
+              for angle, disp, scalars in animation.frames()]
+    assert len(frames) == animation.n_frames
+    for (angle, disp, scalars), expected_angle in zip(frames, animation.angles):
+        expected = np.real(field*np.exp(-1j*angle))
+        assert angle == expected_angle
+        assert np.allclose(disp, expected)
+        assert np.allclose(scalars, np.linalg.norm(expected, axis=1))
+
+    # looping frames stop when the generator is closed
+    animation = PhaseAnimation(field, nangles=4, comp='z')
+    generator = animation.frames(loop=True)
+    angles = [next(generator)[0] for _ in range(9)]
+    generator.close()
+    assert np.allclose(angles, np.tile(animation.angles, 3)[:9])
+
+    with pytest.raises(ValueError):
+        PhaseAnimation(field, comp='w')
+
+
+def test_sector_node_subset(result_x):
+    nnum, disp = result_x.nodal_solution(0, full_rotor=True)
+    nodes = nnum[[3, 10, 50]]
+    sub_nnum, sub_disp = result_x.nodal_solution(0, full_rotor=True,
+                                                 sectors=[1, 5], nodes=nodes)
+    assert np.allclose(sub_nnum, nodes)
+    assert np.allclose(sub_disp, disp[[1, 5]][:, [3, 10, 50]])
+
+    _, stress = result_x.nodal_stress(0, full_rotor=True)
+    _, sub_stress = result_x.nodal_stress(0, full_rotor=True, sectors=-1)
+    assert sub_stress.shape == (1,) + stress.shape[1:]
+    assert np.allclose(sub_stress[0], stress[-1], equal_nan=True)
+
+    _, pstress = result_x.principal_nodal_stress(0, full_rotor=True)
+    sub_nnum, sub_pstress = result_x.principal_nodal_stress(0, full_rotor=True,
+                                                            sectors=[2, 3],
+                                                            nodes=nodes)
+    assert np.allclose(sub_pstress, pstress[2:4][:, [3, 10, 50]],
+                       equal_nan=True)
+
+    # master sector only
+    _, sector_stress = result_x.nodal_stress(0, nodes=nodes)
+    assert np.allclose(sector_stress, stress[0, [3, 10, 50]], equal_nan=True)
+    _, sector_disp = result_x.nodal_solution(0, as_complex=True)
+    _, sub_disp = result_x.nodal_solution(0, as_complex=True, nodes=nodes)
+    assert np.allclose(sub_disp, sector_disp[[3, 10, 50]])
+
+    with pytest.raises(ValueError):
+        result_x.nodal_stress(0, sectors=[0])
+    with pytest.raises(ValueError):
+        result_x.nodal_stress(0, as_complex=True, full_rotor=True, sectors=[0])
+    with pytest.raises(ValueError):
+        result_x.nodal_solution(0, nodes=[-1])
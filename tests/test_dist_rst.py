@@ -84,6 +84,55 @@ def test_not_a_dis_rst(tmpdir):
         DistributedResult(tmp_file)
 
 
+def test_check_coverage(static_dis):
+    from pyansys.dis_result import _check_coverage
+    gl_nnum = static_dis._main_result.read_record(static_dis._resultheader['ptrGNOD'])
+    _check_coverage(gl_nnum, static_dis._results)
+    with pytest.raises(FileNotFoundError):
+        _check_coverage(gl_nnum, static_dis._results[:2])
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_max_workers(static_dis, static_rst, max_workers):
+    filename = os.path.join(testfiles_path, 'dist_rst', 'static', 'file0.rst')
+    dist_rst = DistributedResult(filename, max_workers=max_workers)
+    assert np.allclose(dist_rst.mesh.nnum, static_dis.mesh.nnum)
+    assert np.allclose(dist_rst.nodal_solution(0)[1],
+                       static_dis.nodal_solution(0)[1])
+
+    nnum, stress = static_rst.nodal_stress(0)
+    nnum_dis, stress_dis = dist_rst.nodal_stress(0)
+    assert np.allclose(nnum_dis, nnum)
+    assert np.allclose(stress_dis, stress, equal_nan=True)
+
+
+def test_global_index_cache(static_dis, tmpdir):
+    static_path = os.path.join(testfiles_path, 'dist_rst', 'static')
+    for i in range(4):
+        shutil.copy(os.path.join(static_path, 'file%d.rst' % i), str(tmpdir))
+    filename = os.path.join(str(tmpdir), 'file0.rst')
+
+    dist_rst = DistributedResult(filename, cache=True)
+    assert os.path.isfile(dist_rst._cache_filename)
+    cached_rst = DistributedResult(filename, cache=True)
+
+    # the meshes of the individual result files are read when needed
+    assert all(rst._rank_mesh is None for rst in cached_rst._results)
+    assert np.array_equal(cached_rst.mesh._elem, dist_rst.mesh._elem)
+    assert np.array_equal(cached_rst.grid.celltypes, dist_rst.grid.celltypes)
+    for rst in [dist_rst, cached_rst]:
+        assert np.allclose(rst.mesh.nnum, static_dis.mesh.nnum)
+        assert np.allclose(rst.grid.points, static_dis.grid.points)
+        assert np.allclose(rst.nodal_solution(0)[1],
+                           static_dis.nodal_solution(0)[1])
+
+    # each node maps to the global node with the same node number
+    nnum = np.hstack([rst.grid.point_arrays['ansys_node_num']
+                      for rst in cached_rst._results])
+    assert np.array_equal(cached_rst.mesh.nnum[np.hstack(cached_rst._node_map)],
+                          nnum)
+
+
 @skip_no_ansys
 def test_not_all_found(thermal_solution, mapdl, tmpdir):
     filename = os.path.join(mapdl.directory, 'file0.rth')
@@ -34,9 +34,138 @@ def test_global_applied_force(emat):
     assert np.allclose(force, 0)
 
 
+@pytest.mark.parametrize('load', ['applied_force', 'newton_raphson',
+                                  'imaginary_load'])
+def test_global_load_vector(emat, load):
+    load_vector = emat.global_load_vector(load, average=False)
+    assert load_vector.shape == (emat.n_nodes, emat.n_dof)
+    assert np.allclose(load_vector, 0)
+
+
+def test_global_load_vector_invalid(emat):
+    with pytest.raises(ValueError):
+        emat.global_load_vector('mass')
+
+
 def test_eeqv(emat):
     assert np.allclose(np.sort(emat.eeqv), emat.enum)
 
 
 def test_neqv(emat):
     assert np.allclose(np.sort(emat.neqv), emat.nnum)
+
+
+def test_read_elements(emat):
+    dof_ptr, dof_idx, element_data = emat.read_elements()
+    assert dof_ptr.size == emat.n_elements + 1
+    for i in range(emat.n_elements):
+        dof_idx_elem, data = emat.read_element(i)
+        assert np.array_equal(dof_idx[dof_ptr[i]:dof_ptr[i + 1]], dof_idx_elem)
+        for key, values in data.items():
+            ptr, all_values = element_data[key]
+            assert np.array_equal(all_values[ptr[i]:ptr[i + 1]], values)
+
+
+def test_read_elements_subset(emat):
+    indices = [5, 2, 70]
+    dof_ptr, dof_idx, element_data = emat.read_elements(indices, mass=False)
+    assert 'mass' not in element_data
+    ptr, values = element_data['stress']
+    for i, index in enumerate(indices):
+        dof_idx_elem, data = emat.read_element(index)
+        assert np.array_equal(dof_idx[dof_ptr[i]:dof_ptr[i + 1]], dof_idx_elem)
+        assert np.array_equal(values[ptr[i]:ptr[i + 1]], data['stress'])
+
+
+@pytest.mark.parametrize('sort', [False, True])
+def test_assemble(emat, sort):
+    dof_ref, k = emat.assemble('stiffness', sort=sort, max_workers=3)
+    _, m = emat.assemble('mass', sparse_format='csr', sort=sort)
+    assert k.format == 'csc'
+    assert m.format == 'csr'
+    if sort:
+        assert np.all(np.diff(dof_ref[:, 0]) >= 0)
+
+    # dense assembly of the full symmetric matrices
+    position = {tuple(ref): i for i, ref in enumerate(dof_ref)}
+    n = dof_ref.shape[0]
+    k_full = np.zeros((n, n))
+    m_full = np.zeros((n, n))
+    for i in range(emat.n_elements):
+        dof_idx, element_data = emat.read_element(i)
+        node = emat.neqv[dof_idx // emat.n_dof]
+        rows = [position[(nnum, dof)] for nnum, dof in zip(node, dof_idx % emat.n_dof)]
+        tril = np.tril_indices(dof_idx.size)
+        for key, full in [('stress', k_full), ('mass', m_full)]:
+            elem = np.zeros((dof_idx.size, dof_idx.size))
+            elem[tril] = element_data[key]
+            elem += np.tril(elem, -1).T
+            full[np.ix_(rows, rows)] += elem
+
+    assert np.allclose(k.toarray(), np.triu(k_full))
+    assert np.allclose(m.toarray(), np.triu(m_full))
+
+
+def test_assemble_invalid(emat):
+    with pytest.raises(ValueError):
+        emat.assemble('stress')
+    with pytest.raises(ValueError):
+        emat.assemble(sparse_format='coo')
+
+
+def test_element_cache():
+    # each element of the test file decodes to 29,520 bytes
+    with EmatFile(emat_filename, cache_size=100000) as emat_cached:
+        for i in range(5):
+            dof_idx, element_data = emat_cached.read_element(i)
+        assert list(emat_cached._cache) == [2, 3, 4]
+        assert emat_cached._cache_nbytes <= 100000
+        assert not element_data['stress'].flags.writeable
+
+        # cached elements are returned without decoding
+        assert emat_cached.read_element(4)[1]['stress'] is element_data['stress']
+        assert 'mass' not in emat_cached.read_element(4, mass=False)[1]
+    assert not emat_cached._cache
+
+
+@pytest.mark.parametrize('cache_size', [0, 100000])
+def test_iter_elements(cache_size):
+    emat = EmatFile(emat_filename, cache_size=cache_size)
+    emat.read_element(7)
+    indices = [10, 7, 3, -1]
+    out = list(emat.iter_elements(indices, types=['mass'], chunk_size=3))
+    assert [index for index, _, _ in out] == [3, 7, 10, 79]
+    for index, dof_idx, element_data in out:
+        dof_idx_elem, data = emat.read_element(index)
+        assert np.array_equal(dof_idx, dof_idx_elem)
+        assert list(element_data) == ['mass']
+        assert np.array_equal(element_data['mass'], data['mass'])
+
+    with pytest.raises(ValueError):
+        list(emat.iter_elements(types='stiffness'))
+
+
+def test_global_load_vector_sum(monkeypatch):
+    emat = EmatFile(emat_filename)
+    dof_ptr, dof_idx, element_data = emat.read_elements()
+
+    # load vector of one on the DOF of every other element
+    nrow = np.diff(dof_ptr)
+    has_load = np.arange(emat.n_elements) % 2 == 0
+    ptr = np.zeros(emat.n_elements + 1, np.int64)
+    ptr[1:] = np.cumsum(nrow*has_load)
+    element_data = {'applied_force': (ptr, np.ones(ptr[-1]))}
+    monkeypatch.setattr(emat, 'read_elements',
+                        lambda **kwargs: (dof_ptr, dof_idx, element_data))
+
+    expected = np.zeros(emat.n_nodes*emat.n_dof)
+    for i in np.nonzero(has_load)[0]:
+        expected[dof_idx[dof_ptr[i]:dof_ptr[i + 1]]] += 1
+    node = np.repeat(emat.neqv, emat.n_dof)
+    expected = expected[np.lexsort((np.tile(np.arange(emat.n_dof), emat.n_nodes),
+                                    node))]
+
+    load_vector = emat.global_load_vector(average=False)
+    assert np.allclose(load_vector.ravel(), expected)
+    average = emat.global_load_vector()
+    assert np.allclose(average.ravel(), expected > 0)
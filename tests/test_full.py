@@ -1,4 +1,5 @@
 import os
+import shutil
 
 import scipy
 import pytest
@@ -6,6 +7,7 @@ import numpy as np
 
 import pyansys
 from pyansys.examples import fullfile
+from pyansys.full import SymmetricMatrix
 
 test_path = os.path.dirname(os.path.abspath(__file__))
 testfiles_path = os.path.join(test_path, 'testfiles')
@@ -67,3 +69,160 @@ def test_full_load_km(sparse_full):
 
 def test_load_vector(sparse_full):
     assert not sparse_full.load_vector.any()
+
+
+def test_load_km_dense():
+    fobj = pyansys.read_binary(fullfile)
+    dof_ref, k, m = fobj.load_km(sort=True)
+    dof_ref_dense, k_dense, m_dense = fobj.load_km(as_sparse=False, sort=True)
+    assert np.allclose(dof_ref, dof_ref_dense)
+    assert np.allclose(k.toarray(), k_dense)
+    assert np.allclose(m.toarray(), m_dense)
+
+
+def test_load_km_const():
+    fobj = pyansys.read_binary(fullfile)
+    dof_ref, k, m = fobj.load_km(sort=True)
+    assert fobj.const.size
+    assert k.has_sorted_indices
+
+    # constrained DOF are removed from the upper triangle
+    const = (dof_ref[:, None] == fobj.const).all(-1).any(-1)
+    for mat in [k, m]:
+        assert not abs(mat[const]).sum()
+        assert not abs(mat[:, const]).sum()
+        assert not scipy.sparse.tril(mat, -1).nnz
+
+
+def test_load_km_symmetric():
+    fobj = pyansys.read_binary(fullfile)
+    dof_ref, k_upper, m_upper = fobj.load_km(sort=True)
+    dof_ref, k, m = fobj.load_km(sort=True, as_symmetric=True)
+    assert isinstance(k, SymmetricMatrix)
+    assert k.nnz == k_upper.nnz
+
+    k_full = k_upper + scipy.sparse.triu(k_upper, 1).T
+    assert np.allclose(k.toarray(), k_full.toarray())
+    assert np.allclose(m.tocsc().toarray(), m.toarray())
+
+    x = np.random.random(k.shape[0])
+    assert np.allclose(k @ x, k_full @ x)
+    xx = np.random.random((k.shape[0], 3))
+    assert np.allclose(k.dot(xx), k_full @ xx)
+    assert np.allclose(k.aslinearoperator().matvec(x), k_full @ x)
+
+    # constrained DOF are removed, leaving a singular matrix
+    free = np.nonzero(k.diagonal())[0]
+    k_free = SymmetricMatrix(k.upper[free][:, free])
+    rhs = np.random.random((free.size, 2))
+    assert np.allclose(k_free @ k_free.solve(rhs), rhs)
+
+    # solving the full matrix excludes the constrained DOF
+    x = np.zeros(k.shape[0])
+    x[free] = np.random.random(free.size)
+    assert np.allclose(k.solve(k @ x), x)
+    assert np.allclose(k.solve(np.column_stack([k @ x]*2)), x.reshape(-1, 1))
+
+    with pytest.raises(ValueError):
+        fobj.load_km(as_sparse=False, as_symmetric=True)
+
+
+def test_load_km_cache(tmpdir):
+    filename = str(tmpdir.join('file.full'))
+    shutil.copy(fullfile, filename)
+    fobj = pyansys.read_binary(filename)
+    dof_ref, k, m = fobj.load_km(sort=True)
+    const = fobj.const
+
+    for _ in range(2):  # write then read the cache
+        fobj = pyansys.read_binary(filename)
+        dof_ref_c, k_c, m_c = fobj.load_km(sort=True, cache=True)
+        assert np.array_equal(dof_ref_c, dof_ref)
+        assert np.array_equal(fobj.const, const)
+        assert (k_c != k).nnz == 0
+        assert (m_c != m).nnz == 0
+    assert os.path.isfile(os.path.join(fobj._km_cache_path(True), 'complete'))
+    assert isinstance(dof_ref_c, np.memmap)
+
+    dof_ref_u, k_u, _ = fobj.load_km(cache=True)
+    assert not (np.diff(dof_ref_u[:, 0]) >= 0).all()
+
+    _, k_s, _ = fobj.load_km(sort=True, cache=True, as_symmetric=True)
+    assert isinstance(k_s, SymmetricMatrix)
+
+    with pytest.raises(ValueError):
+        fobj.load_km(as_sparse=False, cache=True)
+
+
+@pytest.mark.parametrize('sort', [True, False])
+def test_load_km_partition(sort):
+    fobj = pyansys.read_binary(fullfile)
+    dof_ref, k, m = fobj.load_km(sort=sort)
+    k_full = (k + scipy.sparse.triu(k, 1).T).toarray()
+
+    nodes = np.unique(dof_ref[:, 0])[::7]
+    dofs = [dof_ref[1], dof_ref[-1]]
+    selected = np.isin(dof_ref[:, 0], nodes)
+    selected[[1, -1]] = True
+    ind_b = np.nonzero(selected)[0]
+    ind_i = np.nonzero(~selected)[0]
+
+    # subset
+    dof_ref_b, k_b, m_b = fobj.load_km(sort=sort, dofs=dofs, nodes=nodes)
+    assert np.array_equal(dof_ref_b, dof_ref[ind_b])
+    assert np.allclose(k_b.toarray(), np.triu(k_full[ind_b][:, ind_b]))
+
+    # partition
+    (dof_ref_b, dof_ref_i), k_blocks, m_blocks = fobj.load_km(sort=sort,
+                                                              dofs=dofs,
+                                                              nodes=nodes,
+                                                              partition=True)
+    assert np.array_equal(dof_ref_i, dof_ref[ind_i])
+    assert np.allclose(k_blocks['bb'].toarray(),
+                       np.triu(k_full[ind_b][:, ind_b]))
+    assert np.allclose(k_blocks['bi'].toarray(), k_full[ind_b][:, ind_i])
+    assert np.allclose(k_blocks['ii'].toarray(),
+                       np.triu(k_full[ind_i][:, ind_i]))
+
+    _, k_blocks, _ = fobj.load_km(sort=sort, nodes=nodes, partition=True,
+                                  as_symmetric=True)
+    assert isinstance(k_blocks['ii'], SymmetricMatrix)
+
+    # an empty DOF selection selects nothing
+    dof_ref_b, k_b, m_b = fobj.load_km(sort=sort, dofs=[], nodes=nodes)
+    assert np.array_equal(dof_ref_b, dof_ref[np.isin(dof_ref[:, 0], nodes)])
+    assert not fobj._select_dofs(dof_ref, dofs=np.empty((0, 2))).any()
+
+    with pytest.raises(ValueError):
+        fobj.load_km(partition=True)
+    with pytest.raises(ValueError):
+        fobj.load_km(nodes=[-1])
+    with pytest.raises(ValueError):
+        fobj.load_km(dofs=[[dof_ref[0, 0], 10]])
+
+
+def test_modal_solve(tmpdir):
+    fobj = pyansys.read_binary(fullfile)
+    freq, modes = fobj.modal_solve(6)
+    assert np.allclose(freq[[0, 2, 3]], [1283.200, 5781.975, 6919.399])
+    assert modes.shape == (6, fobj.neqn)
+
+    # mass normalized and zero at constrained DOF
+    dof_ref, k, m = fobj.load_km(sort=True, as_symmetric=True)
+    assert np.allclose(modes @ (m @ modes.T), np.eye(6), atol=1E-8)
+    assert np.allclose(np.diag(modes @ (k @ modes.T)), (2*np.pi*freq)**2)
+    const = (dof_ref[:, None] == fobj.const).all(-1).any(-1)
+    assert not modes[:, const].any()
+
+    # factorization is reused
+    assert len(fobj._factorizations) == 1
+    fobj.modal_solve(6)
+    assert len(fobj._factorizations) == 1
+
+    # multiple shift windows
+    filename = str(tmpdir.join('modes.npy'))
+    freq_win, modes_win = fobj.modal_solve(4, sigma=[0, 8000],
+                                           filename=filename)
+    assert isinstance(modes_win, np.memmap)
+    assert np.allclose(freq_win, freq)
+    assert np.allclose(np.load(filename), modes_win)
@@ -0,0 +1,51 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+import pyansys
+from pyansys import examples
+from pyansys.rst_async import AsyncResult
+
+
+@pytest.fixture(scope='module')
+def result():
+    return pyansys.read_binary(examples.rstfile)
+
+
+def test_nodal_stress(result):
+    async_rst = AsyncResult(result, chunk_size=7)
+    stresses = asyncio.run(async_rst.gather('nodal_stress', range(result.nsets)))
+    for i, (nnum, stress) in enumerate(stresses):
+        nnum_, stress_ = result.nodal_stress(i)
+        assert np.allclose(nnum, nnum_)
+        assert np.allclose(stress, stress_, equal_nan=True)
+
+
+def test_principal_nodal_stress(result):
+    async_rst = AsyncResult(result, chunk_size=7)
+    _, pstress = asyncio.run(async_rst.principal_nodal_stress(0))
+    _, pstress_ = result.principal_nodal_stress(0)
+    assert np.allclose(pstress, pstress_, equal_nan=True)
+
+
+def test_run(result):
+    async_rst = AsyncResult(result)
+    _, disp = asyncio.run(async_rst.nodal_solution(1))
+    assert np.allclose(disp, result.nodal_solution(1)[1])
+
+    with pytest.raises(ValueError):
+        asyncio.run(async_rst.nodal_stress(100))
+
+
+def test_cancel(result):
+    async_rst = AsyncResult(result, chunk_size=1)
+
+    async def cancel():
+        task = asyncio.ensure_future(async_rst.nodal_stress(0))
+        await asyncio.sleep(0)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel())
@@ -0,0 +1,138 @@
+from threading import Thread
+import time
+
+import numpy as np
+import pytest
+
+import pyansys
+from pyansys import examples
+from pyansys import rst_server
+from pyansys.rst_server import ResultServer, ResultClient
+
+skip_no_shm = pytest.mark.skipif(rst_server.shared_memory is None,
+                                 reason="Requires Python 3.8 or newer")
+
+
+@pytest.fixture(scope='module')
+def result():
+    return pyansys.read_binary(examples.rstfile)
+
+
+@pytest.fixture(scope='module')
+def server(result):
+    server = ResultServer(result)
+    server.start()
+    yield server
+    server.shutdown()
+
+
+@skip_no_shm
+def test_client(server, result):
+    with ResultClient(server.address, server.authkey) as client:
+        assert client.nsets == result.nsets
+        assert np.allclose(client.time_values, result.time_values)
+
+        nnum, disp = client.nodal_solution(0)
+        nnum_, disp_ = result.nodal_solution(0)
+        assert np.allclose(nnum, nnum_)
+        assert np.allclose(disp, disp_)
+        assert not disp.flags.writeable
+
+        _, stress = client.nodal_stress(0)
+        _, stress_ = result.nodal_stress(0)
+        assert np.allclose(stress, stress_, equal_nan=True)
+
+        enum, estress, enode = client.element_stress(0)
+        enum_, estress_, enode_ = result.element_stress(0)
+        assert np.allclose(enum, enum_)
+        for arr, arr_ in zip(estress, estress_):
+            assert np.allclose(arr, arr_)
+        for arr, arr_ in zip(enode, enode_):
+            assert np.allclose(arr, arr_)
+
+
+@skip_no_shm
+def test_client_invalid(server):
+    with ResultClient(server.address, server.authkey) as client:
+        with pytest.raises(AttributeError):
+            client._call('read_record', 103)
+
+        with pytest.raises(ValueError):
+            client.nodal_solution(100)
+
+
+@skip_no_shm
+def test_server_cache(result):
+    server = ResultServer(result, cache_size=1)
+    server.start()
+    with ResultClient(server.address, server.authkey) as client:
+        for i in range(result.nsets):
+            client.nodal_solution(i)
+        # only the latest result is retained
+        nnum, disp = client.nodal_solution(i)
+        assert server.cache_nbytes == nnum.nbytes + disp.nbytes
+    server.shutdown()
+    assert server.cache_nbytes == 0
+
+
+@skip_no_shm
+def test_server_cache_pinned(result):
+    server = ResultServer(result, cache_size=1)
+    server.start()
+    with ResultClient(server.address, server.authkey) as client, \
+         ResultClient(server.address, server.authkey) as other:
+        # a result sent but not yet mapped by a client is not evicted
+        key, packed = client._request('call', 'nodal_solution', (0,))
+        for i in range(1, result.nsets):
+            other.nodal_solution(i)
+        nnum, disp = client._unpack(packed)
+        assert np.allclose(disp, result.nodal_solution(0)[1])
+        assert other.n_sector == result.n_sector
+    server.shutdown()
+
+
+class _SlowResult():
+    """Result counting its reads while checking the server lock"""
+
+    def __init__(self):
+        self.server = None
+        self.calls = 0
+        self.locked = []
+
+    def nodal_solution(self, rnum, in_nodal_coord_sys=False):
+        self.calls += 1
+        # results are computed without holding the server lock
+        acquired = self.server._lock.acquire(blocking=False)
+        if acquired:
+            self.server._lock.release()
+        self.locked.append(not acquired)
+        time.sleep(0.5)
+        return np.arange(3), np.full((3, 3), float(rnum))
+
+
+@skip_no_shm
+def test_server_concurrent_requests():
+    result = _SlowResult()
+    server = ResultServer(result)
+    result.server = server
+    server.start()
+
+    outputs = []
+
+    def request():
+        with ResultClient(server.address, server.authkey) as client:
+            outputs.append(client.nodal_solution(1)[1].copy())
+
+    threads = [Thread(target=request) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    server.shutdown()
+
+    # duplicate requests wait for a single computation
+    assert result.calls == 1
+    assert not any(result.locked)
+    assert len(outputs) == 3
+    for disp in outputs:
+        assert np.allclose(disp, 1)